@@ -0,0 +1,13 @@
+from .dataset import Dataset, generate_dataset, populate
+from .hydration import run_hydration_benchmarks
+from .runner import ADAPTERS, OPERATIONS, run_benchmarks
+
+__all__ = [
+    "ADAPTERS",
+    "OPERATIONS",
+    "Dataset",
+    "generate_dataset",
+    "populate",
+    "run_benchmarks",
+    "run_hydration_benchmarks",
+]
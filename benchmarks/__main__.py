@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .hydration import run_hydration_benchmarks
+from .runner import ADAPTERS, DEFAULT_SIZES, OPERATIONS, run_benchmarks
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Study Planner benchmarks"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(item) for item in _csv(value)],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated session counts (default: 1000,100000,1000000)",
+    )
+    parser.add_argument(
+        "--adapters",
+        type=_csv,
+        default=list(ADAPTERS),
+        help=f"Comma-separated adapters from {', '.join(ADAPTERS)}",
+    )
+    parser.add_argument(
+        "--operations",
+        type=_csv,
+        default=list(OPERATIONS),
+        help="Comma-separated use cases to time",
+    )
+    parser.add_argument(
+        "--hydration",
+        action="store_true",
+        help="Instead, compare time and memory of building sessions from records",
+    )
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("bench_output.json"),
+        help="Where to save the JSON results",
+    )
+    return parser
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = build_parser()
+    namespace = parser.parse_args(args=args)
+    unknown = set(namespace.adapters) - set(ADAPTERS)
+    unknown |= set(namespace.operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown adapters/operations: {', '.join(sorted(unknown))}")
+
+    if namespace.hydration:
+        runs = run_hydration_benchmarks(tuple(namespace.sizes), seed=namespace.seed)
+        namespace.output.write_text(json.dumps({"hydration": runs}, indent=2), encoding="utf-8")
+        for run in runs:
+            for name, metrics in run["strategies"].items():
+                print(
+                    f"{name:<16} {run['sessions']:>9} "
+                    f"{metrics['ns_per_session']:>8.0f} ns/session "
+                    f"{metrics['bytes_per_session']:>6.0f} bytes/session"
+                )
+        return 0
+
+    results = run_benchmarks(
+        sizes=tuple(namespace.sizes),
+        adapters=tuple(namespace.adapters),
+        operations=tuple(namespace.operations),
+        iterations=namespace.iterations,
+        seed=namespace.seed,
+        progress=lambda message: print(message, file=sys.stderr),
+    )
+    namespace.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    for run in results["runs"]:
+        for name, metrics in run["operations"].items():
+            print(
+                f"{run['adapter']:<13} {run['sessions']:>9} {name:<23} "
+                f"p50={metrics['p50_ms']:.3f}ms p99={metrics['p99_ms']:.3f}ms "
+                f"reads/op={metrics['reads_per_op']:.2f} "
+                f"writes/op={metrics['writes_per_op']:.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
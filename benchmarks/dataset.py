@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from src.application import CourseRepository, SessionRepository, TopicRepository, UnitOfWork
+from src.domain import (
+    Course,
+    DurationMinutes,
+    StudySession,
+    Topic,
+    new_course_id,
+    new_session_id,
+    new_topic_id,
+)
+
+FIRST_MONDAY = date(2024, 1, 1)
+TOPICS_PER_COURSE = 8
+SESSIONS_PER_COURSE = 1_000
+MAX_COURSES = 500
+
+
+@dataclass(frozen=True)
+class Dataset:
+    courses: list[Course]
+    topics: list[Topic]
+    sessions: list[StudySession]
+    first_day: date
+    last_day: date
+
+    @property
+    def mondays(self) -> list[date]:
+        weeks = (self.last_day - self.first_day).days // 7 + 1
+        return [self.first_day + timedelta(weeks=week) for week in range(weeks)]
+
+
+def generate_dataset(session_count: int, seed: int = 0) -> Dataset:
+    """Build a realistic planner history with ``session_count`` sessions.
+
+    Courses scale with the history (one per thousand sessions, capped), each
+    with a fixed number of topics. Sessions are spread over roughly two years
+    of days; those in the first three quarters of the range are completed.
+    """
+    rng = random.Random(seed)
+    course_count = min(MAX_COURSES, max(1, session_count // SESSIONS_PER_COURSE))
+    courses = [
+        Course(course_id=new_course_id(), name=f"Course {index}")
+        for index in range(course_count)
+    ]
+    topics = [
+        Topic(topic_id=new_topic_id(), course_id=course.course_id, name=f"Topic {index}")
+        for course in courses
+        for index in range(TOPICS_PER_COURSE)
+    ]
+    span_days = 730
+    completed_before = FIRST_MONDAY + timedelta(days=span_days * 3 // 4)
+    sessions = []
+    for _ in range(session_count):
+        scheduled = FIRST_MONDAY + timedelta(days=rng.randrange(span_days))
+        completed = scheduled < completed_before
+        sessions.append(
+            StudySession(
+                session_id=new_session_id(),
+                topic_id=rng.choice(topics).topic_id,
+                scheduled_date=scheduled,
+                duration=DurationMinutes(rng.choice((15, 25, 30, 45, 60, 90))),
+                completed=completed,
+                completed_at=datetime.combine(scheduled, time(18, 0)) if completed else None,
+            )
+        )
+    return Dataset(
+        courses=courses,
+        topics=topics,
+        sessions=sessions,
+        first_day=FIRST_MONDAY,
+        last_day=FIRST_MONDAY + timedelta(days=span_days - 1),
+    )
+
+
+def populate(
+    dataset: Dataset,
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> None:
+    """Persist the dataset through the repositories in one transaction."""
+    with unit_of_work.transaction() if unit_of_work is not None else nullcontext():
+        for course in dataset.courses:
+            course_repo.add(course)
+        for topic in dataset.topics:
+            topic_repo.add(topic)
+        for session in dataset.sessions:
+            session_repo.add(session)
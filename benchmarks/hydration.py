@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable
+
+from src.adapters.json_store import _session_from_record
+from src.application import session_record
+from src.domain import DurationMinutes, SessionId, StudySession, TopicId
+
+from .dataset import generate_dataset
+
+
+@dataclass(frozen=True)
+class _DictDuration:
+    value: int
+
+    def __post_init__(self) -> None:
+        if self.value <= 0:
+            raise ValueError("duration must be positive minutes")
+
+
+@dataclass(frozen=True)
+class _DictSession:
+    """The session model as it was before slots: a validated, dict-backed dataclass."""
+
+    session_id: str
+    topic_id: str
+    scheduled_date: date
+    duration: _DictDuration
+    completed: bool = False
+    completed_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if self.completed and self.completed_at is None:
+            raise ValueError("completed sessions must have completed_at")
+        if not self.completed and self.completed_at is not None:
+            raise ValueError("completed_at requires completed=True")
+
+
+def _dict_backed(item: dict) -> object:
+    return _DictSession(
+        session_id=item["session_id"],
+        topic_id=item["topic_id"],
+        scheduled_date=date.fromisoformat(item["scheduled_date"]),
+        duration=_DictDuration(item["duration_minutes"]),
+        completed=item["completed"],
+        completed_at=datetime.fromisoformat(item["completed_at"])
+        if item["completed_at"]
+        else None,
+    )
+
+
+def _validated(item: dict) -> object:
+    return StudySession(
+        session_id=SessionId(item["session_id"]),
+        topic_id=TopicId(item["topic_id"]),
+        scheduled_date=date.fromisoformat(item["scheduled_date"]),
+        duration=DurationMinutes(item["duration_minutes"]),
+        completed=item["completed"],
+        completed_at=datetime.fromisoformat(item["completed_at"])
+        if item["completed_at"]
+        else None,
+    )
+
+
+# How a repository could turn a stored record into a session.
+STRATEGIES: dict[str, Callable[[dict], object]] = {
+    "dict_dataclass": _dict_backed,
+    "slots_validated": _validated,
+    "slots_hydrated": _session_from_record,
+}
+
+
+def _measure(build: Callable[[dict], object], records: list[dict]) -> dict[str, float]:
+    gc.collect()
+    started = time.perf_counter()
+    sessions = [build(record) for record in records]
+    seconds = time.perf_counter() - started
+    del sessions
+    gc.collect()
+    tracemalloc.start()
+    try:
+        sessions = [build(record) for record in records]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del sessions
+    return {
+        "seconds": seconds,
+        "ns_per_session": seconds * 1e9 / len(records),
+        "retained_bytes": retained,
+        "bytes_per_session": retained / len(records),
+    }
+
+
+def run_hydration_benchmarks(sizes: tuple[int, ...], seed: int = 0) -> list[dict]:
+    """Time and size building ``n`` sessions from stored records, per strategy."""
+    runs = []
+    for size in sizes:
+        records = [session_record(session) for session in generate_dataset(size, seed).sessions]
+        runs.append(
+            {
+                "sessions": size,
+                "strategies": {
+                    name: _measure(build, records) for name, build in STRATEGIES.items()
+                },
+            }
+        )
+    return runs
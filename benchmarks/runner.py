@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+from src.adapters import (
+    ColumnarSessionRepository,
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+    JsonCourseRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    JsonTopicRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteCourseRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+    SqliteTopicRepository,
+    StoreStats,
+)
+from src.application import (
+    AddTopicRequest,
+    CompleteSessionRequest,
+    CourseRepository,
+    CreateCourseRequest,
+    ListSessionsRequest,
+    PlanSessionRequest,
+    RangeReportRequest,
+    SessionRepository,
+    TopicRepository,
+    UnitOfWork,
+    WeeklyReportRequest,
+    add_topic,
+    complete_session,
+    create_course,
+    generate_completion_report,
+    generate_weekly_report,
+    list_courses,
+    list_session_records,
+    list_sessions,
+    list_topics,
+    plan_session,
+)
+
+from .dataset import Dataset, generate_dataset, populate
+
+ADAPTERS = ("memory", "json", "json-journal", "json-sharded", "sqlite")
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+
+@dataclass
+class Backend:
+    course_repo: CourseRepository
+    topic_repo: TopicRepository
+    session_repo: SessionRepository
+    unit_of_work: UnitOfWork | None
+    stats: StoreStats
+    close: Callable[[], None]
+
+
+def open_backend(adapter: str, directory: Path) -> Backend:
+    if adapter == "memory":
+        return Backend(
+            InMemoryCourseRepository(),
+            InMemoryTopicRepository(),
+            InMemorySessionRepository(),
+            None,
+            StoreStats(),
+            lambda: None,
+        )
+    if adapter in ("json", "json-journal"):
+        json_store = JsonFileStore(
+            directory / "store.json", journal=adapter == "json-journal"
+        )
+        return Backend(
+            JsonCourseRepository(json_store),
+            JsonTopicRepository(json_store),
+            JsonSessionRepository(json_store),
+            json_store,
+            json_store.stats,
+            json_store.close,
+        )
+    if adapter == "json-sharded":
+        sharded_store = ShardedJsonStore(directory / "store", shard_by="month")
+        return Backend(
+            JsonCourseRepository(sharded_store.catalog),
+            JsonTopicRepository(sharded_store.catalog),
+            ShardedSessionRepository(sharded_store),
+            sharded_store,
+            sharded_store.stats,
+            sharded_store.close,
+        )
+    if adapter == "sqlite":
+        sqlite_store = SqliteStore(directory / "store.db")
+        return Backend(
+            SqliteCourseRepository(sqlite_store),
+            SqliteTopicRepository(sqlite_store),
+            SqliteSessionRepository(sqlite_store),
+            sqlite_store,
+            sqlite_store.stats,
+            sqlite_store.close,
+        )
+    raise ValueError(f"unknown adapter: {adapter}")
+
+
+Operation = Callable[[Backend, Dataset, random.Random], object]
+
+
+def _plan_session(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return plan_session(
+        PlanSessionRequest(
+            topic_id=rng.choice(dataset.topics).topic_id,
+            scheduled_date=rng.choice(dataset.mondays),
+            duration_minutes=30,
+        ),
+        backend.topic_repo,
+        backend.session_repo,
+        backend.unit_of_work,
+    )
+
+
+def _complete_session(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return complete_session(
+        CompleteSessionRequest(
+            session_id=rng.choice(dataset.sessions).session_id,
+            completed_at=datetime(2026, 1, 1, 12, 0, 0),
+        ),
+        backend.session_repo,
+        backend.unit_of_work,
+    )
+
+
+def _weekly_report(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return generate_weekly_report(
+        WeeklyReportRequest(week_start=rng.choice(dataset.mondays)),
+        backend.course_repo,
+        backend.topic_repo,
+        backend.session_repo,
+    )
+
+
+def _list_sessions(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return sum(1 for _ in list_sessions(backend.session_repo))
+
+
+def _export_sessions(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return sum(1 for _ in list_session_records(backend.session_repo))
+
+
+def _pending_this_week(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    monday = rng.choice(dataset.mondays)
+    request = ListSessionsRequest(start=monday, end=monday + timedelta(days=6), completed=False)
+    return sum(1 for _ in list_sessions(backend.session_repo, request))
+
+
+def _completion_stats(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    # Columns are built per call, as the ``stats`` command does.
+    return generate_completion_report(
+        RangeReportRequest(start=dataset.first_day, end=dataset.last_day),
+        backend.course_repo,
+        backend.topic_repo,
+        ColumnarSessionRepository(backend.session_repo),
+    )
+
+
+def _list_courses(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return list(list_courses(backend.course_repo))
+
+
+def _list_topics(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return list(list_topics(rng.choice(dataset.courses).course_id, backend.topic_repo))
+
+
+def _create_course(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return create_course(CreateCourseRequest(name="Benchmark"), backend.course_repo)
+
+
+def _add_topic(backend: Backend, dataset: Dataset, rng: random.Random) -> object:
+    return add_topic(
+        AddTopicRequest(course_id=rng.choice(dataset.courses).course_id, name="Benchmark"),
+        backend.course_repo,
+        backend.topic_repo,
+        backend.unit_of_work,
+    )
+
+
+OPERATIONS: dict[str, Operation] = {
+    "create_course": _create_course,
+    "list_courses": _list_courses,
+    "add_topic": _add_topic,
+    "list_topics": _list_topics,
+    "plan_session": _plan_session,
+    "complete_session": _complete_session,
+    "list_sessions": _list_sessions,
+    "export_sessions": _export_sessions,
+    "pending_this_week": _pending_this_week,
+    "generate_weekly_report": _weekly_report,
+    "completion_stats": _completion_stats,
+}
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(
+    operation: Operation,
+    backend: Backend,
+    dataset: Dataset,
+    rng: random.Random,
+    iterations: int,
+) -> dict[str, float]:
+    """Time ``iterations`` calls, then run once more under tracemalloc."""
+    reads, writes = backend.stats.reads, backend.stats.writes
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        operation(backend, dataset, rng)
+        latencies.append((time.perf_counter() - started) * 1000)
+    reads = backend.stats.reads - reads
+    writes = backend.stats.writes - writes
+
+    tracemalloc.start()
+    try:
+        operation(backend, dataset, rng)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": sum(latencies) / iterations,
+        "p50_ms": _percentile(latencies, 0.50),
+        "p90_ms": _percentile(latencies, 0.90),
+        "p99_ms": _percentile(latencies, 0.99),
+        "max_ms": latencies[-1],
+        "peak_memory_bytes": peak,
+        "reads_per_op": reads / iterations,
+        "writes_per_op": writes / iterations,
+    }
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    adapters: tuple[str, ...] = ADAPTERS,
+    operations: tuple[str, ...] = tuple(OPERATIONS),
+    iterations: int = 10,
+    seed: int = 0,
+    progress: Callable[[str], None] | None = None,
+) -> dict:
+    runs = []
+    for size in sizes:
+        dataset = generate_dataset(size, seed=seed)
+        for adapter in adapters:
+            if progress is not None:
+                progress(f"{adapter}: {size} sessions")
+            with tempfile.TemporaryDirectory(prefix="planner-bench-") as directory:
+                backend = open_backend(adapter, Path(directory))
+                try:
+                    started = time.perf_counter()
+                    populate(
+                        dataset,
+                        backend.course_repo,
+                        backend.topic_repo,
+                        backend.session_repo,
+                        backend.unit_of_work,
+                    )
+                    setup_seconds = time.perf_counter() - started
+                    rng = random.Random(seed)
+                    results = {
+                        name: measure(OPERATIONS[name], backend, dataset, rng, iterations)
+                        for name in operations
+                    }
+                finally:
+                    backend.close()
+            runs.append(
+                {
+                    "adapter": adapter,
+                    "sessions": size,
+                    "courses": len(dataset.courses),
+                    "topics": len(dataset.topics),
+                    "setup_seconds": setup_seconds,
+                    "operations": results,
+                }
+            )
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "seed": seed,
+        "runs": runs,
+    }
@@ -1,16 +1,44 @@
+from .archive import ARCHIVE_CODECS, ArchivedSessionRepository, CompressedArchive
+from .columnar import ColumnarSessionRepository, SessionColumns
 from .in_memory import (
     InMemoryCourseRepository,
     InMemorySessionRepository,
     InMemoryTopicRepository,
 )
+from .instrumentation import CallStats, Profiler, Recorder, Recorders, instrument
 from .json_store import (
     JsonCourseRepository,
     JsonFileStore,
     JsonSessionRepository,
     JsonTopicRepository,
 )
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, PlannerMetrics
+from .report_cache import ReportCache
+from .sharded_store import (
+    SHARD_SCHEMES,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    sharded_scheme,
+)
+from .sqlite_store import (
+    SqliteCourseRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+    SqliteTopicRepository,
+    is_sqlite_spec,
+)
+from .stats import StoreStats
 
 __all__ = [
+    "ARCHIVE_CODECS",
+    "SHARD_SCHEMES",
+    "ArchivedSessionRepository",
+    "CallStats",
+    "ColumnarSessionRepository",
+    "CompressedArchive",
+    "Counter",
+    "Gauge",
+    "Histogram",
     "InMemoryCourseRepository",
     "InMemorySessionRepository",
     "InMemoryTopicRepository",
@@ -18,4 +46,21 @@ __all__ = [
     "JsonFileStore",
     "JsonSessionRepository",
     "JsonTopicRepository",
+    "MetricsRegistry",
+    "PlannerMetrics",
+    "Profiler",
+    "Recorder",
+    "Recorders",
+    "ReportCache",
+    "SessionColumns",
+    "ShardedJsonStore",
+    "ShardedSessionRepository",
+    "SqliteCourseRepository",
+    "SqliteSessionRepository",
+    "SqliteStore",
+    "SqliteTopicRepository",
+    "StoreStats",
+    "instrument",
+    "is_sqlite_spec",
+    "sharded_scheme",
 ]
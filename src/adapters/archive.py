@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import gzip
+import heapq
+import json
+import lzma
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, cast
+
+from src.application import (
+    CompletionTotals,
+    SessionAnalytics,
+    SessionArchive,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+)
+from src.domain import SessionId, StudySession, TopicId
+
+from .columnar import ColumnarSessionRepository, SessionColumns
+from .json_store import _append_lines, _date_order, _session_from_record, compact_json
+from .stats import StoreStats
+
+ARCHIVE_CODECS = ("gzip", "lzma")
+
+MANIFEST_NAME = "archive.json"
+INDEX_NAME = "sessions.index"
+
+# Per codec: one-shot compressor, streaming opener and partition file suffix.
+_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[..., object], str]] = {
+    "gzip": (gzip.compress, gzip.open, ".ndjson.gz"),
+    "lzma": (lzma.compress, lzma.open, ".ndjson.xz"),
+}
+
+
+def _month_key(day: str) -> str:
+    return day[:7]
+
+
+class CompressedArchive(SessionArchive):
+    """Append-only, month-partitioned cold storage for session records.
+
+    Layout::
+
+        archive.json            {"codec": "gzip" | "lzma", "sessions": N}
+        sessions.index          "<session_id> <YYYY-MM>" lines, one per record
+        <YYYY-MM>.ndjson.gz     NDJSON records scheduled in that month
+                                (``.ndjson.xz`` with lzma)
+
+    Each ``append`` compresses its records into one new gzip member or xz
+    stream per month and appends it to the partition; both formats read
+    concatenated members back as one stream, so archived data is never
+    rewritten. Reads decompress only the partitions a date range overlaps,
+    and a lookup by id only the month the index points to.
+    """
+
+    def __init__(
+        self, path: Path, codec: str | None = None, stats: StoreStats | None = None
+    ) -> None:
+        self._path = path
+        self.stats = stats if stats is not None else StoreStats()
+        manifest = self._manifest()
+        stored = manifest.get("codec")
+        if stored is not None and codec is not None and codec != stored:
+            raise ValueError(f"archive is compressed with {stored}, not {codec}")
+        self.codec = stored or codec or "gzip"
+        if self.codec not in _CODECS:
+            raise ValueError(f"unknown archive codec: {self.codec}")
+        self._compress, self._open, self._suffix = _CODECS[self.codec]
+        self._index_path = path / INDEX_NAME
+        self._index: dict[str, str] | None = None
+        self._index_identity: tuple | None = None
+
+    def _manifest(self) -> dict:
+        try:
+            return json.loads((self._path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def _partition_path(self, key: str) -> Path:
+        return self._path / f"{key}{self._suffix}"
+
+    def partitions(self) -> list[str]:
+        """Archived months, oldest first."""
+        if not self._path.is_dir():
+            return []
+        return sorted(
+            path.name.removesuffix(self._suffix)
+            for path in self._path.glob(f"*{self._suffix}")
+        )
+
+    def _partitions_between(self, start: date | None, end: date | None) -> list[str]:
+        low = _month_key(start.isoformat()) if start is not None else None
+        high = end.isoformat() if end is not None else None
+        return [
+            key
+            for key in self.partitions()
+            if (low is None or key >= low) and (high is None or f"{key}-01" < high)
+        ]
+
+    def covers(self, start: date | None, end: date | None) -> bool:
+        """Whether any archived month overlaps ``start <= day < end``."""
+        return bool(self._partitions_between(start, end))
+
+    def count(self) -> int:
+        """Records appended so far, counting any an interrupted run archived twice."""
+        return int(self._manifest().get("sessions", 0))
+
+    def append(self, records: Iterable[SessionRecord]) -> int:
+        by_month: dict[str, list[str]] = {}
+        months: dict[str, str] = {}
+        for record in records:
+            key = _month_key(record["scheduled_date"])
+            by_month.setdefault(key, []).append(compact_json(record))
+            months[record["session_id"]] = key
+        if not by_month:
+            return 0
+        # Archives written before the index existed get one before it grows.
+        index = self._session_index()
+        self._path.mkdir(parents=True, exist_ok=True)
+        written = 0
+        for key, lines in sorted(by_month.items()):
+            started = time.perf_counter()
+            payload = self._compress(("\n".join(lines) + "\n").encode("utf-8"))
+            with self._partition_path(key).open("ab") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self.stats.record_write(time.perf_counter() - started, len(payload))
+            written += len(lines)
+        # After the partitions: an entry never points at a record not yet written.
+        self._append_index(months)
+        index.update(months)
+        manifest = {"codec": self.codec, "sessions": self.count() + written}
+        temp_path = self._path / (MANIFEST_NAME + ".tmp")
+        temp_path.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(temp_path, self._path / MANIFEST_NAME)
+        return written
+
+    def _index_stat(self) -> tuple | None:
+        try:
+            stat = self._index_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _session_index(self) -> dict[str, str]:
+        """Archived session id to month, re-read when another process appended."""
+        identity = self._index_stat()
+        if self._index is not None and identity == self._index_identity:
+            return self._index
+        if identity is None:
+            self._rebuild_index()
+        else:
+            started = time.perf_counter()
+            index: dict[str, str] = {}
+            text = self._index_path.read_text(encoding="utf-8")
+            # Anything after the last newline is a torn, never completed append.
+            for line in text.split("\n")[:-1]:
+                session_id, _, key = line.partition(" ")
+                if not key:
+                    raise ValueError("corrupt archive index")
+                index[session_id] = key
+            self.stats.record_read(time.perf_counter() - started, len(text))
+            self._index = index
+            self._index_identity = identity
+        assert self._index is not None
+        return self._index
+
+    def _rebuild_index(self) -> None:
+        index = {
+            record["session_id"]: key
+            for key in self.partitions()
+            for record in self._read_partition(key)
+        }
+        self._index = index
+        self._index_identity = None
+        if not index:
+            return
+        started = time.perf_counter()
+        payload = "".join(f"{session_id} {key}\n" for session_id, key in index.items())
+        temp_path = self._path / (INDEX_NAME + ".tmp")
+        temp_path.write_text(payload, encoding="utf-8")
+        os.replace(temp_path, self._index_path)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        self._index_identity = self._index_stat()
+
+    def _append_index(self, months: dict[str, str]) -> None:
+        started = time.perf_counter()
+        payload = "".join(
+            f"{session_id} {key}\n" for session_id, key in months.items()
+        ).encode("utf-8")
+        _append_lines(self._index_path, payload)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        self._index_identity = self._index_stat()
+
+    def find(self, session_id: SessionId) -> dict | None:
+        """The archived record of ``session_id``, reading only its month."""
+        key = self._session_index().get(session_id)
+        if key is None:
+            return None
+        for record in self._read_partition(key):
+            if record["session_id"] == session_id:
+                return record
+        return None
+
+    def _read_partition(self, key: str) -> list[dict]:
+        started = time.perf_counter()
+        path = self._partition_path(key)
+        with self._open(path, "rt", encoding="utf-8") as handle:  # type: ignore[operator]
+            records = [json.loads(line) for line in handle if line.strip()]
+        self.stats.record_read(time.perf_counter() - started, path.stat().st_size)
+        return records
+
+    def records(self, start: date | None = None, end: date | None = None) -> Iterator[dict]:
+        """Archived records in ``start <= day < end``, month by month.
+
+        Within a month they come in ``(scheduled_date, session_id)`` order,
+        with records archived twice (after an interrupted run) dropped.
+        """
+        low = start.isoformat() if start is not None else None
+        high = end.isoformat() if end is not None else None
+        for key in self._partitions_between(start, end):
+            previous = None
+            for record in sorted(self._read_partition(key), key=_date_order):
+                day = record["scheduled_date"]
+                if (low is not None and day < low) or (high is not None and day >= high):
+                    continue
+                order = _date_order(record)
+                if order != previous:
+                    previous = order
+                    yield record
+
+
+def _unique(records: Iterator[dict]) -> Iterator[dict]:
+    """Drop consecutive records with the same ``(scheduled_date, session_id)``."""
+    previous = None
+    for record in records:
+        order = _date_order(record)
+        if order != previous:
+            previous = order
+            yield record
+
+
+class ArchivedSessionRepository(SessionRepository, SessionAnalytics):
+    """Sessions of a hot repository plus those moved to a ``CompressedArchive``.
+
+    Writes and rollups go to the hot repository; archived sessions kept their
+    minutes there, so reports never open the archive. Archived sessions are
+    read-only: ``get`` only sees live ones, so they cannot be completed
+    again, and ``get_archived`` looks one up. Listings and queries only
+    decompress archive partitions their date range overlaps; an unfiltered
+    listing returns the archived sessions first. Completion totals do the
+    same, and use the hot repository's columns when it keeps them.
+    """
+
+    def __init__(self, hot: SessionRepository, archive: CompressedArchive) -> None:
+        self._hot = hot
+        self._archive = archive
+
+    def add(self, session: StudySession) -> None:
+        self._hot.add(session)
+
+    def update(self, session: StudySession) -> None:
+        # Writing an archived session would bring it back next to its archived copy.
+        if self._hot.get(session.session_id) is None and self._archive.find(
+            session.session_id
+        ) is not None:
+            raise ValueError(f"session {session.session_id} is archived")
+        self._hot.update(session)
+
+    def get(self, session_id: SessionId) -> StudySession | None:
+        return self._hot.get(session_id)
+
+    def get_archived(self, session_id: SessionId) -> StudySession | None:
+        record = self._archive.find(session_id)
+        return None if record is None else _session_from_record(record)
+
+    def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
+        archived = [
+            _session_from_record(record)
+            for record in self._archive.records()
+            if record["topic_id"] == topic_id
+        ]
+        return archived + list(self._hot.list_by_topic(topic_id))
+
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        return map(_session_from_record, self.list_records(after))
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        if after is not None and self._hot.get(after) is not None:
+            return self._hot.list_records(after)
+        return self._all_records(after)
+
+    def _all_records(self, after: SessionId | None) -> Iterator[SessionRecord]:
+        archived = self._archive.records()
+        if after is not None:
+            for record in archived:
+                if record["session_id"] == after:
+                    break
+            else:
+                return
+        yield from cast(Iterator[SessionRecord], archived)
+        yield from self._hot.list_records()
+
+    def count(self) -> int:
+        return self._hot.count() + self._archive.count()
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        hot = self._hot.list_between(start, end)
+        if not self._archive.covers(start, end):
+            return hot
+        archived = map(_session_from_record, _unique(self._archive.records(start, end)))
+        return list(heapq.merge(archived, hot, key=lambda session: session.scheduled_date))
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        return map(_session_from_record, self.query_records(query, after))
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        # Only completed sessions are ever archived.
+        if query.completed is False or not self._archive.covers(query.start, query.end):
+            if after is None or self._hot.get(after) is not None:
+                return self._hot.query_records(query, after)
+        return self._merged_records(query, after)
+
+    def _merged_records(
+        self, query: SessionQuery, after: SessionId | None
+    ) -> Iterator[SessionRecord]:
+        position = None
+        start = query.start
+        if after is not None:
+            cursor = self._hot.get(after) or self.get_archived(after)
+            if cursor is None:
+                return
+            position = (cursor.scheduled_date.isoformat(), after)
+            start = cursor.scheduled_date if start is None else max(start, cursor.scheduled_date)
+        archived = (
+            record
+            for record in self._archive.records(start, query.end)
+            if (query.topic_ids is None or record["topic_id"] in query.topic_ids)
+            and query.completed is not False
+        )
+        hot = self._hot.query_records(
+            SessionQuery(query.topic_ids, start, query.end, query.completed)
+        )
+        merged = heapq.merge(archived, cast(Iterator[dict], hot), key=_date_order)
+        for record in _unique(merged):
+            if position is None or _date_order(record) > position:
+                yield cast(SessionRecord, record)
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        return self._hot.daily_minutes(start, end)
+
+    def completion_by_topic(self, start: date, end: date) -> dict[TopicId, CompletionTotals]:
+        if isinstance(self._hot, ColumnarSessionRepository) and not self._archive.covers(
+            start, end
+        ):
+            return self._hot.completion_by_topic(start, end)
+        records = self.query_records(SessionQuery(start=start, end=end))
+        return SessionColumns.from_records(records).completion_by_topic(start, end)
+
+    def topic_ids(self) -> set[TopicId]:
+        return self._hot.topic_ids()
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        # Archive files are append-only; archived history is kept.
+        return self._hot.remove_by_topics(topic_ids)
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        return self._hot.evict(session_ids)
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from typing import Callable, Iterable, Iterator
+
+from src.application import (
+    CompletionTotals,
+    SessionAnalytics,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    record_date,
+)
+from src.domain import SessionId, StudySession, TopicId
+
+try:
+    import numpy as _np
+except ImportError:  # Optional: without NumPy the masked sums run in Python.
+    _np = None
+
+
+class SessionColumns:
+    """Sessions as parallel arrays, one row per session.
+
+    ``day`` holds scheduled date ordinals, ``minutes`` durations and
+    ``topic`` an index into ``topics`` (all ``array('i')``); ``completed`` is
+    an ``array('b')`` of 0/1 flags. Rows are unordered: removing one moves
+    the last row into its slot. Sums over a date range are masked sums over
+    the columns, vectorised with NumPy when it is installed.
+    """
+
+    def __init__(self) -> None:
+        self.day = array("i")
+        self.minutes = array("i")
+        self.topic = array("i")
+        self.completed = array("b")
+        self.topics: list[TopicId] = []
+        self._topic_index: dict[TopicId, int] = {}
+        self._session_ids: list[SessionId] = []
+        self._rows: dict[SessionId, int] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[SessionRecord]) -> SessionColumns:
+        columns = cls()
+        for record in records:
+            columns._set(
+                SessionId(record["session_id"]),
+                TopicId(record["topic_id"]),
+                record_date(record["scheduled_date"]).toordinal(),
+                record["duration_minutes"],
+                record["completed"],
+            )
+        return columns
+
+    def __len__(self) -> int:
+        return len(self._session_ids)
+
+    def _topic_slot(self, topic_id: TopicId) -> int:
+        slot = self._topic_index.get(topic_id)
+        if slot is None:
+            slot = self._topic_index[topic_id] = len(self.topics)
+            self.topics.append(topic_id)
+        return slot
+
+    def _set(
+        self, session_id: SessionId, topic_id: TopicId, day: int, minutes: int, completed: bool
+    ) -> None:
+        topic = self._topic_slot(topic_id)
+        row = self._rows.get(session_id)
+        if row is None:
+            self._rows[session_id] = len(self._session_ids)
+            self._session_ids.append(session_id)
+            self.day.append(day)
+            self.minutes.append(minutes)
+            self.topic.append(topic)
+            self.completed.append(completed)
+        else:
+            self.day[row] = day
+            self.minutes[row] = minutes
+            self.topic[row] = topic
+            self.completed[row] = completed
+
+    def put(self, session: StudySession) -> None:
+        """Add the session's row, or overwrite it if the session is known."""
+        self._set(
+            session.session_id,
+            session.topic_id,
+            session.scheduled_date.toordinal(),
+            session.duration.value,
+            session.completed,
+        )
+
+    def remove(self, session_ids: Iterable[SessionId]) -> None:
+        for session_id in session_ids:
+            row = self._rows.pop(session_id, None)
+            if row is None:
+                continue
+            last = len(self._session_ids) - 1
+            if row != last:
+                moved = self._session_ids[last]
+                self._session_ids[row] = moved
+                self._rows[moved] = row
+                for column in (self.day, self.minutes, self.topic, self.completed):
+                    column[row] = column[last]
+            self._session_ids.pop()
+            for column in (self.day, self.minutes, self.topic, self.completed):
+                column.pop()
+
+    def remove_topics(self, topic_ids: Iterable[TopicId]) -> None:
+        slots = {
+            self._topic_index[topic_id]
+            for topic_id in topic_ids
+            if topic_id in self._topic_index
+        }
+        if slots:
+            self.remove(
+                [
+                    session_id
+                    for session_id, topic in zip(self._session_ids, self.topic)
+                    if topic in slots
+                ]
+            )
+
+    def completion_by_topic(self, start: date, end: date) -> dict[TopicId, CompletionTotals]:
+        """Sessions and minutes per topic scheduled in ``start <= day < end``."""
+        if not self._session_ids:
+            return {}
+        low, high = start.toordinal(), end.toordinal()
+        if _np is not None:
+            return self._numpy_totals(low, high)
+        count = len(self.topics)
+        sessions, done, minutes, done_minutes = [0] * count, [0] * count, [0] * count, [0] * count
+        for day, value, topic, completed in zip(
+            self.day, self.minutes, self.topic, self.completed
+        ):
+            if low <= day < high:
+                sessions[topic] += 1
+                minutes[topic] += value
+                if completed:
+                    done[topic] += 1
+                    done_minutes[topic] += value
+        return self._by_topic(sessions, done, minutes, done_minutes)
+
+    def _numpy_totals(self, low: int, high: int) -> dict[TopicId, CompletionTotals]:
+        assert _np is not None
+        count = len(self.topics)
+        # Zero-copy views; they are dropped before the arrays can grow again.
+        day = _np.frombuffer(self.day, dtype=_np.intc)
+        mask = (day >= low) & (day < high)
+        topic = _np.frombuffer(self.topic, dtype=_np.intc)[mask]
+        minutes = _np.frombuffer(self.minutes, dtype=_np.intc)[mask]
+        completed = _np.frombuffer(self.completed, dtype=_np.int8)[mask].astype(bool)
+        return self._by_topic(
+            _np.bincount(topic, minlength=count).tolist(),
+            _np.bincount(topic[completed], minlength=count).tolist(),
+            _np.bincount(topic, weights=minutes, minlength=count).astype(_np.int64).tolist(),
+            _np.bincount(topic[completed], weights=minutes[completed], minlength=count)
+            .astype(_np.int64)
+            .tolist(),
+        )
+
+    def _by_topic(
+        self, sessions: list[int], done: list[int], minutes: list[int], done_minutes: list[int]
+    ) -> dict[TopicId, CompletionTotals]:
+        return {
+            topic_id: CompletionTotals(
+                sessions[slot], done[slot], minutes[slot], done_minutes[slot]
+            )
+            for slot, topic_id in enumerate(self.topics)
+            if sessions[slot]
+        }
+
+
+class ColumnarSessionRepository(SessionRepository, SessionAnalytics):
+    """Session repository that also answers analytics from ``SessionColumns``.
+
+    The columns are built from the wrapped repository on first use and then
+    follow writes made through this wrapper, so a long-lived instance only
+    rescans when it has to. Given the store's ``version``, it rebuilds them
+    when the store changed without a write through the wrapper, or did not
+    change although one was made (it was rolled back); ``discard`` forces a
+    rebuild. Everything else, including the rollups behind reports, is
+    delegated.
+    """
+
+    def __init__(
+        self, inner: SessionRepository, version: Callable[[], str | None] | None = None
+    ) -> None:
+        self._inner = inner
+        self._version = version
+        self._columns: SessionColumns | None = None
+        # Committed store version the columns match, and whether writes were
+        # applied to them since.
+        self._synced: str | None = None
+        self._written = False
+
+    def columns(self) -> SessionColumns:
+        current = self._version() if self._version is not None else None
+        # None: no version to check, or uncommitted writes the columns follow.
+        if self._columns is not None and current is not None:
+            changed = current != self._synced
+            # Changed by someone else, or the writes it follows never committed.
+            if changed != self._written:
+                self._columns = None
+        if self._columns is None:
+            self._columns = SessionColumns.from_records(self._inner.list_records())
+        if current is not None:
+            self._synced = current
+            self._written = False
+        return self._columns
+
+    def discard(self) -> None:
+        """Drop the columns, e.g. after a rollback undid writes they follow."""
+        self._columns = None
+
+    def completion_by_topic(self, start: date, end: date) -> dict[TopicId, CompletionTotals]:
+        return self.columns().completion_by_topic(start, end)
+
+    def add(self, session: StudySession) -> None:
+        self._inner.add(session)
+        if self._columns is not None:
+            self._columns.put(session)
+            self._written = True
+
+    def update(self, session: StudySession) -> None:
+        self._inner.update(session)
+        if self._columns is not None:
+            self._columns.put(session)
+            self._written = True
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        topic_ids = list(topic_ids)
+        removed = self._inner.remove_by_topics(topic_ids)
+        if self._columns is not None:
+            self._columns.remove_topics(topic_ids)
+            self._written = True
+        return removed
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        session_ids = list(session_ids)
+        removed = self._inner.evict(session_ids)
+        if self._columns is not None:
+            self._columns.remove(session_ids)
+            self._written = True
+        return removed
+
+    def get(self, session_id: SessionId) -> StudySession | None:
+        return self._inner.get(session_id)
+
+    def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
+        return self._inner.list_by_topic(topic_id)
+
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        return self._inner.list_all(after)
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        return self._inner.list_records(after)
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        return self._inner.query(query, after)
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        return self._inner.query_records(query, after)
+
+    def count(self) -> int:
+        return self._inner.count()
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        return self._inner.list_between(start, end)
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        return self._inner.daily_minutes(start, end)
+
+    def topic_ids(self) -> set[TopicId]:
+        return self._inner.topic_ids()
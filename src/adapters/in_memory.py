@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-from typing import Iterable
-
-from src.application import CourseRepository, SessionRepository, TopicRepository
+from datetime import date, timedelta
+from typing import Iterable, Iterator
+
+from src.application import (
+    CourseRepository,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
+    session_record,
+)
 from src.domain import Course, CourseId, SessionId, StudySession, Topic, TopicId
 
 
@@ -36,24 +45,72 @@ class InMemoryTopicRepository(TopicRepository):
     def get(self, topic_id: TopicId) -> Topic | None:
         return self._items.get(topic_id)
 
+    def get_many(self, topic_ids: Iterable[TopicId]) -> dict[TopicId, Topic]:
+        return {
+            topic_id: self._items[topic_id]
+            for topic_id in topic_ids
+            if topic_id in self._items
+        }
+
     def list_by_course(self, course_id: CourseId) -> Iterable[Topic]:
         return [self._items[topic_id] for topic_id in self._by_course[course_id]]
 
+    def list_all(self) -> Iterable[Topic]:
+        return list(self._items.values())
+
     def remove(self, topic_id: TopicId) -> None:
         topic = self._items.pop(topic_id, None)
         if topic is None:
             return
         self._by_course[topic.course_id].discard(topic_id)
 
+    def remove_many(self, topic_ids: Iterable[TopicId]) -> int:
+        removed = 0
+        for topic_id in topic_ids:
+            if topic_id in self._items:
+                self.remove(topic_id)
+                removed += 1
+        return removed
+
 
 class InMemorySessionRepository(SessionRepository):
     def __init__(self) -> None:
         self._items: dict[SessionId, StudySession] = {}
         self._by_topic: dict[TopicId, set[SessionId]] = defaultdict(set)
+        self._by_date: list[tuple[date, SessionId]] = []
+        # Per completion status, the same (date, id) keys as _by_date.
+        self._by_status: dict[bool, list[tuple[date, SessionId]]] = {False: [], True: []}
+        self._daily: dict[date, dict[TopicId, int]] = {}
 
     def add(self, session: StudySession) -> None:
+        self._unindex(session.session_id)
         self._items[session.session_id] = session
         self._by_topic[session.topic_id].add(session.session_id)
+        key = (session.scheduled_date, session.session_id)
+        insort(self._by_date, key)
+        insort(self._by_status[session.completed], key)
+        self._roll_up(session, session.duration.value)
+
+    def _unindex(self, session_id: SessionId) -> None:
+        previous = self._items.get(session_id)
+        if previous is None:
+            return
+        self._by_topic[previous.topic_id].discard(session_id)
+        key = (previous.scheduled_date, session_id)
+        del self._by_date[bisect_left(self._by_date, key)]
+        by_status = self._by_status[previous.completed]
+        del by_status[bisect_left(by_status, key)]
+        self._roll_up(previous, -previous.duration.value)
+
+    def _roll_up(self, session: StudySession, minutes: int) -> None:
+        day = self._daily.setdefault(session.scheduled_date, {})
+        total = day.get(session.topic_id, 0) + minutes
+        if total:
+            day[session.topic_id] = total
+        else:
+            del day[session.topic_id]
+            if not day:
+                del self._daily[session.scheduled_date]
 
     def get(self, session_id: SessionId) -> StudySession | None:
         return self._items.get(session_id)
@@ -61,9 +118,114 @@ class InMemorySessionRepository(SessionRepository):
     def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
         return [self._items[session_id] for session_id in self._by_topic[topic_id]]
 
-    def list_all(self) -> Iterable[StudySession]:
-        return list(self._items.values())
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        items = self._items
+        session_ids = iter(items)
+        if after is not None:
+            if after not in items:
+                return iter(())
+            for session_id in session_ids:
+                if session_id == after:
+                    break
+        return (items[session_id] for session_id in session_ids)
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        return map(session_record, self.list_all(after))
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        items = self._items
+        return (items[session_id] for _, session_id in self._query_keys(query, after))
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        return map(session_record, self.query(query, after))
+
+    def _query_keys(
+        self, query: SessionQuery, after: SessionId | None
+    ) -> Iterator[tuple[date, SessionId]]:
+        position = None
+        if after is not None:
+            cursor = self._items.get(after)
+            if cursor is None:
+                return iter(())
+            position = (cursor.scheduled_date, after)
+        if query.topic_ids is not None:
+            # The topic index narrows first; other filters check each session.
+            keys = sorted(
+                (self._items[session_id].scheduled_date, session_id)
+                for topic_id in query.topic_ids
+                for session_id in self._by_topic.get(topic_id, ())
+            )
+            return (key for key in keys if self._matches(key, query, position))
+        if query.completed is None:
+            ordered = self._by_date
+        else:
+            ordered = self._by_status[query.completed]
+        low = 0 if query.start is None else bisect_left(ordered, (query.start,))
+        if position is not None:
+            low = max(low, bisect_right(ordered, position))
+        high = len(ordered) if query.end is None else bisect_left(ordered, (query.end,))
+        return iter(ordered[low:high])
+
+    def _matches(
+        self,
+        key: tuple[date, SessionId],
+        query: SessionQuery,
+        position: tuple[date, SessionId] | None,
+    ) -> bool:
+        day, session_id = key
+        return (
+            (query.start is None or day >= query.start)
+            and (query.end is None or day < query.end)
+            and (query.completed is None or self._items[session_id].completed == query.completed)
+            and (position is None or key > position)
+        )
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        low = bisect_left(self._by_date, (start,))
+        high = bisect_left(self._by_date, (end,))
+        return [self._items[session_id] for _, session_id in self._by_date[low:high]]
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        rows = []
+        for offset in range((end - start).days):
+            day = start + timedelta(days=offset)
+            for topic_id, minutes in sorted(self._daily.get(day, {}).items()):
+                rows.append((day, topic_id, minutes))
+        return rows
 
     def update(self, session: StudySession) -> None:
-        self._items[session.session_id] = session
+        self.add(session)
+
+    def topic_ids(self) -> set[TopicId]:
+        return {topic_id for topic_id, session_ids in self._by_topic.items() if session_ids}
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        removed: set[SessionId] = set()
+        for topic_id in topic_ids:
+            removed.update(self._by_topic.get(topic_id, ()))
+        return self._remove(removed, roll_up=True)
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        return self._remove({sid for sid in session_ids if sid in self._items}, roll_up=False)
+
+    def _remove(self, removed: set[SessionId], roll_up: bool) -> int:
+        if not removed:
+            return 0
+        for session_id in removed:
+            session = self._items.pop(session_id)
+            self._by_topic[session.topic_id].discard(session_id)
+            if roll_up:
+                self._roll_up(session, -session.duration.value)
+        # One pass per sorted index instead of one shift per removed session.
+        self._by_date = [key for key in self._by_date if key[1] not in removed]
+        for status, keys in self._by_status.items():
+            self._by_status[status] = [key for key in keys if key[1] not in removed]
+        return len(removed)
 
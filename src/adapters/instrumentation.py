@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Protocol, TypeVar, cast
+
+from .stats import StoreStats
+
+T = TypeVar("T")
+
+
+class Recorder(Protocol):
+    def record(self, name: str, seconds: float) -> None: ...
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    """Collects call counts and wall time for named operations."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, CallStats] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        stats = self.calls.get(name)
+        if stats is None:
+            stats = self.calls[name] = CallStats()
+        stats.calls += 1
+        stats.seconds += seconds
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self, title: str, store_stats: StoreStats | None = None) -> str:
+        lines = [f"profile: {title}"]
+        for name, stats in sorted(
+            self.calls.items(), key=lambda item: item[1].seconds, reverse=True
+        ):
+            lines.append(
+                f"  {name:<36} {stats.calls:>6} calls {stats.seconds * 1000:>10.3f} ms"
+            )
+        if store_stats is not None:
+            lines.append(
+                f"  {'store reads':<36} {store_stats.reads:>6} "
+                f"{store_stats.read_seconds * 1000:>16.3f} ms "
+                f"{store_stats.bytes_read:>12} bytes"
+            )
+            lines.append(
+                f"  {'store writes':<36} {store_stats.writes:>6} "
+                f"{store_stats.write_seconds * 1000:>16.3f} ms "
+                f"{store_stats.bytes_written:>12} bytes"
+            )
+        return "\n".join(lines)
+
+
+class Recorders:
+    """Fan each measurement out to several recorders."""
+
+    def __init__(self, *recorders: Recorder) -> None:
+        self._recorders = recorders
+
+    def record(self, name: str, seconds: float) -> None:
+        for recorder in self._recorders:
+            recorder.record(name, seconds)
+
+
+class _Instrumented:
+    """Proxy that times every method call on the wrapped object."""
+
+    def __init__(self, inner: object, prefix: str, recorder: Recorder) -> None:
+        self._inner = inner
+        self._prefix = prefix
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._inner, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        wrapped = self._wrap(f"{self._prefix}.{name}", attribute)
+        # Cache on the proxy so later lookups skip __getattr__.
+        setattr(self, name, wrapped)
+        return wrapped
+
+    def _wrap(self, label: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        recorder = self._recorder
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except BaseException:
+                recorder.record(label, time.perf_counter() - started)
+                raise
+            seconds = time.perf_counter() - started
+            if isinstance(result, Iterator):
+                # Lazy results do their work as they are consumed.
+                return _timed(result, label, seconds, recorder)
+            recorder.record(label, seconds)
+            return result
+
+        return call
+
+
+def _timed(
+    items: Iterator[T], label: str, seconds: float, recorder: Recorder
+) -> Iterator[T]:
+    """Pass ``items`` through, recording the call once they are exhausted or dropped."""
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - started
+            yield item
+    finally:
+        recorder.record(label, seconds)
+
+
+def instrument(target: T, prefix: str, recorder: Recorder) -> T:
+    """Wrap a repository (or any port) so each call is counted and timed."""
+    return cast(T, _Instrumented(target, prefix, recorder))
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import json
-from datetime import date, datetime
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Hashable, Iterable, Iterator, cast
 
-from src.application import CourseRepository, SessionRepository, TopicRepository
+from src.application import (
+    CourseRepository,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
+    record_date,
+    session_record,
+)
 from src.domain import (
     Course,
     CourseId,
@@ -16,9 +33,63 @@ from src.domain import (
     TopicId,
 )
 
+from .stats import StoreStats
+
+_KEYS = {"courses": "course_id", "topics": "topic_id", "sessions": "session_id"}
+
+DEFAULT_COMPACT_THRESHOLD = 1024 * 1024
+
+SNAPSHOT_SUFFIX = ".bin"
+
+# Compact encoder for one record per line (archives, NDJSON and JSON output);
+# circular checks are pointless for flat records.
+compact_json = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+# Compact id format: one ``ids`` table, then records holding indexes into it.
+_ID_TABLE = "ids"
+_ID_TABLE_PREFIX = b'{"ids":'
+_ID_FIELDS = {
+    "courses": ("course_id",),
+    "topics": ("topic_id", "course_id"),
+    "sessions": ("session_id", "topic_id"),
+}
+
+# Binary snapshot header: magic, format version, identity of the store.json it
+# mirrors (st_mtime_ns, st_size, st_ino), crc32 and length of the payload.
+_SNAPSHOT_MAGIC = b"SPBIN"
+_SNAPSHOT_FORMAT = 1
+_SNAPSHOT_HEADER = struct.Struct("<5sHqqQIQ")
+
 
-def _to_date(value: str) -> date:
-    return date.fromisoformat(value)
+def _complete_length(handle: BinaryIO, size: int, chunk: int = 64 * 1024) -> int:
+    """Length of the file up to and including its last newline."""
+    end = size
+    while end:
+        start = max(0, end - chunk)
+        handle.seek(start)
+        newline = handle.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
+
+
+def _append_lines(path: Path, payload: bytes) -> int:
+    """Durably append newline-terminated ``payload``; returns the new size.
+
+    Readers skip a torn final line left by an append that never completed,
+    so it is cut off first rather than glued to the front of ``payload``.
+    """
+    with path.open("a+b") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size:
+            handle.seek(size - 1)
+            if handle.read(1) != b"\n":
+                handle.truncate(_complete_length(handle, size))
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+        return handle.tell()
 
 
 def _to_datetime(value: str | None) -> datetime | None:
@@ -27,21 +98,551 @@ def _to_datetime(value: str | None) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
+def _course_to_record(course: Course) -> dict:
+    return {"course_id": course.course_id, "name": course.name}
+
+
+def _course_from_record(item: dict) -> Course:
+    return Course.hydrate(CourseId(item["course_id"]), item["name"])
+
+
+def _topic_to_record(topic: Topic) -> dict:
+    return {
+        "topic_id": topic.topic_id,
+        "course_id": topic.course_id,
+        "name": topic.name,
+    }
+
+
+def _topic_from_record(item: dict) -> Topic:
+    return Topic.hydrate(
+        TopicId(item["topic_id"]), CourseId(item["course_id"]), item["name"]
+    )
+
+
+def _session_from_record(item: dict) -> StudySession:
+    # Records were validated when they were stored.
+    return StudySession.hydrate(
+        SessionId(item["session_id"]),
+        TopicId(item["topic_id"]),
+        record_date(item["scheduled_date"]),
+        DurationMinutes.hydrate(item["duration_minutes"]),
+        item["completed"],
+        _to_datetime(item["completed_at"]),
+    )
+
+
+def _roll_up(rollups: dict[str, dict[str, int]], item: dict, sign: int) -> None:
+    day = rollups.setdefault(item["scheduled_date"], {})
+    total = day.get(item["topic_id"], 0) + sign * item["duration_minutes"]
+    if total:
+        day[item["topic_id"]] = total
+    else:
+        del day[item["topic_id"]]
+        if not day:
+            del rollups[item["scheduled_date"]]
+
+
+def _encode_ids(data: dict) -> dict:
+    """``data`` with every id replaced by its index in a leading ``ids`` table.
+
+    Indexes are assigned afresh on each write, in record order; rollups are
+    keyed by the index of their topic.
+    """
+    keys: dict[str, int] = {}
+    encoded: dict = {}
+    for collection, fields in _ID_FIELDS.items():
+        items = []
+        for item in data[collection]:
+            item = dict(item)
+            for field in fields:
+                key = keys.get(item[field])
+                if key is None:
+                    key = keys[item[field]] = len(keys)
+                item[field] = key
+            items.append(item)
+        encoded[collection] = items
+    rollups = {}
+    for day, minutes_by_topic in data.get("rollups", {}).items():
+        rollups[day] = {
+            str(keys.setdefault(topic_id, len(keys))): minutes
+            for topic_id, minutes in minutes_by_topic.items()
+        }
+    return {_ID_TABLE: list(keys), **encoded, "rollups": rollups}
+
+
+def _decode_ids(data: dict) -> dict:
+    """Replace id indexes with the interned ids they stand for, in place."""
+    table = [sys.intern(value) for value in data.pop(_ID_TABLE)]
+    for collection, fields in _ID_FIELDS.items():
+        for item in data[collection]:
+            for field in fields:
+                item[field] = table[item[field]]
+    rollups = data.get("rollups")
+    if rollups is not None:
+        data["rollups"] = {
+            day: {table[int(key)]: minutes for key, minutes in minutes_by_topic.items()}
+            for day, minutes_by_topic in rollups.items()
+        }
+    return data
+
+
+class _Document:
+    """Parsed store contents with id and secondary indexes.
+
+    ``records`` maps each collection to an insertion-ordered ``id -> record``
+    dict. Secondary indexes are built on first use and then maintained
+    incrementally by ``apply``. ``rollups`` holds planned minutes per ISO day
+    and topic; it is persisted with the document and rebuilt from the
+    sessions when a store written before rollups existed is loaded.
+    """
+
+    def __init__(self, data: dict) -> None:
+        self.records: dict[str, dict[str, dict]] = {
+            collection: {item[key]: item for item in data[collection]}
+            for collection, key in _KEYS.items()
+        }
+        self._groups: dict[tuple[str, str], dict[Hashable, dict[str, None]]] = {}
+        self._ranges: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        rollups = data.get("rollups")
+        if rollups is None:
+            rollups = {}
+            for item in self.records["sessions"].values():
+                _roll_up(rollups, item, 1)
+        self.rollups: dict[str, dict[str, int]] = rollups
+
+    def to_data(self) -> dict:
+        data: dict = {
+            collection: list(items.values())
+            for collection, items in self.records.items()
+        }
+        data["rollups"] = self.rollups
+        return data
+
+    def group(self, collection: str, field: str) -> dict[Hashable, dict[str, None]]:
+        """Ids in ``collection`` grouped by the value of ``field``."""
+        groups = self._groups.get((collection, field))
+        if groups is None:
+            groups = {}
+            for record_id, item in self.records[collection].items():
+                groups.setdefault(item[field], {})[record_id] = None
+            self._groups[(collection, field)] = groups
+        return groups
+
+    def between(
+        self, collection: str, field: str, low: str, high: str | None
+    ) -> list[str]:
+        """Ids whose ``field`` lies in ``[low, high)``, ordered by that field.
+
+        ``high=None`` leaves the range open; ties are ordered by id.
+        """
+        ordered = self._ranges.get((collection, field))
+        if ordered is None:
+            ordered = sorted(
+                (item[field], record_id)
+                for record_id, item in self.records[collection].items()
+            )
+            self._ranges[(collection, field)] = ordered
+        start = bisect_left(ordered, (low,))
+        stop = len(ordered) if high is None else bisect_left(ordered, (high,))
+        return [record_id for _, record_id in ordered[start:stop]]
+
+    def apply(self, entry: dict) -> None:
+        collection = entry["collection"]
+        if entry["op"] == "put":
+            record = entry["record"]
+            record_id = record[_KEYS[collection]]
+        elif entry["op"] in ("delete", "evict"):
+            record = None
+            record_id = entry["id"]
+        else:
+            raise ValueError(f"unknown journal op: {entry['op']}")
+        items = self.records[collection]
+        previous = items.get(record_id)
+        if record is None:
+            items.pop(record_id, None)
+        else:
+            items[record_id] = record
+        # An evicted session was archived; its minutes stay in the rollups.
+        if collection == "sessions" and entry["op"] != "evict":
+            if previous is not None:
+                _roll_up(self.rollups, previous, -1)
+            if record is not None:
+                _roll_up(self.rollups, record, 1)
+        for (name, field), groups in self._groups.items():
+            if name != collection:
+                continue
+            if previous is not None:
+                groups.get(previous[field], {}).pop(record_id, None)
+            if record is not None:
+                groups.setdefault(record[field], {})[record_id] = None
+        for (name, field), ordered in self._ranges.items():
+            if name != collection:
+                continue
+            if previous is not None:
+                del ordered[bisect_left(ordered, (previous[field], record_id))]
+            if record is not None:
+                insort(ordered, (record[field], record_id))
+
+    def remove(
+        self, collection: str, record_ids: Iterable[str], roll_up: bool = True
+    ) -> list[str]:
+        """Delete many records with one pass over each index; returns the ids removed.
+
+        ``apply`` would shift a sorted index once per deleted record. With
+        ``roll_up=False`` removed sessions keep their minutes in the rollups.
+        """
+        items = self.records[collection]
+        removed = {}
+        for record_id in record_ids:
+            record = items.pop(record_id, None)
+            if record is not None:
+                removed[record_id] = record
+        if not removed:
+            return []
+        if collection == "sessions" and roll_up:
+            for record in removed.values():
+                _roll_up(self.rollups, record, -1)
+        for (name, field), groups in self._groups.items():
+            if name == collection:
+                for record_id, record in removed.items():
+                    groups.get(record[field], {}).pop(record_id, None)
+        for (name, field), ordered in self._ranges.items():
+            if name == collection:
+                ordered[:] = [pair for pair in ordered if pair[1] not in removed]
+        return list(removed)
+
+
 class JsonFileStore:
-    def __init__(self, path: Path) -> None:
+    """JSON document store with an optional append-only journal.
+
+    In journal mode mutations are appended to ``<store>.log`` as one JSON line
+    each, and reads replay the log over the ``store.json`` snapshot. The log is
+    folded back into the snapshot by ``compact()``, which also runs
+    automatically once the log grows past ``compact_threshold`` bytes.
+
+    The parsed document is cached per process and only re-read when the
+    ``(st_mtime_ns, st_size, st_ino)`` of the snapshot or journal changes.
+
+    With ``binary_snapshot`` (or once ``<store>.bin`` exists) every snapshot
+    write also saves the document in ``marshal`` format, and loads map that
+    file instead of parsing JSON while its header still names the current
+    ``store.json`` and its crc32 matches. A stale or damaged file is ignored
+    and rebuilt from the JSON on the next load.
+
+    Every mutation runs inside ``transaction()``; outside an explicit one each
+    mutation commits on its own. Snapshot commits write a temp file, fsync it
+    and ``os.replace`` it over ``store.json``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        journal: bool = False,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        binary_snapshot: bool = False,
+        compact_ids: bool = False,
+    ) -> None:
         self._path = path
+        self._log_path = path.with_name(path.name + ".log")
+        self._snapshot_path = path.with_name(path.name + SNAPSHOT_SUFFIX)
+        self._binary_snapshot = binary_snapshot or self._snapshot_path.exists()
+        self._compact_ids = compact_ids or self._has_id_table()
+        self._journal = journal
+        self._compact_threshold = compact_threshold
+        self._cache: _Document | None = None
+        self._cache_identity: tuple | None = None
+        self._pending: list[dict] | None = None
+        # Whether the open transaction has checked the cache against the files.
+        self._pinned = False
+        self.stats = StoreStats()
         self._path.parent.mkdir(parents=True, exist_ok=True)
         if not self._path.exists():
             self._write({"courses": [], "topics": [], "sessions": []})
 
-    def _read(self) -> dict[str, list[dict]]:
-        data = json.loads(self._path.read_text(encoding="utf-8"))
-        if not {"courses", "topics", "sessions"} <= data.keys():
-            raise ValueError("invalid store format")
-        return data
+    @property
+    def log_path(self) -> Path:
+        return self._log_path
+
+    def _has_id_table(self) -> bool:
+        try:
+            with self._path.open("rb") as handle:
+                return handle.read(len(_ID_TABLE_PREFIX)) == _ID_TABLE_PREFIX
+        except FileNotFoundError:
+            return False
+
+    @property
+    def compact_ids(self) -> bool:
+        """Whether snapshots are written in the compact id format."""
+        return self._compact_ids
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self._snapshot_path
+
+    def size_bytes(self) -> int:
+        """Bytes on disk used by the snapshot, its journal and binary snapshot."""
+        size = sum(part[1] for part in self._identity() if part is not None)
+        if self._binary_snapshot:
+            try:
+                size += self._snapshot_path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def _identity(self) -> tuple:
+        identity = []
+        for path in (self._path, self._log_path):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                identity.append(None)
+            else:
+                identity.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(identity)
+
+    def _document(self) -> _Document:
+        if self._pinned and self._cache is not None:
+            # Inside a transaction the cached document holds uncommitted changes.
+            self.stats.cache_hits += 1
+            return self._cache
+        identity = self._identity()
+        if self._cache is not None and identity == self._cache_identity:
+            self.stats.cache_hits += 1
+            self._pinned = self._pending is not None
+            return self._cache
+        started = time.perf_counter()
+        data = self._read_snapshot(identity[0]) if self._binary_snapshot else None
+        if data is None:
+            size = identity[0][1]
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            if not {"courses", "topics", "sessions"} <= data.keys():
+                raise ValueError("invalid store format")
+            if _ID_TABLE in data:
+                data = _decode_ids(data)
+            document = _Document(data)
+            if self._binary_snapshot:
+                self._write_snapshot(document.to_data(), identity[0])
+        else:
+            size = self._snapshot_path.stat().st_size
+            document = _Document(data)
+        if identity[1] is not None:
+            size += identity[1][1]
+            for entry in self._read_log():
+                document.apply(entry)
+        self.stats.record_read(time.perf_counter() - started, size)
+        self._cache = document
+        self._cache_identity = identity
+        self._pinned = self._pending is not None
+        return document
 
-    def _write(self, data: dict[str, list[dict]]) -> None:
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    def _read(self) -> dict:
+        return self._document().to_data()
+
+    def _read_log(self) -> list[dict]:
+        entries = []
+        lines = self._log_path.read_text(encoding="utf-8").splitlines()
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line means the last append never completed.
+                if number == len(lines):
+                    break
+                raise ValueError("corrupt store journal") from None
+        return entries
+
+    def _write(self, data: dict) -> None:
+        self._cache = None
+        started = time.perf_counter()
+        if self._compact_ids:
+            payload = json.dumps(_encode_ids(data), separators=(",", ":")).encode("utf-8")
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self._path)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        # The snapshot now contains every journaled change.
+        self._log_path.unlink(missing_ok=True)
+        if self._binary_snapshot:
+            self._write_snapshot(data, self._identity()[0])
+
+    def _read_snapshot(self, source: tuple) -> dict | None:
+        """Document data from the binary snapshot if it mirrors ``source``.
+
+        The file is mapped rather than read, and ``marshal`` decodes the
+        payload straight from the mapping after the checksum is verified.
+        """
+        try:
+            handle = self._snapshot_path.open("rb")
+        except FileNotFoundError:
+            return None
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _SNAPSHOT_HEADER.size:
+                return None
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, version, *mirrored, checksum, length = _SNAPSHOT_HEADER.unpack_from(
+                    mapped
+                )
+                if (
+                    magic != _SNAPSHOT_MAGIC
+                    or version != _SNAPSHOT_FORMAT
+                    or tuple(mirrored) != source
+                    or _SNAPSHOT_HEADER.size + length != size
+                ):
+                    return None
+                with memoryview(mapped)[_SNAPSHOT_HEADER.size :] as payload:
+                    if zlib.crc32(payload) != checksum:
+                        return None
+                    return marshal.loads(payload)
+
+    def _write_snapshot(self, data: dict, source: tuple) -> None:
+        """Save ``data`` as the binary snapshot of the ``store.json`` at ``source``.
+
+        The file is derived data, so it is replaced atomically but not fsynced:
+        after a crash the header or checksum no longer matches and it is rebuilt.
+        """
+        started = time.perf_counter()
+        payload = marshal.dumps(data)
+        header = _SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC, _SNAPSHOT_FORMAT, *source, zlib.crc32(payload), len(payload)
+        )
+        temp_path = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(header)
+            handle.write(payload)
+        os.replace(temp_path, self._snapshot_path)
+        self.stats.record_write(
+            time.perf_counter() - started, len(header) + len(payload)
+        )
+
+    def _append_log(self, entries: list[dict]) -> int:
+        self._cache = None
+        started = time.perf_counter()
+        payload = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+        size = _append_lines(self._log_path, payload)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        return size
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Batch mutations and persist them with a single write at commit.
+
+        Nested calls join the outermost transaction. The document is loaded on
+        first access and then pinned until the end of the block, so a
+        transaction that only hits a higher-level cache never parses the
+        store. If the block raises, the pending changes are discarded and the
+        store is re-read on next access.
+        """
+        outermost = self._pending is None
+        if outermost:
+            self._pending = []
+            self._pinned = False
+        try:
+            yield
+        except BaseException:
+            if outermost:
+                self._pending = None
+                self._pinned = False
+                self._cache = None
+            raise
+        if outermost:
+            pending, self._pending = self._pending, None
+            self._pinned = False
+            if pending:
+                self._commit(pending)
+
+    def _commit(self, pending: list[dict]) -> None:
+        document = self._cache
+        assert document is not None
+        if not self._journal:
+            self._write(document.to_data())
+        elif self._append_log(pending) >= self._compact_threshold:
+            self._write(document.to_data())
+        self._cache = document
+        self._cache_identity = self._identity()
+
+    def _mutate(self, entry: dict) -> None:
+        with self.transaction():
+            assert self._pending is not None
+            self._document().apply(entry)
+            self._pending.append(entry)
+
+    def _put(self, collection: str, record: dict) -> None:
+        self._mutate({"op": "put", "collection": collection, "record": record})
+
+    def _delete(self, collection: str, record_id: str) -> None:
+        self._mutate({"op": "delete", "collection": collection, "id": record_id})
+
+    def _delete_many(
+        self, collection: str, record_ids: Iterable[str], evict: bool = False
+    ) -> list[str]:
+        """Delete records in one index pass; journaled as one entry per record.
+
+        ``evict`` leaves the rollups untouched. Returns the ids that existed
+        and were removed.
+        """
+        op = "evict" if evict else "delete"
+        with self.transaction():
+            assert self._pending is not None
+            removed = self._document().remove(collection, record_ids, roll_up=not evict)
+            self._pending.extend(
+                {"op": op, "collection": collection, "id": record_id}
+                for record_id in removed
+            )
+        return removed
+
+    def _records(self, collection: str) -> dict[str, dict]:
+        return self._document().records[collection]
+
+    def _group(self, collection: str, field: str, value: Hashable) -> list[dict]:
+        document = self._document()
+        items = document.records[collection]
+        record_ids = document.group(collection, field).get(value, {})
+        return [items[record_id] for record_id in record_ids]
+
+    def _values(self, collection: str, field: str) -> set:
+        """Distinct values of ``field`` that some record still holds."""
+        groups = self._document().group(collection, field)
+        return {value for value, record_ids in groups.items() if record_ids}
+
+    def _between(
+        self, collection: str, field: str, low: str, high: str | None
+    ) -> list[dict]:
+        document = self._document()
+        items = document.records[collection]
+        record_ids = document.between(collection, field, low, high)
+        return [items[record_id] for record_id in record_ids]
+
+    def version(self) -> str | None:
+        """Token that changes with every committed write, from ``stat`` alone.
+
+        ``None`` while uncommitted changes are pending, since nothing derived
+        from them may be cached.
+        """
+        if self._pending:
+            return None
+        return repr(self._identity())
+
+    def _rollups(self) -> dict[str, dict[str, int]]:
+        return self._document().rollups
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot and truncate it."""
+        document = self._document()
+        self._write(document.to_data())
+        self._cache = document
+        self._cache_identity = self._identity()
+
+    def close(self) -> None:
+        """Release resources; the JSON store holds none between calls."""
 
 
 class JsonCourseRepository(CourseRepository):
@@ -49,30 +650,18 @@ class JsonCourseRepository(CourseRepository):
         self._store = store
 
     def add(self, course: Course) -> None:
-        data = self._store._read()
-        data["courses"].append({"course_id": course.course_id, "name": course.name})
-        self._store._write(data)
+        self._store._put("courses", _course_to_record(course))
 
     def get(self, course_id: CourseId) -> Course | None:
-        data = self._store._read()
-        for item in data["courses"]:
-            if item["course_id"] == course_id:
-                return Course(course_id=CourseId(item["course_id"]), name=item["name"])
-        return None
+        item = self._store._records("courses").get(course_id)
+        return _course_from_record(item) if item is not None else None
 
     def list_all(self) -> Iterable[Course]:
-        data = self._store._read()
-        return [
-            Course(course_id=CourseId(item["course_id"]), name=item["name"])
-            for item in data["courses"]
-        ]
+        items = self._store._records("courses")
+        return [_course_from_record(item) for item in items.values()]
 
     def remove(self, course_id: CourseId) -> None:
-        data = self._store._read()
-        data["courses"] = [
-            item for item in data["courses"] if item["course_id"] != course_id
-        ]
-        self._store._write(data)
+        self._store._delete("courses", course_id)
 
 
 class JsonTopicRepository(TopicRepository):
@@ -80,45 +669,33 @@ class JsonTopicRepository(TopicRepository):
         self._store = store
 
     def add(self, topic: Topic) -> None:
-        data = self._store._read()
-        data["topics"].append(
-            {
-                "topic_id": topic.topic_id,
-                "course_id": topic.course_id,
-                "name": topic.name,
-            }
-        )
-        self._store._write(data)
+        self._store._put("topics", _topic_to_record(topic))
 
     def get(self, topic_id: TopicId) -> Topic | None:
-        data = self._store._read()
-        for item in data["topics"]:
-            if item["topic_id"] == topic_id:
-                return Topic(
-                    topic_id=TopicId(item["topic_id"]),
-                    course_id=CourseId(item["course_id"]),
-                    name=item["name"],
-                )
-        return None
+        item = self._store._records("topics").get(topic_id)
+        return _topic_from_record(item) if item is not None else None
+
+    def get_many(self, topic_ids: Iterable[TopicId]) -> dict[TopicId, Topic]:
+        items = self._store._records("topics")
+        return {
+            topic_id: _topic_from_record(items[topic_id])
+            for topic_id in topic_ids
+            if topic_id in items
+        }
 
     def list_by_course(self, course_id: CourseId) -> Iterable[Topic]:
-        data = self._store._read()
-        return [
-            Topic(
-                topic_id=TopicId(item["topic_id"]),
-                course_id=CourseId(item["course_id"]),
-                name=item["name"],
-            )
-            for item in data["topics"]
-            if item["course_id"] == course_id
-        ]
+        items = self._store._group("topics", "course_id", course_id)
+        return [_topic_from_record(item) for item in items]
+
+    def list_all(self) -> Iterable[Topic]:
+        items = self._store._records("topics")
+        return [_topic_from_record(item) for item in items.values()]
 
     def remove(self, topic_id: TopicId) -> None:
-        data = self._store._read()
-        data["topics"] = [
-            item for item in data["topics"] if item["topic_id"] != topic_id
-        ]
-        self._store._write(data)
+        self._store._delete("topics", topic_id)
+
+    def remove_many(self, topic_ids: Iterable[TopicId]) -> int:
+        return len(self._store._delete_many("topics", topic_ids))
 
 
 class JsonSessionRepository(SessionRepository):
@@ -126,82 +703,138 @@ class JsonSessionRepository(SessionRepository):
         self._store = store
 
     def add(self, session: StudySession) -> None:
-        data = self._store._read()
-        data["sessions"].append(
-            {
-                "session_id": session.session_id,
-                "topic_id": session.topic_id,
-                "scheduled_date": session.scheduled_date.isoformat(),
-                "duration_minutes": session.duration.value,
-                "completed": session.completed,
-                "completed_at": session.completed_at.isoformat()
-                if session.completed_at
-                else None,
-            }
-        )
-        self._store._write(data)
+        self._store._put("sessions", cast(dict, session_record(session)))
 
     def get(self, session_id: SessionId) -> StudySession | None:
-        data = self._store._read()
-        for item in data["sessions"]:
-            if item["session_id"] == session_id:
-                return StudySession(
-                    session_id=SessionId(item["session_id"]),
-                    topic_id=TopicId(item["topic_id"]),
-                    scheduled_date=_to_date(item["scheduled_date"]),
-                    duration=DurationMinutes(item["duration_minutes"]),
-                    completed=item["completed"],
-                    completed_at=_to_datetime(item["completed_at"]),
-                )
-        return None
+        item = self._store._records("sessions").get(session_id)
+        return _session_from_record(item) if item is not None else None
 
     def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
-        data = self._store._read()
-        return [
-            StudySession(
-                session_id=SessionId(item["session_id"]),
-                topic_id=TopicId(item["topic_id"]),
-                scheduled_date=_to_date(item["scheduled_date"]),
-                duration=DurationMinutes(item["duration_minutes"]),
-                completed=item["completed"],
-                completed_at=_to_datetime(item["completed_at"]),
-            )
-            for item in data["sessions"]
-            if item["topic_id"] == topic_id
-        ]
-
-    def list_all(self) -> Iterable[StudySession]:
-        data = self._store._read()
-        return [
-            StudySession(
-                session_id=SessionId(item["session_id"]),
-                topic_id=TopicId(item["topic_id"]),
-                scheduled_date=_to_date(item["scheduled_date"]),
-                duration=DurationMinutes(item["duration_minutes"]),
-                completed=item["completed"],
-                completed_at=_to_datetime(item["completed_at"]),
-            )
-            for item in data["sessions"]
-        ]
+        items = self._store._group("sessions", "topic_id", topic_id)
+        return [_session_from_record(item) for item in items]
+
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        return map(_session_from_record, self.list_records(after))
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        # Stored records already have the exported shape.
+        items = _records_after(self._store._records("sessions"), after)
+        return cast(Iterator[SessionRecord], items)
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        return map(_session_from_record, self.query_records(query, after))
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        position = _position(self._store._records("sessions"), after)
+        if after is not None and position is None:
+            return iter(())
+        return cast(Iterator[SessionRecord], _query_records(self._store, query, position))
+
+    def count(self) -> int:
+        return len(self._store._records("sessions"))
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        # ISO dates order lexicographically, so the index compares raw strings.
+        items = self._store._between(
+            "sessions", "scheduled_date", start.isoformat(), end.isoformat()
+        )
+        return [_session_from_record(item) for item in items]
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        return _daily_minutes(self._store._rollups(), start, end)
 
     def update(self, session: StudySession) -> None:
-        data = self._store._read()
-        updated = []
-        for item in data["sessions"]:
-            if item["session_id"] == session.session_id:
-                updated.append(
-                    {
-                        "session_id": session.session_id,
-                        "topic_id": session.topic_id,
-                        "scheduled_date": session.scheduled_date.isoformat(),
-                        "duration_minutes": session.duration.value,
-                        "completed": session.completed,
-                        "completed_at": session.completed_at.isoformat()
-                        if session.completed_at
-                        else None,
-                    }
-                )
-            else:
-                updated.append(item)
-        data["sessions"] = updated
-        self._store._write(data)
+        self._store._put("sessions", cast(dict, session_record(session)))
+
+    def topic_ids(self) -> set[TopicId]:
+        return {TopicId(topic_id) for topic_id in self._store._values("sessions", "topic_id")}
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        store = self._store
+        with store.transaction():
+            session_ids = [
+                item["session_id"]
+                for topic_id in topic_ids
+                for item in store._group("sessions", "topic_id", topic_id)
+            ]
+            return len(store._delete_many("sessions", session_ids))
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        return len(self._store._delete_many("sessions", session_ids, evict=True))
+
+
+def _records_after(records: dict[str, dict], after: str | None) -> Iterator[dict]:
+    """Records in insertion order, starting past the one with id ``after``."""
+    record_ids = iter(records)
+    if after is not None:
+        if after not in records:
+            return iter(())
+        # Skipping compares keys only; no record before the cursor is built.
+        for record_id in record_ids:
+            if record_id == after:
+                break
+    return (records[record_id] for record_id in record_ids)
+
+
+def _position(records: dict[str, dict], after: str | None) -> tuple[str, str] | None:
+    """Query order key ``(scheduled_date, session_id)`` of the cursor session."""
+    if after is None or after not in records:
+        return None
+    return (records[after]["scheduled_date"], after)
+
+
+def _date_order(item: dict) -> tuple[str, str]:
+    return (item["scheduled_date"], item["session_id"])
+
+
+def _query_records(
+    store: JsonFileStore, query: SessionQuery, position: tuple[str, str] | None
+) -> Iterator[dict]:
+    """Session records matching ``query`` past ``position``, in date order.
+
+    The most selective index drives the scan (topic groups, then the date
+    range, then the completion groups); the remaining filters are checked on
+    the raw records, so nothing outside that index slice is read.
+    """
+    low = query.start.isoformat() if query.start is not None else None
+    if position is not None and (low is None or position[0] > low):
+        low = position[0]
+    high = query.end.isoformat() if query.end is not None else None
+    items: Iterable[dict]
+    if query.topic_ids is not None:
+        items = sorted(
+            (
+                item
+                for topic_id in query.topic_ids
+                for item in store._group("sessions", "topic_id", topic_id)
+            ),
+            key=_date_order,
+        )
+    elif low is not None or high is not None or query.completed is None:
+        items = store._between("sessions", "scheduled_date", low or "", high)
+    else:
+        items = sorted(store._group("sessions", "completed", query.completed), key=_date_order)
+    for item in items:
+        day = item["scheduled_date"]
+        if (
+            (low is None or day >= low)
+            and (high is None or day < high)
+            and (query.completed is None or item["completed"] == query.completed)
+            and (position is None or (day, item["session_id"]) > position)
+        ):
+            yield item
+
+
+def _daily_minutes(
+    rollups: dict[str, dict[str, int]], start: date, end: date
+) -> list[tuple[date, TopicId, int]]:
+    rows = []
+    for offset in range((end - start).days):
+        day = start + timedelta(days=offset)
+        for topic_id, minutes in sorted(rollups.get(day.isoformat(), {}).items()):
+            rows.append((day, TopicId(topic_id), minutes))
+    return rows
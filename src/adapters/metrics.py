@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from bisect import bisect_left
+from dataclasses import replace
+from pathlib import Path
+from typing import TypeVar
+
+from .stats import StoreStats
+
+# Seconds; wide enough to cover a cached list and a cold weekly report on a
+# store with millions of sessions.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(values: dict[str, str]) -> _Labels:
+    return tuple(sorted((name, str(value)) for name, value in values.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self.values: dict[_Labels, float] = {}
+
+    def samples(self) -> list[tuple[str, _Labels, float]]:
+        return [(self.name, labels, value) for labels, value in self.values.items()]
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {"labels": dict(labels), "value": value} for labels, value in self.values.items()
+        ]
+
+    def merge(self, samples: list[dict]) -> None:
+        for sample in samples:
+            labels = _labels(sample["labels"])
+            self.values[labels] = self.values.get(labels, 0.0) + sample["value"]
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _labels(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self.values[_labels(labels)] = value
+
+    def merge(self, samples: list[dict]) -> None:
+        # A gauge is a reading, not an accumulation: the newest one wins.
+        for sample in samples:
+            self.values[_labels(sample["labels"])] = sample["value"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        self.series: dict[_Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        counts, totals = self._series(_labels(labels))
+        # counts has one slot per bucket plus +Inf; cumulated on export.
+        counts[bisect_left(self.buckets, value)] += 1
+        totals[0] += value
+
+    def _series(self, key: _Labels) -> tuple[list[int], list[float]]:
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        return series
+
+    def samples(self) -> list[tuple[str, _Labels, float]]:
+        samples: list[tuple[str, _Labels, float]] = []
+        for labels, (counts, totals) in self.series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", (*labels, ("le", _format_value(bound))), cumulative)
+                )
+            samples.append((f"{self.name}_sum", labels, totals[0]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {"labels": dict(labels), "buckets": list(counts), "sum": totals[0]}
+            for labels, (counts, totals) in self.series.items()
+        ]
+
+    def merge(self, samples: list[dict]) -> None:
+        for sample in samples:
+            if len(sample["buckets"]) != len(self.buckets) + 1:
+                # Recorded with other bucket bounds; cannot be combined.
+                continue
+            counts, totals = self._series(_labels(sample["labels"]))
+            for index, count in enumerate(sample["buckets"]):
+                counts[index] += count
+            totals[0] += sample["sum"]
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms with Prometheus text export."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge(name, help_text))
+
+    def histogram(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, buckets))
+
+    def _register(self, metric: _M) -> _M:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if existing.kind != metric.kind:
+                raise ValueError(f"metric {metric.name} is already a {existing.kind}")
+            return existing  # type: ignore[return-value]
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        """JSON-serialisable state that ``merge`` can fold back in."""
+        return {
+            name: {"type": metric.kind, "help": metric.help, "samples": metric.snapshot()}
+            for name, metric in self._metrics.items()
+        }
+
+    def merge(self, snapshot: dict) -> None:
+        """Add a previous snapshot, so counters accumulate across processes.
+
+        Metrics not registered here, or registered with another type, are
+        skipped.
+        """
+        for name, state in snapshot.items():
+            metric = self._metrics.get(name)
+            if metric is not None and metric.kind == state.get("type"):
+                metric.merge(state["samples"])
+
+
+class PlannerMetrics:
+    """The planner's metric families, fed by the CLI and instrumented repositories.
+
+    ``record`` has the profiler's signature so the same instrumentation proxy
+    can count repository calls into both.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry if registry is not None else MetricsRegistry()
+        registry = self.registry
+        self.use_case_seconds = registry.histogram(
+            "planner_use_case_duration_seconds", "Use case latency in seconds."
+        )
+        self.repository_calls = registry.counter(
+            "planner_repository_calls_total", "Repository method calls."
+        )
+        self.repository_seconds = registry.counter(
+            "planner_repository_call_seconds_total", "Time spent in repository methods."
+        )
+        self.store_reads = registry.counter(
+            "planner_store_reads_total", "Loads of persisted data (parses or queries)."
+        )
+        self.store_writes = registry.counter(
+            "planner_store_writes_total", "Commits written to disk."
+        )
+        self.store_read_bytes = registry.counter(
+            "planner_store_read_bytes_total", "Bytes read from store files."
+        )
+        self.store_written_bytes = registry.counter(
+            "planner_store_written_bytes_total", "Bytes written to store files."
+        )
+        self.cache_hits = registry.counter(
+            "planner_store_cache_hits_total", "Reads served from the in-memory document."
+        )
+        self.cache_hit_ratio = registry.gauge(
+            "planner_store_cache_hit_ratio", "Cache hits over all store reads."
+        )
+        self.store_file_bytes = registry.gauge(
+            "planner_store_file_bytes", "Size of the store files on disk."
+        )
+        self.sessions = registry.gauge("planner_sessions", "Stored study sessions.")
+        self._seen = StoreStats()
+
+    def record(self, name: str, seconds: float) -> None:
+        self.repository_calls.inc(method=name)
+        self.repository_seconds.inc(seconds, method=name)
+
+    def observe_use_case(self, use_case: str, seconds: float) -> None:
+        self.use_case_seconds.observe(seconds, use_case=use_case)
+
+    def collect_store(self, stats: StoreStats, file_bytes: int, sessions: int) -> None:
+        """Fold store I/O since the last collection into the counters."""
+        seen = self._seen
+        self.store_reads.inc(stats.reads - seen.reads)
+        self.store_writes.inc(stats.writes - seen.writes)
+        self.store_read_bytes.inc(stats.bytes_read - seen.bytes_read)
+        self.store_written_bytes.inc(stats.bytes_written - seen.bytes_written)
+        self.cache_hits.inc(stats.cache_hits - seen.cache_hits)
+        self._seen = replace(stats)
+        hits = self.cache_hits.values.get((), 0.0)
+        lookups = hits + self.store_reads.values.get((), 0.0)
+        self.cache_hit_ratio.set(hits / lookups if lookups else 0.0)
+        self.store_file_bytes.set(file_bytes)
+        self.sessions.set(sessions)
+
+    def load(self, path: Path) -> None:
+        """Merge the snapshot stored next to a previous ``write`` of ``path``."""
+        state_path = snapshot_path(path)
+        if state_path.exists():
+            self.registry.merge(json.loads(state_path.read_text(encoding="utf-8")))
+
+    def write(self, path: Path) -> None:
+        """Write Prometheus text to ``path`` and the JSON snapshot beside it."""
+        _replace_text(path, self.registry.render_prometheus())
+        _replace_text(snapshot_path(path), json.dumps(self.registry.snapshot()))
+
+
+def snapshot_path(path: Path) -> Path:
+    return path.with_name(path.name + ".json")
+
+
+def _replace_text(path: Path, text: str) -> None:
+    # Scrapers must never see a half-written file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
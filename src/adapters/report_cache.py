@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from src.application import WeeklyReport, WeeklyReportCache
+from src.domain import CourseId, TopicId
+
+DEFAULT_REPORT_CACHE_SIZE = 64
+
+
+def _report_to_record(report: WeeklyReport) -> dict:
+    return {
+        "week_start": report.week_start.isoformat(),
+        "total_minutes": report.total_minutes,
+        "minutes_by_course": report.minutes_by_course,
+        "minutes_by_topic": report.minutes_by_topic,
+    }
+
+
+def _report_from_record(item: dict) -> WeeklyReport:
+    return WeeklyReport(
+        week_start=date.fromisoformat(item["week_start"]),
+        total_minutes=item["total_minutes"],
+        minutes_by_course={
+            CourseId(course_id): minutes
+            for course_id, minutes in item["minutes_by_course"].items()
+        },
+        minutes_by_topic={
+            TopicId(topic_id): minutes
+            for topic_id, minutes in item["minutes_by_topic"].items()
+        },
+    )
+
+
+class ReportCache(WeeklyReportCache):
+    """LRU cache of weekly reports keyed by ``(week_start, store version)``.
+
+    Entries live in memory and, when ``path`` is given, in a JSON file shared
+    by every process using the store. The file only keeps entries for the
+    latest version it has seen; a write to the store changes the version, so
+    older entries can never be served again and are dropped on the next put.
+    """
+
+    def __init__(
+        self,
+        version: Callable[[], str | None],
+        path: Path | None = None,
+        capacity: int = DEFAULT_REPORT_CACHE_SIZE,
+    ) -> None:
+        self._version = version
+        self._path = path
+        self._capacity = capacity
+        self._entries: OrderedDict[tuple[date, str], WeeklyReport] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self) -> str | None:
+        return self._version()
+
+    def get(self, week_start: date, version: str) -> WeeklyReport | None:
+        key = (week_start, version)
+        report = self._entries.get(key)
+        if report is None:
+            record = self._read_file(version).get(week_start.isoformat())
+            if record is not None:
+                report = _report_from_record(record)
+                self._remember(key, report)
+        else:
+            self._entries.move_to_end(key)
+        if report is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return report
+
+    def put(self, report: WeeklyReport, version: str) -> None:
+        self._remember((report.week_start, version), report)
+        if self._path is None:
+            return
+        records = self._read_file(version)
+        records.pop(report.week_start.isoformat(), None)
+        records[report.week_start.isoformat()] = _report_to_record(report)
+        while len(records) > self._capacity:
+            del records[next(iter(records))]
+        payload = json.dumps({"version": version, "reports": list(records.values())})
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_text(payload, encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+    def _remember(self, key: tuple[date, str], report: WeeklyReport) -> None:
+        self._entries[key] = report
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def _read_file(self, version: str) -> dict[str, dict]:
+        """Cached records for ``version``, least recently written first."""
+        if self._path is None:
+            return {}
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            # The cache is disposable: a missing or damaged file is a miss.
+            return {}
+        if data.get("version") != version:
+            return {}
+        return {item["week_start"]: item for item in data["reports"]}
@@ -0,0 +1,491 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, cast
+
+from src.application import SessionQuery, SessionRecord, SessionRepository, session_record
+from src.domain import SessionId, StudySession, TopicId
+
+from .json_store import (
+    DEFAULT_COMPACT_THRESHOLD,
+    SNAPSHOT_SUFFIX,
+    JsonFileStore,
+    _append_lines,
+    _daily_minutes,
+    _position,
+    _query_records,
+    _records_after,
+    _session_from_record,
+)
+from .stats import StoreStats
+
+SHARD_SCHEMES = ("month", "week")
+
+MANIFEST_NAME = "shards.json"
+CATALOG_NAME = "catalog.json"
+INDEX_NAME = "sessions.index"
+SHARDS_DIR = "sessions"
+
+_REMOVED = "-"
+
+
+def _month_key(day: date) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(start: date) -> date:
+    return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def _week_key(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year:04d}-W{week:02d}"
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _next_week(start: date) -> date:
+    return start + timedelta(weeks=1)
+
+
+_Scheme = tuple[Callable[[date], str], Callable[[date], date], Callable[[date], date]]
+
+# Per scheme: shard key of a day, first day of its period, first day of the next.
+_SCHEMES: dict[str, _Scheme] = {
+    "month": (_month_key, _month_start, _next_month),
+    "week": (_week_key, _week_start, _next_week),
+}
+
+
+def sharded_scheme(path: Path) -> str | None:
+    """Shard scheme of the sharded store at ``path``, or ``None`` if it is not one."""
+    manifest_path = path / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    return json.loads(manifest_path.read_text(encoding="utf-8"))["shard_by"]
+
+
+class ShardedJsonStore:
+    """Directory store that partitions sessions by ``scheduled_date``.
+
+    Layout::
+
+        shards.json        {"shard_by": "month" | "week"}
+        catalog.json       courses and topics (a ``JsonFileStore``)
+        sessions/<key>.json
+                           one ``JsonFileStore`` per month (``2026-02``) or
+                           ISO week (``2026-W06``)
+        sessions.index     append-only ``<session_id> <key>`` lines mapping
+                           each session to its shard (``-`` once removed)
+
+    Shards are opened lazily, so a range query only parses the shards that
+    overlap it and a completion rewrites one shard. The index is derived data:
+    ``compact()`` rebuilds it from the shards, as does opening a store whose
+    index file is missing.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        shard_by: str | None = None,
+        journal: bool = False,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        binary_snapshot: bool = False,
+        compact_ids: bool = False,
+    ) -> None:
+        self._path = path
+        self._journal = journal
+        self._compact_threshold = compact_threshold
+        self._binary_snapshot = binary_snapshot
+        self._compact_ids = compact_ids
+        self.stats = StoreStats()
+        self.shard_by = self._resolve_scheme(shard_by)
+        self._key, self._period_start, self._next_period = _SCHEMES[self.shard_by]
+        self._catalog = self._open(path / CATALOG_NAME)
+        # Shards follow the catalog's id format, so it sticks without the flag.
+        self._compact_ids = self._catalog.compact_ids
+        self._shards: dict[str, JsonFileStore] = {}
+        self._index_path = path / INDEX_NAME
+        self._index: dict[str, str] | None = None
+        self._index_identity: tuple | None = None
+        self._stack: ExitStack | None = None
+        self._joined: set[str] = set()
+        self._pending_index: list[str] = []
+
+    def _resolve_scheme(self, shard_by: str | None) -> str:
+        stored = sharded_scheme(self._path)
+        if stored is not None:
+            if shard_by is not None and shard_by != stored:
+                raise ValueError(f"store is sharded by {stored}, not {shard_by}")
+            return stored
+        if shard_by not in SHARD_SCHEMES:
+            raise ValueError(f"unknown shard scheme: {shard_by}")
+        (self._path / SHARDS_DIR).mkdir(parents=True, exist_ok=True)
+        (self._path / MANIFEST_NAME).write_text(json.dumps({"shard_by": shard_by}), encoding="utf-8")
+        return shard_by
+
+    def _open(self, path: Path) -> JsonFileStore:
+        store = JsonFileStore(
+            path,
+            journal=self._journal,
+            compact_threshold=self._compact_threshold,
+            binary_snapshot=self._binary_snapshot,
+            compact_ids=self._compact_ids,
+        )
+        # One set of counters for the whole directory.
+        store.stats = self.stats
+        return store
+
+    @property
+    def catalog(self) -> JsonFileStore:
+        """Store holding courses and topics."""
+        return self._catalog
+
+    def shard_key(self, day: date) -> str:
+        return self._key(day)
+
+    def _shard_path(self, key: str) -> Path:
+        return self._path / SHARDS_DIR / f"{key}.json"
+
+    def _shard(self, key: str, create: bool = False) -> JsonFileStore | None:
+        shard = self._shards.get(key)
+        if shard is None:
+            if not create and not self._shard_path(key).exists():
+                return None
+            shard = self._shards[key] = self._open(self._shard_path(key))
+        if self._stack is not None and key not in self._joined:
+            # Shards touched inside a transaction commit or roll back with it.
+            self._stack.enter_context(shard.transaction())
+            self._joined.add(key)
+        return shard
+
+    def _shard_keys(self) -> list[str]:
+        """Existing shard keys; zero-padded, so they sort chronologically."""
+        return sorted(path.stem for path in (self._path / SHARDS_DIR).glob("*.json"))
+
+    def _shards_between(self, start: date, end: date) -> Iterator[JsonFileStore]:
+        period = self._period_start(start)
+        while period < end:
+            shard = self._shard(self._key(period))
+            if shard is not None:
+                yield shard
+            period = self._next_period(period)
+
+    def _all_shards(
+        self, first: str | None = None, last: str | None = None
+    ) -> Iterator[JsonFileStore]:
+        """Existing shards in key order, limited to ``first <= key <= last``."""
+        for key in self._shard_keys():
+            if first is not None and key < first:
+                continue
+            if last is not None and key > last:
+                break
+            shard = self._shard(key)
+            if shard is not None:
+                yield shard
+
+    def _index_stat(self) -> tuple | None:
+        try:
+            stat = self._index_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _session_index(self) -> dict[str, str]:
+        if self._index is not None and (
+            self._stack is not None or self._index_stat() == self._index_identity
+        ):
+            return self._index
+        if self._index_stat() is None:
+            self._rebuild_index()
+        else:
+            started = time.perf_counter()
+            index: dict[str, str] = {}
+            text = self._index_path.read_text(encoding="utf-8")
+            # Anything after the last newline is a torn, never completed append;
+            # entries placed by the open transaction go on top.
+            lines = text.split("\n")[:-1] + [entry[:-1] for entry in self._pending_index]
+            for line in lines:
+                session_id, _, key = line.partition(" ")
+                if not key:
+                    raise ValueError("corrupt session index")
+                if key == _REMOVED:
+                    index.pop(session_id, None)
+                else:
+                    index[session_id] = key
+            self.stats.record_read(time.perf_counter() - started, len(text))
+            self._index = index
+            self._index_identity = self._index_stat()
+        assert self._index is not None
+        return self._index
+
+    def _rebuild_index(self) -> None:
+        index = {
+            session_id: key
+            for key in self._shard_keys()
+            for session_id in self._shard_records(key)
+        }
+        started = time.perf_counter()
+        payload = "".join(
+            f"{session_id} {key}\n" for session_id, key in index.items()
+        ).encode("utf-8")
+        temp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self._index_path)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        self._index = index
+        self._index_identity = self._index_stat()
+
+    def _shard_records(self, key: str) -> dict[str, dict]:
+        shard = self._shard(key)
+        return {} if shard is None else shard._records("sessions")
+
+    def _append_index(self, entries: list[str]) -> None:
+        started = time.perf_counter()
+        payload = "".join(entries).encode("utf-8")
+        _append_lines(self._index_path, payload)
+        self.stats.record_write(time.perf_counter() - started, len(payload))
+        self._index_identity = self._index_stat()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit the catalog and every shard touched in the block together.
+
+        Each file is still replaced on its own, so a crash mid-commit can
+        persist some shards and not others; the index is appended last.
+        """
+        if self._stack is not None:
+            yield
+            return
+        try:
+            with ExitStack() as stack:
+                self._stack = stack
+                stack.enter_context(self._catalog.transaction())
+                try:
+                    yield
+                finally:
+                    self._stack = None
+                    self._joined = set()
+        except BaseException:
+            self._pending_index = []
+            self._index = None
+            raise
+        pending, self._pending_index = self._pending_index, []
+        if pending:
+            self._append_index(pending)
+
+    def _locate(self, session_id: str) -> str | None:
+        return self._session_index().get(session_id)
+
+    def _place(self, session_id: str, key: str | None) -> None:
+        with self.transaction():
+            # Only an index already in memory needs updating; a missing file is
+            # rebuilt first so the append does not start a partial one.
+            if self._index is not None or self._index_stat() is None:
+                index = self._session_index()
+                if key is None:
+                    index.pop(session_id, None)
+                else:
+                    index[session_id] = key
+            self._pending_index.append(f"{session_id} {key or _REMOVED}\n")
+
+    def version(self) -> str | None:
+        """Token over the identity of every store file; see ``JsonFileStore.version``."""
+        stores = [self._catalog, *self._shards.values()]
+        if self._pending_index or any(store.version() is None for store in stores):
+            return None
+        identities = [self._catalog.version(), self._index_stat()]
+        for path in sorted((self._path / SHARDS_DIR).iterdir()):
+            if path.name.endswith(SNAPSHOT_SUFFIX):
+                # Derived data, rebuilt on reads; it never changes the contents.
+                continue
+            stat = path.stat()
+            identities.append((path.name, stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return hashlib.blake2b(repr(identities).encode("utf-8"), digest_size=16).hexdigest()
+
+    def size_bytes(self) -> int:
+        """Bytes on disk used by every file in the store directory."""
+        return sum(path.stat().st_size for path in self._path.rglob("*") if path.is_file())
+
+    def compact(self) -> None:
+        """Compact the catalog and every shard, and rewrite the index."""
+        self._catalog.compact()
+        for shard in self._all_shards():
+            shard.compact()
+        self._rebuild_index()
+
+    def close(self) -> None:
+        """Release resources; like ``JsonFileStore`` it holds none."""
+
+
+class ShardedSessionRepository(SessionRepository):
+    """Sessions spread over the shards of a ``ShardedJsonStore``.
+
+    ``list_all`` and ``list_by_topic`` return sessions shard by shard, i.e.
+    grouped by period rather than in insertion order.
+    """
+
+    def __init__(self, store: ShardedJsonStore) -> None:
+        self._store = store
+
+    def add(self, session: StudySession) -> None:
+        # A new session cannot be in another shard, so the index is not read.
+        store = self._store
+        key = store.shard_key(session.scheduled_date)
+        with store.transaction():
+            # Placed first: rebuilding a missing index must not see the new row.
+            store._place(session.session_id, key)
+            shard = store._shard(key, create=True)
+            assert shard is not None
+            shard._put("sessions", cast(dict, session_record(session)))
+
+    def get(self, session_id: SessionId) -> StudySession | None:
+        key = self._store._locate(session_id)
+        if key is None:
+            return None
+        item = self._store._shard_records(key).get(session_id)
+        return _session_from_record(item) if item is not None else None
+
+    def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
+        return [
+            _session_from_record(item)
+            for shard in self._store._all_shards()
+            for item in shard._group("sessions", "topic_id", topic_id)
+        ]
+
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        return map(_session_from_record, self.list_records(after))
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        first = None
+        if after is not None:
+            first = self._store._locate(after)
+            if first is None:
+                return iter(())
+        return cast(Iterator[SessionRecord], self._records_from(first, after))
+
+    def _records_from(self, first: str | None, after: str | None) -> Iterator[dict]:
+        # Shards are parsed one at a time, as the listing reaches them.
+        for shard in self._store._all_shards(first):
+            yield from _records_after(shard._records("sessions"), after)
+            after = None
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        return map(_session_from_record, self.query_records(query, after))
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        position = None
+        if after is not None:
+            key = self._store._locate(after)
+            if key is not None:
+                position = _position(self._store._shard_records(key), after)
+            if position is None:
+                return iter(())
+        return cast(Iterator[SessionRecord], self._query_shards(query, position))
+
+    def _query_shards(
+        self, query: SessionQuery, position: tuple[str, str] | None
+    ) -> Iterator[dict]:
+        store = self._store
+        start = query.start
+        if position is not None:
+            cursor_day = date.fromisoformat(position[0])
+            start = cursor_day if start is None else max(start, cursor_day)
+        first = store.shard_key(start) if start is not None else None
+        last = store.shard_key(query.end - timedelta(days=1)) if query.end is not None else None
+        # Shards partition by date, so per-shard date order is global order.
+        for shard in store._all_shards(first, last):
+            yield from _query_records(shard, query, position)
+
+    def count(self) -> int:
+        return len(self._store._session_index())
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        low, high = start.isoformat(), end.isoformat()
+        return [
+            _session_from_record(item)
+            for shard in self._store._shards_between(start, end)
+            for item in shard._between("sessions", "scheduled_date", low, high)
+        ]
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        # Each shard keeps rollups for its own period; shards come in date order.
+        return [
+            row
+            for shard in self._store._shards_between(start, end)
+            for row in _daily_minutes(shard._rollups(), start, end)
+        ]
+
+    def update(self, session: StudySession) -> None:
+        store = self._store
+        key = store.shard_key(session.scheduled_date)
+        with store.transaction():
+            previous = store._locate(session.session_id)
+            if previous is not None and previous != key:
+                old_shard = store._shard(previous)
+                if old_shard is not None:
+                    old_shard._delete("sessions", session.session_id)
+            shard = store._shard(key, create=True)
+            assert shard is not None
+            shard._put("sessions", cast(dict, session_record(session)))
+            if previous != key:
+                store._place(session.session_id, key)
+
+    def topic_ids(self) -> set[TopicId]:
+        return {
+            TopicId(topic_id)
+            for shard in self._store._all_shards()
+            for topic_id in shard._values("sessions", "topic_id")
+        }
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        store = self._store
+        wanted = list(topic_ids)
+        removed = 0
+        with store.transaction():
+            for shard in store._all_shards():
+                session_ids = [
+                    item["session_id"]
+                    for topic_id in wanted
+                    for item in shard._group("sessions", "topic_id", topic_id)
+                ]
+                for session_id in shard._delete_many("sessions", session_ids):
+                    store._place(session_id, None)
+                    removed += 1
+        return removed
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        store = self._store
+        by_shard: dict[str, list[str]] = {}
+        for session_id in session_ids:
+            key = store._locate(session_id)
+            if key is not None:
+                by_shard.setdefault(key, []).append(session_id)
+        removed = 0
+        with store.transaction():
+            for key, shard_ids in by_shard.items():
+                shard = store._shard(key)
+                assert shard is not None
+                for session_id in shard._delete_many("sessions", shard_ids, evict=True):
+                    store._place(session_id, None)
+                    removed += 1
+        return removed
@@ -0,0 +1,515 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from src.application import (
+    CourseRepository,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
+    record_date,
+)
+from src.domain import (
+    Course,
+    CourseId,
+    DurationMinutes,
+    SessionId,
+    StudySession,
+    Topic,
+    TopicId,
+)
+
+from .stats import StoreStats
+
+SQLITE_PREFIX = "sqlite:"
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    course_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topics (
+    topic_id TEXT PRIMARY KEY,
+    course_id TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    topic_id TEXT NOT NULL,
+    scheduled_date TEXT NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS topics_course_id ON topics (course_id);
+CREATE INDEX IF NOT EXISTS sessions_topic_id ON sessions (topic_id);
+CREATE INDEX IF NOT EXISTS sessions_scheduled_date ON sessions (scheduled_date);
+CREATE INDEX IF NOT EXISTS sessions_completed_date ON sessions (completed, scheduled_date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+CREATE TABLE IF NOT EXISTS daily_minutes (
+    day TEXT NOT NULL,
+    topic_id TEXT NOT NULL,
+    minutes INTEGER NOT NULL,
+    PRIMARY KEY (day, topic_id)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS sessions_roll_up_insert AFTER INSERT ON sessions BEGIN
+    INSERT INTO daily_minutes (day, topic_id, minutes)
+    VALUES (NEW.scheduled_date, NEW.topic_id, NEW.duration_minutes)
+    ON CONFLICT (day, topic_id) DO UPDATE SET minutes = minutes + excluded.minutes;
+END;
+CREATE TRIGGER IF NOT EXISTS sessions_roll_up_delete AFTER DELETE ON sessions BEGIN
+    UPDATE daily_minutes SET minutes = minutes - OLD.duration_minutes
+    WHERE day = OLD.scheduled_date AND topic_id = OLD.topic_id;
+    DELETE FROM daily_minutes
+    WHERE day = OLD.scheduled_date AND topic_id = OLD.topic_id AND minutes = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS sessions_roll_up_update
+AFTER UPDATE OF topic_id, scheduled_date, duration_minutes ON sessions BEGIN
+    UPDATE daily_minutes SET minutes = minutes - OLD.duration_minutes
+    WHERE day = OLD.scheduled_date AND topic_id = OLD.topic_id;
+    DELETE FROM daily_minutes
+    WHERE day = OLD.scheduled_date AND topic_id = OLD.topic_id AND minutes = 0;
+    INSERT INTO daily_minutes (day, topic_id, minutes)
+    VALUES (NEW.scheduled_date, NEW.topic_id, NEW.duration_minutes)
+    ON CONFLICT (day, topic_id) DO UPDATE SET minutes = minutes + excluded.minutes;
+END;
+"""
+
+# Stay well under SQLite's default bound-parameter limit.
+_MAX_PARAMS = 500
+
+# Rows pulled per fetch when streaming a query.
+_FETCH_BATCH = 1000
+
+_SESSION_COLUMNS = (
+    "session_id, topic_id, scheduled_date, duration_minutes, completed, completed_at"
+)
+
+
+def is_sqlite_spec(spec: str) -> bool:
+    return spec.startswith(SQLITE_PREFIX) or Path(spec).suffix in SQLITE_SUFFIXES
+
+
+def _topic_from_row(row: sqlite3.Row) -> Topic:
+    return Topic.hydrate(
+        TopicId(row["topic_id"]), CourseId(row["course_id"]), row["name"]
+    )
+
+
+def _session_from_row(row: sqlite3.Row) -> StudySession:
+    # Rows were validated when they were stored.
+    return StudySession.hydrate(
+        SessionId(row["session_id"]),
+        TopicId(row["topic_id"]),
+        record_date(row["scheduled_date"]),
+        DurationMinutes.hydrate(row["duration_minutes"]),
+        bool(row["completed"]),
+        datetime.fromisoformat(row["completed_at"])
+        if row["completed_at"] is not None
+        else None,
+    )
+
+
+def _record_from_row(row: sqlite3.Row) -> SessionRecord:
+    return {
+        "session_id": row["session_id"],
+        "topic_id": row["topic_id"],
+        "scheduled_date": row["scheduled_date"],
+        "duration_minutes": row["duration_minutes"],
+        "completed": bool(row["completed"]),
+        "completed_at": row["completed_at"],
+    }
+
+
+def _session_params(session: StudySession) -> tuple:
+    return (
+        session.session_id,
+        session.topic_id,
+        session.scheduled_date.isoformat(),
+        session.duration.value,
+        int(session.completed),
+        session.completed_at.isoformat() if session.completed_at else None,
+    )
+
+
+class SqliteStore:
+    """SQLite database in WAL mode holding courses, topics and sessions."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._backfill_rollups()
+        self._depth = 0
+        self._compact_pending = False
+        self.stats = StoreStats()
+
+    def _backfill_rollups(self) -> None:
+        # Databases created before the rollup table have sessions but no rollups.
+        connection = self._connection
+        if connection.execute("SELECT 1 FROM daily_minutes LIMIT 1").fetchone():
+            return
+        if not connection.execute("SELECT 1 FROM sessions LIMIT 1").fetchone():
+            return
+        connection.execute(
+            "INSERT INTO daily_minutes (day, topic_id, minutes) "
+            "SELECT scheduled_date, topic_id, SUM(duration_minutes) FROM sessions "
+            "GROUP BY scheduled_date, topic_id"
+        )
+        connection.commit()
+
+    def _commit(self) -> None:
+        if self._connection.in_transaction:
+            started = time.perf_counter()
+            # Every committed write moves the generation that versions caches.
+            self._connection.execute(
+                "UPDATE meta SET value = value + 1 WHERE key = 'generation'"
+            )
+            self._connection.commit()
+            self.stats.record_write(time.perf_counter() - started)
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a statement; returns the number of rows it changed."""
+        changed = self._connection.execute(sql, params).rowcount
+        if self._depth == 0:
+            self._commit()
+        return changed
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the block in one SQLite transaction; nested calls join it."""
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._connection.rollback()
+                self._compact_pending = False
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self._commit()
+            if self._compact_pending:
+                self.compact()
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> sqlite3.Row | None:
+        started = time.perf_counter()
+        row = self._connection.execute(sql, params).fetchone()
+        self.stats.record_read(time.perf_counter() - started)
+        return row
+
+    def _fetchall(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        started = time.perf_counter()
+        rows = self._connection.execute(sql, params).fetchall()
+        self.stats.record_read(time.perf_counter() - started)
+        return rows
+
+    def _iterate(
+        self, sql: str, params: tuple = (), batch: int = _FETCH_BATCH
+    ) -> Iterator[sqlite3.Row]:
+        """Stream rows ``batch`` at a time instead of materialising the result."""
+        started = time.perf_counter()
+        cursor = self._connection.execute(sql, params)
+        elapsed = time.perf_counter() - started
+        try:
+            while True:
+                started = time.perf_counter()
+                rows = cursor.fetchmany(batch)
+                elapsed += time.perf_counter() - started
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+            self.stats.record_read(elapsed)
+
+    def version(self) -> str | None:
+        """The store generation, or ``None`` while a write is uncommitted."""
+        if self._connection.in_transaction:
+            return None
+        row = self._fetchone("SELECT value FROM meta WHERE key = 'generation'")
+        assert row is not None
+        return str(row[0])
+
+    def size_bytes(self) -> int:
+        """Bytes on disk used by the database and its write-ahead log."""
+        size = 0
+        for path in (self._path, self._path.with_name(self._path.name + "-wal")):
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def compact(self) -> None:
+        """Checkpoint the write-ahead log and reclaim free pages.
+
+        ``VACUUM`` cannot run inside a transaction, so within one the work is
+        deferred until it commits.
+        """
+        if self._depth:
+            self._compact_pending = True
+            return
+        self._compact_pending = False
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class SqliteCourseRepository(CourseRepository):
+    def __init__(self, store: SqliteStore) -> None:
+        self._store = store
+
+    def add(self, course: Course) -> None:
+        self._store._execute(
+            "INSERT OR REPLACE INTO courses (course_id, name) VALUES (?, ?)",
+            (course.course_id, course.name),
+        )
+
+    def get(self, course_id: CourseId) -> Course | None:
+        row = self._store._fetchone(
+            "SELECT course_id, name FROM courses WHERE course_id = ?", (course_id,)
+        )
+        if row is None:
+            return None
+        return Course.hydrate(CourseId(row["course_id"]), row["name"])
+
+    def list_all(self) -> Iterable[Course]:
+        rows = self._store._fetchall("SELECT course_id, name FROM courses ORDER BY rowid")
+        return [
+            Course.hydrate(CourseId(row["course_id"]), row["name"]) for row in rows
+        ]
+
+    def remove(self, course_id: CourseId) -> None:
+        self._store._execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
+
+
+class SqliteTopicRepository(TopicRepository):
+    def __init__(self, store: SqliteStore) -> None:
+        self._store = store
+
+    def add(self, topic: Topic) -> None:
+        self._store._execute(
+            "INSERT OR REPLACE INTO topics (topic_id, course_id, name) VALUES (?, ?, ?)",
+            (topic.topic_id, topic.course_id, topic.name),
+        )
+
+    def get(self, topic_id: TopicId) -> Topic | None:
+        row = self._store._fetchone(
+            "SELECT topic_id, course_id, name FROM topics WHERE topic_id = ?",
+            (topic_id,),
+        )
+        if row is None:
+            return None
+        return _topic_from_row(row)
+
+    def get_many(self, topic_ids: Iterable[TopicId]) -> dict[TopicId, Topic]:
+        wanted = list(set(topic_ids))
+        found: dict[TopicId, Topic] = {}
+        for offset in range(0, len(wanted), _MAX_PARAMS):
+            chunk = wanted[offset : offset + _MAX_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._store._fetchall(
+                "SELECT topic_id, course_id, name FROM topics "
+                f"WHERE topic_id IN ({placeholders})",
+                tuple(chunk),
+            )
+            for row in rows:
+                topic = _topic_from_row(row)
+                found[topic.topic_id] = topic
+        return found
+
+    def list_by_course(self, course_id: CourseId) -> Iterable[Topic]:
+        rows = self._store._fetchall(
+            "SELECT topic_id, course_id, name FROM topics WHERE course_id = ? "
+            "ORDER BY rowid",
+            (course_id,),
+        )
+        return [_topic_from_row(row) for row in rows]
+
+    def list_all(self) -> Iterable[Topic]:
+        rows = self._store._fetchall(
+            "SELECT topic_id, course_id, name FROM topics ORDER BY rowid"
+        )
+        return [_topic_from_row(row) for row in rows]
+
+    def remove(self, topic_id: TopicId) -> None:
+        self._store._execute("DELETE FROM topics WHERE topic_id = ?", (topic_id,))
+
+    def remove_many(self, topic_ids: Iterable[TopicId]) -> int:
+        return self._store._execute(
+            "DELETE FROM topics WHERE topic_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(topic_ids)),),
+        )
+
+
+class SqliteSessionRepository(SessionRepository):
+    def __init__(self, store: SqliteStore) -> None:
+        self._store = store
+
+    def add(self, session: StudySession) -> None:
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete would
+        # bypass the rollup triggers.
+        self._store._execute(
+            f"INSERT INTO sessions ({_SESSION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (session_id) DO UPDATE SET topic_id = excluded.topic_id, "
+            "scheduled_date = excluded.scheduled_date, "
+            "duration_minutes = excluded.duration_minutes, "
+            "completed = excluded.completed, completed_at = excluded.completed_at",
+            _session_params(session),
+        )
+
+    def get(self, session_id: SessionId) -> StudySession | None:
+        row = self._store._fetchone(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE session_id = ?",
+            (session_id,),
+        )
+        if row is None:
+            return None
+        return _session_from_row(row)
+
+    def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]:
+        rows = self._store._fetchall(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE topic_id = ? ORDER BY rowid",
+            (topic_id,),
+        )
+        return [_session_from_row(row) for row in rows]
+
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        return map(_session_from_row, self._rows_after(after))
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        return map(_record_from_row, self._rows_after(after))
+
+    def _rows_after(self, after: SessionId | None) -> Iterator[sqlite3.Row]:
+        if after is None:
+            return self._store._iterate(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions ORDER BY rowid"
+            )
+        # An unknown cursor makes the subquery NULL, which matches nothing.
+        return self._store._iterate(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE rowid > "
+            "(SELECT rowid FROM sessions WHERE session_id = ?) ORDER BY rowid",
+            (after,),
+        )
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        return map(_session_from_row, self._query_rows(query, after))
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        return map(_record_from_row, self._query_rows(query, after))
+
+    def _query_rows(
+        self, query: SessionQuery, after: SessionId | None
+    ) -> Iterator[sqlite3.Row]:
+        clauses = []
+        params: list = []
+        if query.topic_ids is not None:
+            # One JSON parameter, however many topics a course has.
+            clauses.append("topic_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(sorted(query.topic_ids)))
+        if query.start is not None:
+            clauses.append("scheduled_date >= ?")
+            params.append(query.start.isoformat())
+        if query.end is not None:
+            clauses.append("scheduled_date < ?")
+            params.append(query.end.isoformat())
+        if query.completed is not None:
+            clauses.append("completed = ?")
+            params.append(int(query.completed))
+        if after is not None:
+            clauses.append(
+                "(scheduled_date, session_id) > "
+                "(SELECT scheduled_date, session_id FROM sessions WHERE session_id = ?)"
+            )
+            params.append(after)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        return self._store._iterate(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions {where}"
+            "ORDER BY scheduled_date, session_id",
+            tuple(params),
+        )
+
+    def count(self) -> int:
+        row = self._store._fetchone("SELECT COUNT(*) FROM sessions")
+        assert row is not None
+        return int(row[0])
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        rows = self._store._fetchall(
+            f"SELECT {_SESSION_COLUMNS} FROM sessions "
+            "WHERE scheduled_date >= ? AND scheduled_date < ? ORDER BY scheduled_date",
+            (start.isoformat(), end.isoformat()),
+        )
+        return [_session_from_row(row) for row in rows]
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        rows = self._store._fetchall(
+            "SELECT day, topic_id, minutes FROM daily_minutes "
+            "WHERE day >= ? AND day < ? ORDER BY day, topic_id",
+            (start.isoformat(), end.isoformat()),
+        )
+        return [
+            (date.fromisoformat(row["day"]), TopicId(row["topic_id"]), row["minutes"])
+            for row in rows
+        ]
+
+    def update(self, session: StudySession) -> None:
+        params = _session_params(session)
+        self._store._execute(
+            "UPDATE sessions SET topic_id = ?, scheduled_date = ?, duration_minutes = ?, "
+            "completed = ?, completed_at = ? WHERE session_id = ?",
+            params[1:] + params[:1],
+        )
+
+    def topic_ids(self) -> set[TopicId]:
+        rows = self._store._fetchall("SELECT DISTINCT topic_id FROM sessions")
+        return {TopicId(row["topic_id"]) for row in rows}
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        # The delete trigger takes each session out of the rollups.
+        return self._store._execute(
+            "DELETE FROM sessions WHERE topic_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(topic_ids)),),
+        )
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        ids = json.dumps(list(session_ids))
+        with self._store.transaction():
+            # Add the minutes once more first, so the delete trigger's
+            # subtraction leaves the rollups as they were.
+            self._store._execute(
+                "INSERT INTO daily_minutes (day, topic_id, minutes) "
+                "SELECT scheduled_date, topic_id, SUM(duration_minutes) FROM sessions "
+                "WHERE session_id IN (SELECT value FROM json_each(?)) "
+                "GROUP BY scheduled_date, topic_id "
+                "ON CONFLICT (day, topic_id) DO UPDATE SET minutes = minutes + excluded.minutes",
+                (ids,),
+            )
+            return self._store._execute(
+                "DELETE FROM sessions WHERE session_id IN (SELECT value FROM json_each(?))",
+                (ids,),
+            )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class StoreStats:
+    """Physical I/O performed by a store since it was opened.
+
+    ``reads`` counts full loads of persisted data (a parse of the JSON
+    document, or an SQL query) and ``writes`` counts commits to disk. Byte
+    counts are only tracked by file-based stores; ``cache_hits`` counts
+    accesses a store answered from data it already held in memory.
+    """
+
+    reads: int = 0
+    writes: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    read_seconds: float = 0.0
+    write_seconds: float = 0.0
+    cache_hits: int = 0
+
+    def record_read(self, seconds: float, size: int = 0) -> None:
+        self.reads += 1
+        self.bytes_read += size
+        self.read_seconds += seconds
+
+    def record_write(self, seconds: float, size: int = 0) -> None:
+        self.writes += 1
+        self.bytes_written += size
+        self.write_seconds += seconds
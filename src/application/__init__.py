@@ -1,44 +1,95 @@
 from .errors import ApplicationError, ApplicationValidationError, NotFoundError
-from .ports import CourseRepository, SessionRepository, TopicRepository, WeeklyReport
+from .ports import (
+    CompletionReport,
+    CompletionTotals,
+    CourseRepository,
+    PurgeResult,
+    RangeReport,
+    SessionAnalytics,
+    SessionArchive,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
+    UnitOfWork,
+    WeeklyReport,
+    WeeklyReportCache,
+)
 from .use_cases import (
     AddTopicRequest,
+    ArchiveSessionsRequest,
     CompleteSessionRequest,
     CreateCourseRequest,
+    ListSessionsRequest,
     PlanSessionRequest,
+    RangeReportRequest,
     WeeklyReportRequest,
     add_topic,
+    add_topics_bulk,
+    archive_sessions,
     complete_session,
     create_course,
     delete_course,
+    generate_completion_report,
+    generate_range_report,
+    generate_report_series,
     generate_weekly_report,
     list_courses,
+    list_session_records,
     list_sessions,
     list_topics,
     plan_session,
+    plan_sessions_bulk,
+    purge_orphans,
+    record_date,
     remove_topic,
+    session_record,
 )
 
 __all__ = [
     "AddTopicRequest",
     "ApplicationError",
     "ApplicationValidationError",
+    "ArchiveSessionsRequest",
     "CompleteSessionRequest",
+    "CompletionReport",
+    "CompletionTotals",
     "CourseRepository",
     "CreateCourseRequest",
+    "ListSessionsRequest",
     "NotFoundError",
     "PlanSessionRequest",
+    "PurgeResult",
+    "RangeReport",
+    "RangeReportRequest",
+    "SessionAnalytics",
+    "SessionArchive",
+    "SessionQuery",
+    "SessionRecord",
     "SessionRepository",
     "TopicRepository",
+    "UnitOfWork",
     "WeeklyReport",
+    "WeeklyReportCache",
     "WeeklyReportRequest",
     "add_topic",
+    "add_topics_bulk",
+    "archive_sessions",
     "complete_session",
     "create_course",
     "delete_course",
+    "generate_completion_report",
+    "generate_range_report",
+    "generate_report_series",
     "generate_weekly_report",
     "list_courses",
+    "list_session_records",
     "list_sessions",
     "list_topics",
     "plan_session",
+    "plan_sessions_bulk",
+    "purge_orphans",
+    "record_date",
     "remove_topic",
+    "session_record",
 ]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, Protocol
+from typing import ContextManager, Iterable, Iterator, Protocol, TypedDict
 
 from src.domain import Course, CourseId, SessionId, StudySession, Topic, TopicId
 
@@ -15,6 +15,59 @@ class WeeklyReport:
     minutes_by_topic: dict[TopicId, int]
 
 
+@dataclass(frozen=True)
+class RangeReport:
+    start: date
+    end: date  # inclusive
+    total_minutes: int
+    minutes_by_course: dict[CourseId, int]
+    minutes_by_topic: dict[TopicId, int]
+
+
+@dataclass(frozen=True)
+class CompletionTotals:
+    sessions: int
+    completed_sessions: int
+    minutes: int
+    completed_minutes: int
+
+
+@dataclass(frozen=True)
+class CompletionReport:
+    start: date
+    end: date  # inclusive
+    total: CompletionTotals
+    by_course: dict[CourseId, CompletionTotals]
+    by_topic: dict[TopicId, CompletionTotals]
+
+
+@dataclass(frozen=True)
+class PurgeResult:
+    topics_removed: int
+    sessions_removed: int
+
+
+@dataclass(frozen=True)
+class SessionQuery:
+    """Session filters; ``None`` leaves a dimension unconstrained."""
+
+    topic_ids: frozenset[TopicId] | None = None
+    start: date | None = None
+    end: date | None = None  # exclusive
+    completed: bool | None = None
+
+
+class SessionRecord(TypedDict):
+    """A session as plain data: ISO dates and primitive values."""
+
+    session_id: str
+    topic_id: str
+    scheduled_date: str
+    duration_minutes: int
+    completed: bool
+    completed_at: str | None
+
+
 class CourseRepository(Protocol):
     def add(self, course: Course) -> None: ...
 
@@ -30,10 +83,20 @@ class TopicRepository(Protocol):
 
     def get(self, topic_id: TopicId) -> Topic | None: ...
 
+    def get_many(self, topic_ids: Iterable[TopicId]) -> dict[TopicId, Topic]:
+        """Existing topics among ``topic_ids``, fetched in one batch."""
+        ...
+
     def list_by_course(self, course_id: CourseId) -> Iterable[Topic]: ...
 
+    def list_all(self) -> Iterable[Topic]: ...
+
     def remove(self, topic_id: TopicId) -> None: ...
 
+    def remove_many(self, topic_ids: Iterable[TopicId]) -> int:
+        """Remove existing topics among ``topic_ids``; returns how many were removed."""
+        ...
+
 
 class SessionRepository(Protocol):
     def add(self, session: StudySession) -> None: ...
@@ -42,6 +105,105 @@ class SessionRepository(Protocol):
 
     def list_by_topic(self, topic_id: TopicId) -> Iterable[StudySession]: ...
 
-    def list_all(self) -> Iterable[StudySession]: ...
+    def list_all(self, after: SessionId | None = None) -> Iterator[StudySession]:
+        """Every session in a stable order, built one at a time as consumed.
+
+        ``after`` resumes the listing past that session id; an unknown id
+        yields nothing.
+        """
+        ...
+
+    def list_records(self, after: SessionId | None = None) -> Iterator[SessionRecord]:
+        """``list_all`` as plain records, without building sessions.
+
+        Records may be the store's own; callers must not mutate them.
+        """
+        ...
+
+    def query(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[StudySession]:
+        """Sessions matching every filter of ``query``, lazily.
+
+        Ordered by ``(scheduled_date, session_id)``; ``after`` resumes past
+        that session's position and an unknown id yields nothing. Adapters
+        answer from their topic, date and status indexes rather than by
+        scanning every session.
+        """
+        ...
+
+    def query_records(
+        self, query: SessionQuery, after: SessionId | None = None
+    ) -> Iterator[SessionRecord]:
+        """``query`` as plain records, like ``list_records``."""
+        ...
+
+    def count(self) -> int:
+        """Number of stored sessions, without loading them."""
+        ...
+
+    def list_between(self, start: date, end: date) -> Iterable[StudySession]:
+        """Sessions with ``start <= scheduled_date < end``, in date order."""
+        ...
+
+    def daily_minutes(self, start: date, end: date) -> Iterable[tuple[date, TopicId, int]]:
+        """Planned minutes per day and topic for ``start <= day < end``.
+
+        Served from rollups maintained on every add/update, ordered by day and
+        then topic id; days and topics without sessions are omitted.
+        """
+        ...
 
     def update(self, session: StudySession) -> None: ...
+
+    def topic_ids(self) -> set[TopicId]:
+        """Distinct topics that have sessions, read from the topic index."""
+        ...
+
+    def remove_by_topics(self, topic_ids: Iterable[TopicId]) -> int:
+        """Remove every session of ``topic_ids`` along with its rollups.
+
+        Returns the number of sessions removed.
+        """
+        ...
+
+    def evict(self, session_ids: Iterable[SessionId]) -> int:
+        """Remove archived sessions but keep their minutes in the rollups.
+
+        Returns the number of sessions removed.
+        """
+        ...
+
+
+class SessionArchive(Protocol):
+    def append(self, records: Iterable[SessionRecord]) -> int:
+        """Durably add records to cold storage; returns how many were written."""
+        ...
+
+
+class SessionAnalytics(Protocol):
+    def completion_by_topic(
+        self, start: date, end: date
+    ) -> dict[TopicId, CompletionTotals]:
+        """Planned and completed sessions and minutes per topic.
+
+        Covers sessions scheduled in ``start <= day < end``; topics without
+        sessions there are left out.
+        """
+        ...
+
+
+class UnitOfWork(Protocol):
+    def transaction(self) -> ContextManager[None]:
+        """Group repository mutations so they are persisted together."""
+        ...
+
+
+class WeeklyReportCache(Protocol):
+    def version(self) -> str | None:
+        """Current store version, or ``None`` when nothing may be cached."""
+        ...
+
+    def get(self, week_start: date, version: str) -> WeeklyReport | None: ...
+
+    def put(self, report: WeeklyReport, version: str) -> None: ...
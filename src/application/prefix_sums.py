@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from itertools import accumulate
+from typing import Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DailyPrefixSums(Generic[K]):
+    """Cumulative minutes per key over the days ``start <= day < end``.
+
+    Each key owns an ``array('q')`` where slot ``i`` holds the minutes of the
+    days before ``start + i``, so the total of any sub-range is one
+    subtraction per key.
+    """
+
+    def __init__(self, start: date, end: date, sums: dict[K, array]) -> None:
+        self.start = start
+        self.end = end
+        self._sums = sums
+
+    @classmethod
+    def build(
+        cls, start: date, end: date, rows: Iterable[tuple[date, K, int]]
+    ) -> DailyPrefixSums[K]:
+        """Index ``(day, key, minutes)`` rows; rows outside the span are ignored."""
+        days = max(0, (end - start).days)
+        origin = start.toordinal()
+        daily: dict[K, array] = {}
+        for day, key, minutes in rows:
+            offset = day.toordinal() - origin
+            if not 0 <= offset < days:
+                continue
+            values = daily.get(key)
+            if values is None:
+                values = daily[key] = array("q", bytes(8 * (days + 1)))
+            values[offset + 1] += minutes
+        sums = {key: array("q", accumulate(values)) for key, values in daily.items()}
+        return cls(start, end, sums)
+
+    def _offset(self, day: date) -> int:
+        return min(max(0, (day - self.start).days), (self.end - self.start).days)
+
+    def keys(self) -> Iterable[K]:
+        """Keys in the order they first appeared in the rows."""
+        return self._sums.keys()
+
+    def total(self, key: K, start: date, end: date) -> int:
+        """Minutes for ``key`` over ``start <= day < end``, clipped to the span."""
+        values = self._sums.get(key)
+        if values is None:
+            return 0
+        return values[self._offset(end)] - values[self._offset(start)]
+
+    def totals(self, start: date, end: date) -> dict[K, int]:
+        """Non-zero totals per key over ``start <= day < end``."""
+        low, high = self._offset(start), self._offset(end)
+        totals = {}
+        for key, values in self._sums.items():
+            minutes = values[high] - values[low]
+            if minutes:
+                totals[key] = minutes
+        return totals
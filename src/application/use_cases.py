@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Iterable
+from functools import lru_cache
+from itertools import islice
+from typing import ContextManager, Iterable, Iterator
 
 from src.domain import (
     Course,
     CourseId,
+    DomainValidationError,
     DurationMinutes,
     SessionId,
     StudySession,
@@ -18,7 +22,23 @@ from src.domain import (
 )
 
 from .errors import ApplicationValidationError, NotFoundError
-from .ports import CourseRepository, SessionRepository, TopicRepository, WeeklyReport
+from .ports import (
+    CompletionReport,
+    CompletionTotals,
+    CourseRepository,
+    PurgeResult,
+    RangeReport,
+    SessionAnalytics,
+    SessionArchive,
+    SessionQuery,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
+    UnitOfWork,
+    WeeklyReport,
+    WeeklyReportCache,
+)
+from .prefix_sums import DailyPrefixSums
 
 
 @dataclass(frozen=True)
@@ -45,11 +65,57 @@ class CompleteSessionRequest:
     completed_at: datetime | None = None
 
 
+@dataclass(frozen=True)
+class ListSessionsRequest:
+    limit: int | None = None
+    after: SessionId | None = None  # cursor: the last session id already seen
+    course_id: CourseId | None = None
+    topic_id: TopicId | None = None
+    start: date | None = None
+    end: date | None = None  # inclusive
+    completed: bool | None = None
+
+    @property
+    def filtered(self) -> bool:
+        return any(
+            value is not None
+            for value in (self.course_id, self.topic_id, self.start, self.end, self.completed)
+        )
+
+
+@dataclass(frozen=True)
+class ArchiveSessionsRequest:
+    before: date  # exclusive
+
+
 @dataclass(frozen=True)
 class WeeklyReportRequest:
     week_start: date
 
 
+@dataclass(frozen=True)
+class RangeReportRequest:
+    start: date
+    end: date  # inclusive
+
+    @classmethod
+    def for_month(cls, year: int, month: int) -> RangeReportRequest:
+        first = date(year, month, 1)
+        if month == 12:
+            return cls(start=first, end=date(year, 12, 31))
+        return cls(start=first, end=date(year, month + 1, 1) - timedelta(days=1))
+
+    @classmethod
+    def for_year(cls, year: int) -> RangeReportRequest:
+        return cls(start=date(year, 1, 1), end=date(year, 12, 31))
+
+
+def _transaction(unit_of_work: UnitOfWork | None) -> ContextManager[None]:
+    if unit_of_work is None:
+        return nullcontext()
+    return unit_of_work.transaction()
+
+
 def create_course(
     request: CreateCourseRequest, course_repo: CourseRepository
 ) -> Course:
@@ -65,67 +131,282 @@ def list_courses(course_repo: CourseRepository) -> Iterable[Course]:
     return course_repo.list_all()
 
 
-def delete_course(course_id: CourseId, course_repo: CourseRepository) -> None:
-    if course_repo.get(course_id) is None:
-        raise NotFoundError("course not found")
-    course_repo.remove(course_id)
+def delete_course(
+    course_id: CourseId,
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> None:
+    """Delete a course with its topics and their sessions."""
+    with _transaction(unit_of_work):
+        if course_repo.get(course_id) is None:
+            raise NotFoundError("course not found")
+        topic_ids = [topic.topic_id for topic in topic_repo.list_by_course(course_id)]
+        session_repo.remove_by_topics(topic_ids)
+        topic_repo.remove_many(topic_ids)
+        course_repo.remove(course_id)
 
 
 def add_topic(
     request: AddTopicRequest,
     course_repo: CourseRepository,
     topic_repo: TopicRepository,
+    unit_of_work: UnitOfWork | None = None,
 ) -> Topic:
-    if course_repo.get(request.course_id) is None:
-        raise NotFoundError("course not found")
-    name = request.name.strip()
-    if not name:
-        raise ApplicationValidationError("topic name cannot be empty")
-    topic = Topic(topic_id=new_topic_id(), course_id=request.course_id, name=name)
-    topic_repo.add(topic)
+    with _transaction(unit_of_work):
+        if course_repo.get(request.course_id) is None:
+            raise NotFoundError("course not found")
+        name = request.name.strip()
+        if not name:
+            raise ApplicationValidationError("topic name cannot be empty")
+        topic = Topic(topic_id=new_topic_id(), course_id=request.course_id, name=name)
+        topic_repo.add(topic)
     return topic
 
 
+def add_topics_bulk(
+    requests: Iterable[AddTopicRequest],
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> list[Topic]:
+    """Validate every request up front, then add all topics in one transaction."""
+    with _transaction(unit_of_work):
+        known_courses = {course.course_id for course in course_repo.list_all()}
+        topics = []
+        for row, request in enumerate(requests, start=1):
+            if request.course_id not in known_courses:
+                raise NotFoundError(f"row {row}: course not found")
+            name = request.name.strip()
+            if not name:
+                raise ApplicationValidationError(f"row {row}: topic name cannot be empty")
+            topics.append(
+                Topic(topic_id=new_topic_id(), course_id=request.course_id, name=name)
+            )
+        for topic in topics:
+            topic_repo.add(topic)
+    return topics
+
+
 def list_topics(
     course_id: CourseId, topic_repo: TopicRepository
 ) -> Iterable[Topic]:
     return topic_repo.list_by_course(course_id)
 
 
-def remove_topic(topic_id: TopicId, topic_repo: TopicRepository) -> None:
-    if topic_repo.get(topic_id) is None:
-        raise NotFoundError("topic not found")
-    topic_repo.remove(topic_id)
+def remove_topic(
+    topic_id: TopicId,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> None:
+    """Remove a topic with its sessions."""
+    with _transaction(unit_of_work):
+        if topic_repo.get(topic_id) is None:
+            raise NotFoundError("topic not found")
+        session_repo.remove_by_topics([topic_id])
+        topic_repo.remove(topic_id)
+
+
+def purge_orphans(
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> PurgeResult:
+    """Remove topics of deleted courses and sessions of deleted topics.
+
+    Stores written before deletes cascaded can hold both.
+    """
+    with _transaction(unit_of_work):
+        course_ids = {course.course_id for course in course_repo.list_all()}
+        orphan_topics = [
+            topic.topic_id for topic in topic_repo.list_all() if topic.course_id not in course_ids
+        ]
+        topics_removed = topic_repo.remove_many(orphan_topics)
+        session_topics = session_repo.topic_ids()
+        orphan_sessions = session_topics - topic_repo.get_many(session_topics).keys()
+        sessions_removed = session_repo.remove_by_topics(orphan_sessions)
+    return PurgeResult(topics_removed=topics_removed, sessions_removed=sessions_removed)
 
 
 def plan_session(
-    request: PlanSessionRequest, topic_repo: TopicRepository, session_repo: SessionRepository
+    request: PlanSessionRequest,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
 ) -> StudySession:
-    if topic_repo.get(request.topic_id) is None:
-        raise NotFoundError("topic not found")
-    duration = DurationMinutes(request.duration_minutes)
-    session = StudySession(
-        session_id=new_session_id(),
-        topic_id=request.topic_id,
-        scheduled_date=request.scheduled_date,
-        duration=duration,
-    )
-    session_repo.add(session)
+    with _transaction(unit_of_work):
+        if topic_repo.get(request.topic_id) is None:
+            raise NotFoundError("topic not found")
+        duration = DurationMinutes(request.duration_minutes)
+        session = StudySession(
+            session_id=new_session_id(),
+            topic_id=request.topic_id,
+            scheduled_date=request.scheduled_date,
+            duration=duration,
+        )
+        session_repo.add(session)
     return session
 
 
-def list_sessions(session_repo: SessionRepository) -> Iterable[StudySession]:
-    return session_repo.list_all()
+def plan_sessions_bulk(
+    requests: Iterable[PlanSessionRequest],
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
+) -> list[StudySession]:
+    """Validate every request up front, then add all sessions in one transaction."""
+    pending = list(requests)
+    with _transaction(unit_of_work):
+        known_topics = topic_repo.get_many({request.topic_id for request in pending})
+        sessions = []
+        for row, request in enumerate(pending, start=1):
+            if request.topic_id not in known_topics:
+                raise NotFoundError(f"row {row}: topic not found")
+            try:
+                duration = DurationMinutes(request.duration_minutes)
+            except DomainValidationError as exc:
+                raise ApplicationValidationError(f"row {row}: {exc}") from exc
+            sessions.append(
+                StudySession(
+                    session_id=new_session_id(),
+                    topic_id=request.topic_id,
+                    scheduled_date=request.scheduled_date,
+                    duration=duration,
+                )
+            )
+        for session in sessions:
+            session_repo.add(session)
+    return sessions
+
+
+def list_sessions(
+    session_repo: SessionRepository,
+    request: ListSessionsRequest | None = None,
+    topic_repo: TopicRepository | None = None,
+) -> Iterator[StudySession]:
+    """Lazily list sessions, optionally filtered and one page after a cursor.
+
+    Unfiltered listings keep the repository's own order; filtered ones come
+    in date order. ``topic_repo`` is needed to filter by course.
+    """
+    request = _checked_page(request, session_repo)
+    if request.filtered:
+        query = _session_query(request, topic_repo)
+        sessions = session_repo.query(query, request.after)
+    else:
+        sessions = session_repo.list_all(request.after)
+    return islice(sessions, request.limit)
+
+
+def list_session_records(
+    session_repo: SessionRepository,
+    request: ListSessionsRequest | None = None,
+    topic_repo: TopicRepository | None = None,
+) -> Iterator[SessionRecord]:
+    """``list_sessions`` as plain records, for export without hydration."""
+    request = _checked_page(request, session_repo)
+    if request.filtered:
+        query = _session_query(request, topic_repo)
+        records = session_repo.query_records(query, request.after)
+    else:
+        records = session_repo.list_records(request.after)
+    return islice(records, request.limit)
+
+
+def _checked_page(
+    request: ListSessionsRequest | None, session_repo: SessionRepository
+) -> ListSessionsRequest:
+    if request is None:
+        return ListSessionsRequest()
+    if request.limit is not None and request.limit <= 0:
+        raise ApplicationValidationError("limit must be positive")
+    if request.start is not None and request.end is not None and request.start > request.end:
+        raise ApplicationValidationError("start must not be after end")
+    if request.end == date.max:
+        raise ApplicationValidationError(f"end must be before {date.max}")
+    if request.after is not None and session_repo.get(request.after) is None:
+        raise NotFoundError("session not found")
+    return request
+
+
+def _session_query(
+    request: ListSessionsRequest, topic_repo: TopicRepository | None
+) -> SessionQuery:
+    topic_ids: frozenset[TopicId] | None = None
+    if request.course_id is not None:
+        if topic_repo is None:
+            raise ValueError("filtering by course needs a topic repository")
+        topic_ids = frozenset(
+            topic.topic_id for topic in topic_repo.list_by_course(request.course_id)
+        )
+    if request.topic_id is not None:
+        wanted = frozenset({request.topic_id})
+        topic_ids = wanted if topic_ids is None else topic_ids & wanted
+    return SessionQuery(
+        topic_ids=topic_ids,
+        start=request.start,
+        end=request.end + timedelta(days=1) if request.end is not None else None,
+        completed=request.completed,
+    )
+
+
+def archive_sessions(
+    request: ArchiveSessionsRequest,
+    session_repo: SessionRepository,
+    archive: SessionArchive,
+    unit_of_work: UnitOfWork | None = None,
+) -> int:
+    """Move completed sessions scheduled before ``request.before`` to the archive.
+
+    Records are appended to the archive before they leave the store, so a
+    crash in between can duplicate a session but never lose one. Rollups keep
+    their minutes, so reports are unchanged.
+    """
+    with _transaction(unit_of_work):
+        records = list(
+            session_repo.query_records(SessionQuery(end=request.before, completed=True))
+        )
+        if not records:
+            return 0
+        archive.append(records)
+        session_repo.evict([SessionId(record["session_id"]) for record in records])
+    return len(records)
+
+
+# Sessions share a few hundred distinct days; reuse one date object per day.
+@lru_cache(maxsize=4096)
+def record_date(value: str) -> date:
+    """The ``date`` of an ISO day string from a ``SessionRecord``."""
+    return date.fromisoformat(value)
+
+
+def session_record(session: StudySession) -> SessionRecord:
+    return {
+        "session_id": session.session_id,
+        "topic_id": session.topic_id,
+        "scheduled_date": session.scheduled_date.isoformat(),
+        "duration_minutes": session.duration.value,
+        "completed": session.completed,
+        "completed_at": session.completed_at.isoformat()
+        if session.completed_at
+        else None,
+    }
 
 
 def complete_session(
-    request: CompleteSessionRequest, session_repo: SessionRepository
+    request: CompleteSessionRequest,
+    session_repo: SessionRepository,
+    unit_of_work: UnitOfWork | None = None,
 ) -> StudySession:
-    session = session_repo.get(request.session_id)
-    if session is None:
-        raise NotFoundError("session not found")
-    completed = session.complete(completed_at=request.completed_at)
-    session_repo.update(completed)
+    with _transaction(unit_of_work):
+        session = session_repo.get(request.session_id)
+        if session is None:
+            raise NotFoundError("session not found")
+        completed = session.complete(completed_at=request.completed_at)
+        session_repo.update(completed)
     return completed
 
 
@@ -134,37 +415,193 @@ def generate_weekly_report(
     course_repo: CourseRepository,
     topic_repo: TopicRepository,
     session_repo: SessionRepository,
+    cache: WeeklyReportCache | None = None,
 ) -> WeeklyReport:
     week_start = request.week_start
     if week_start.weekday() != 0:
         raise ApplicationValidationError("week_start must be a Monday")
+    if week_start > date.max - timedelta(days=7):
+        raise ApplicationValidationError(f"week must end before {date.max}")
+    # Take the version before reading, so a concurrent write can only make
+    # the cached entry unreachable, never stale.
+    version = cache.version() if cache is not None else None
+    if version is not None:
+        assert cache is not None
+        cached = cache.get(week_start, version)
+        if cached is not None:
+            return cached
     week_end = week_start + timedelta(days=7)
 
     minutes_by_course: dict[CourseId, int] = {}
     minutes_by_topic: dict[TopicId, int] = {}
     total_minutes = 0
 
-    sessions = session_repo.list_all()
-    for session in sessions:
-        if not (week_start <= session.scheduled_date < week_end):
-            continue
-        total_minutes += session.duration.value
-        minutes_by_topic[session.topic_id] = (
-            minutes_by_topic.get(session.topic_id, 0) + session.duration.value
-        )
-
-    # Map topic totals to course totals
-    for course in course_repo.list_all():
-        course_total = 0
-        for topic in topic_repo.list_by_course(course.course_id):
-            course_total += minutes_by_topic.get(topic.topic_id, 0)
-        if course_total:
-            minutes_by_course[course.course_id] = course_total
-
-    return WeeklyReport(
+    # Precomputed daily rollups: cost depends on the week, not the history.
+    for _, topic_id, minutes in session_repo.daily_minutes(week_start, week_end):
+        total_minutes += minutes
+        minutes_by_topic[topic_id] = minutes_by_topic.get(topic_id, 0) + minutes
+
+    # Map topic totals to course totals, resolving only the topics seen this week
+    course_totals: dict[CourseId, int] = {}
+    topics = topic_repo.get_many(minutes_by_topic)
+    for topic_id, minutes in minutes_by_topic.items():
+        topic = topics.get(topic_id)
+        if topic is not None:
+            course_totals[topic.course_id] = (
+                course_totals.get(topic.course_id, 0) + minutes
+            )
+    if course_totals:
+        for course in course_repo.list_all():
+            if course_totals.get(course.course_id):
+                minutes_by_course[course.course_id] = course_totals[course.course_id]
+
+    report = WeeklyReport(
         week_start=week_start,
         total_minutes=total_minutes,
         minutes_by_course=minutes_by_course,
         minutes_by_topic=minutes_by_topic,
     )
+    if version is not None:
+        assert cache is not None
+        cache.put(report, version)
+    return report
+
+
+def _check_range(request: RangeReportRequest) -> None:
+    if request.end < request.start:
+        raise ApplicationValidationError("report end must not be before its start")
+    # Ranges are read as half-open up to the day after ``end``.
+    if request.end == date.max:
+        raise ApplicationValidationError(f"report end must be before {date.max}")
+
+
+def generate_range_report(
+    request: RangeReportRequest,
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+) -> RangeReport:
+    """Minutes per course and topic for any inclusive date range."""
+    _check_range(request)
+    return _range_reports(
+        [(request.start, request.end)], course_repo, topic_repo, session_repo
+    )[0]
+
+
+def generate_report_series(
+    request: RangeReportRequest,
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+    period_days: int = 7,
+) -> list[RangeReport]:
+    """Consecutive reports of ``period_days`` days from ``request.start``.
+
+    The last period is cut short at ``request.end``. Rollups for the whole
+    range are read once; each period is then answered from prefix sums.
+    """
+    _check_range(request)
+    if period_days < 1:
+        raise ApplicationValidationError("report period must be at least one day")
+    windows = []
+    start = request.start
+    while start <= request.end:
+        end = min(start + timedelta(days=period_days - 1), request.end)
+        windows.append((start, end))
+        start = end + timedelta(days=1)
+    return _range_reports(windows, course_repo, topic_repo, session_repo)
+
+
+def _range_reports(
+    windows: list[tuple[date, date]],
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    session_repo: SessionRepository,
+) -> list[RangeReport]:
+    first = windows[0][0]
+    stop = windows[-1][1] + timedelta(days=1)
+    rows = list(session_repo.daily_minutes(first, stop))
+    topics = topic_repo.get_many({topic_id for _, topic_id, _ in rows})
+    by_topic = DailyPrefixSums.build(first, stop, rows)
+    by_course = DailyPrefixSums.build(
+        first,
+        stop,
+        (
+            (day, topics[topic_id].course_id, minutes)
+            for day, topic_id, minutes in rows
+            if topic_id in topics
+        ),
+    )
+    # Courses are reported in course order and only while they still exist.
+    course_ids = [course.course_id for course in course_repo.list_all()] if topics else []
+
+    reports = []
+    for start, end in windows:
+        minutes_by_topic = by_topic.totals(start, end + timedelta(days=1))
+        course_totals = by_course.totals(start, end + timedelta(days=1))
+        reports.append(
+            RangeReport(
+                start=start,
+                end=end,
+                total_minutes=sum(minutes_by_topic.values()),
+                minutes_by_course={
+                    course_id: course_totals[course_id]
+                    for course_id in course_ids
+                    if course_id in course_totals
+                },
+                minutes_by_topic=minutes_by_topic,
+            )
+        )
+    return reports
+
+
+def generate_completion_report(
+    request: RangeReportRequest,
+    course_repo: CourseRepository,
+    topic_repo: TopicRepository,
+    analytics: SessionAnalytics,
+) -> CompletionReport:
+    """Planned versus completed sessions and minutes per course and topic.
+
+    Rollups only hold planned minutes, so this reads per-session state from
+    ``analytics`` instead.
+    """
+    _check_range(request)
+    by_topic = analytics.completion_by_topic(request.start, request.end + timedelta(days=1))
+    topics = topic_repo.get_many(by_topic)
+    course_totals: dict[CourseId, CompletionTotals] = {}
+    for topic_id, totals in by_topic.items():
+        topic = topics.get(topic_id)
+        if topic is not None:
+            previous = course_totals.get(topic.course_id)
+            course_totals[topic.course_id] = (
+                totals if previous is None else _add_totals(previous, totals)
+            )
+    by_course = (
+        {
+            course.course_id: course_totals[course.course_id]
+            for course in course_repo.list_all()
+            if course.course_id in course_totals
+        }
+        if course_totals
+        else {}
+    )
+    total = CompletionTotals(0, 0, 0, 0)
+    for totals in by_topic.values():
+        total = _add_totals(total, totals)
+    return CompletionReport(
+        start=request.start,
+        end=request.end,
+        total=total,
+        by_course=by_course,
+        by_topic=by_topic,
+    )
 
+
+def _add_totals(left: CompletionTotals, right: CompletionTotals) -> CompletionTotals:
+    return CompletionTotals(
+        sessions=left.sessions + right.sessions,
+        completed_sessions=left.completed_sessions + right.completed_sessions,
+        minutes=left.minutes + right.minutes,
+        completed_minutes=left.completed_minutes + right.completed_minutes,
+    )
@@ -1,53 +1,357 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import cProfile
+import json
+import shlex
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import date, datetime
 from pathlib import Path
+from typing import Callable, Iterator, TextIO, cast
 
 from src.adapters import (
+    ARCHIVE_CODECS,
+    SHARD_SCHEMES,
+    ArchivedSessionRepository,
+    ColumnarSessionRepository,
+    CompressedArchive,
     JsonCourseRepository,
     JsonFileStore,
     JsonSessionRepository,
     JsonTopicRepository,
+    PlannerMetrics,
+    Profiler,
+    Recorder,
+    Recorders,
+    ReportCache,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteCourseRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+    SqliteTopicRepository,
+    instrument,
+    is_sqlite_spec,
+    sharded_scheme,
 )
+from src.adapters.sqlite_store import SQLITE_PREFIX
 from src.application import (
     AddTopicRequest,
     ApplicationError,
+    ApplicationValidationError,
+    ArchiveSessionsRequest,
     CompleteSessionRequest,
+    CompletionReport,
+    CourseRepository,
     CreateCourseRequest,
+    ListSessionsRequest,
     PlanSessionRequest,
+    RangeReport,
+    RangeReportRequest,
+    SessionAnalytics,
+    SessionRecord,
+    SessionRepository,
+    TopicRepository,
     WeeklyReportRequest,
     add_topic,
+    add_topics_bulk,
+    archive_sessions,
     complete_session,
     create_course,
     delete_course,
+    generate_completion_report,
+    generate_range_report,
+    generate_report_series,
     generate_weekly_report,
     list_courses,
-    list_sessions,
+    list_session_records,
     list_topics,
     plan_session,
+    plan_sessions_bulk,
+    purge_orphans,
     remove_topic,
 )
-from src.domain import CourseId, SessionId, TopicId
+from src.domain import CourseId, DomainValidationError, SessionId, TopicId
 
+from .daemon import (
+    DaemonCommand,
+    PlannerDaemon,
+    daemon_supported,
+    forward,
+    request_shutdown,
+    socket_path_for,
+)
+from .formats import (
+    COURSE_FIELDS,
+    OUTPUT_FORMATS,
+    RANGE_REPORT_FIELDS,
+    SESSION_FIELDS,
+    TOPIC_FIELDS,
+    WEEKLY_REPORT_FIELDS,
+    completion_report_record,
+    course_record,
+    range_report_record,
+    topic_record,
+    weekly_report_record,
+    write_completion_report,
+    write_lines,
+    write_records,
+    write_reports,
+)
+from .importer import IMPORT_FORMATS, read_records, session_requests, topic_requests
+
+
+REPORT_CACHE_SUFFIX = ".reports.json"
+ARCHIVE_SUFFIX = ".archive"
+
+
+def _date_argument(value: str) -> date:
+    """argparse ``type`` for ISO dates, so a bad one is a usage error."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r}, use YYYY-MM-DD") from None
+
+
+def _year_argument(value: str) -> int:
+    """argparse ``type`` for a year that ``date`` can represent."""
+    message = f"invalid year {value!r}, use {date.min.year}-{date.max.year}"
+    try:
+        year = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(message) from None
+    if not date.min.year <= year <= date.max.year:
+        raise argparse.ArgumentTypeError(message)
+    return year
 
-def _parse_date(value: str) -> date:
-    return date.fromisoformat(value)
+
+def _datetime_argument(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date and time {value!r}") from None
+
+
+@dataclass(frozen=True)
+class _Backend:
+    store: JsonFileStore | ShardedJsonStore | SqliteStore
+    course_repo: CourseRepository
+    topic_repo: TopicRepository
+    session_repo: SessionRepository
+    profiler: Profiler | None = None
+    metrics: PlannerMetrics | None = None
+    report_cache: ReportCache | None = None
+    # Cold storage and the session repository without it, for archiving.
+    archive_path: Path | None = None
+    live_session_repo: SessionRepository | None = None
+    # Columns of the live sessions, kept for the backend's lifetime (``stats``).
+    analytics: ColumnarSessionRepository | None = None
+
+
+def _instrumented(
+    backend: _Backend,
+    profiler: Profiler | None = None,
+    metrics: PlannerMetrics | None = None,
+) -> _Backend:
+    if profiler is None and metrics is None:
+        return backend
+    recorder: Recorder
+    if profiler is not None and metrics is not None:
+        recorder = Recorders(profiler, metrics)
+    else:
+        recorder = profiler if profiler is not None else metrics  # type: ignore[assignment]
+    return replace(
+        backend,
+        course_repo=instrument(backend.course_repo, "CourseRepository", recorder),
+        topic_repo=instrument(backend.topic_repo, "TopicRepository", recorder),
+        session_repo=instrument(backend.session_repo, "SessionRepository", recorder),
+        profiler=profiler,
+        metrics=metrics,
+    )
+
+
+def _collect_metrics(backend: _Backend) -> PlannerMetrics:
+    metrics = backend.metrics if backend.metrics is not None else PlannerMetrics()
+    metrics.collect_store(
+        backend.store.stats, backend.store.size_bytes(), backend.session_repo.count()
+    )
+    return metrics
+
+
+def _store_path(spec: str) -> Path:
+    return Path(spec.removeprefix(SQLITE_PREFIX)) if is_sqlite_spec(spec) else Path(spec)
+
+
+def _open_backend(namespace: argparse.Namespace) -> _Backend:
+    backend = _with_archive(_with_analytics(_open_store(namespace)), namespace)
+    if namespace.no_report_cache:
+        return backend
+    path = _store_path(namespace.store)
+    cache_path = path.with_name(path.name + REPORT_CACHE_SUFFIX)
+    return replace(backend, report_cache=ReportCache(backend.store.version, cache_path))
+
+
+def _with_archive(backend: _Backend, namespace: argparse.Namespace) -> _Backend:
+    """Serve sessions archived next to the store alongside the live ones."""
+    path = _store_path(namespace.store)
+    archive_path = path.with_name(path.name + ARCHIVE_SUFFIX)
+    archive = CompressedArchive(archive_path, stats=backend.store.stats)
+    return replace(
+        backend,
+        session_repo=ArchivedSessionRepository(backend.session_repo, archive),
+        archive_path=archive_path,
+        live_session_repo=backend.session_repo,
+    )
+
+
+def _with_analytics(backend: _Backend) -> _Backend:
+    """Keep one column table of live sessions, updated by writes, for the backend's life."""
+    columnar = ColumnarSessionRepository(backend.session_repo, backend.store.version)
+    return replace(backend, session_repo=columnar, analytics=columnar)
+
+
+@contextmanager
+def _transaction(backend: _Backend) -> Iterator[None]:
+    """The store's transaction; a rollback also drops the session columns."""
+    try:
+        with backend.store.transaction():
+            yield
+    except BaseException:
+        if backend.analytics is not None:
+            backend.analytics.discard()
+        raise
+
+
+def _open_store(namespace: argparse.Namespace) -> _Backend:
+    spec: str = namespace.store
+    if is_sqlite_spec(spec):
+        sqlite_store = SqliteStore(_store_path(spec))
+        return _Backend(
+            store=sqlite_store,
+            course_repo=SqliteCourseRepository(sqlite_store),
+            topic_repo=SqliteTopicRepository(sqlite_store),
+            session_repo=SqliteSessionRepository(sqlite_store),
+        )
+    scheme = sharded_scheme(Path(spec))
+    if scheme is not None and namespace.shard_by not in (None, scheme):
+        raise ApplicationValidationError(f"store is sharded by {scheme}")
+    if namespace.shard_by is not None or scheme is not None:
+        sharded_store = ShardedJsonStore(
+            Path(spec),
+            shard_by=namespace.shard_by,
+            journal=namespace.journal,
+            binary_snapshot=namespace.binary_snapshot,
+            compact_ids=namespace.compact_ids,
+        )
+        return _Backend(
+            store=sharded_store,
+            course_repo=JsonCourseRepository(sharded_store.catalog),
+            topic_repo=JsonTopicRepository(sharded_store.catalog),
+            session_repo=ShardedSessionRepository(sharded_store),
+        )
+    json_store = JsonFileStore(
+        Path(spec),
+        journal=namespace.journal,
+        binary_snapshot=namespace.binary_snapshot,
+        compact_ids=namespace.compact_ids,
+    )
+    return _Backend(
+        store=json_store,
+        course_repo=JsonCourseRepository(json_store),
+        topic_repo=JsonTopicRepository(json_store),
+        session_repo=JsonSessionRepository(json_store),
+    )
+
+
+def _add_period_arguments(parser: argparse.ArgumentParser) -> None:
+    period = parser.add_mutually_exclusive_group(required=True)
+    period.add_argument(
+        "--from", dest="start", type=_date_argument, help="First day (use with --to)"
+    )
+    period.add_argument("--month", help="Calendar month, YYYY-MM")
+    period.add_argument("--year", type=_year_argument, help="Calendar year")
+    parser.add_argument("--to", dest="end", type=_date_argument, help="Last day, inclusive")
 
 
-def _parse_datetime(value: str | None) -> datetime | None:
-    if value is None:
-        return None
-    return datetime.fromisoformat(value)
+def _add_format_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format (default: text)",
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="study-planner", description="Study Planner CLI")
     parser.add_argument(
         "--store",
-        type=Path,
-        default=Path("data/store.json"),
-        help="Path to JSON store file",
+        default="data/store.json",
+        help=(
+            "Path to the store file; a sqlite: prefix or a .db/.sqlite/.sqlite3 "
+            "extension selects the SQLite backend"
+        ),
+    )
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="Append mutations to a journal instead of rewriting the store",
+    )
+    parser.add_argument(
+        "--binary-snapshot",
+        action="store_true",
+        help=(
+            "Keep a binary copy of JSON store files (<file>.bin) for faster loads; "
+            "once it exists it is kept up to date without the flag"
+        ),
+    )
+    parser.add_argument(
+        "--compact-ids",
+        action="store_true",
+        help=(
+            "Write JSON store files with ids as integer keys into an id table; "
+            "files already in that format keep it without the flag"
+        ),
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_SCHEMES,
+        help=(
+            "Create the JSON store as a directory with one session file per "
+            "month or ISO week; existing sharded stores are detected automatically"
+        ),
+    )
+    parser.add_argument(
+        "--no-report-cache",
+        action="store_true",
+        help="Always recompute weekly reports instead of using the report cache",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run locally even when a daemon is serving the store",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-command timings of use cases, repository calls and store I/O",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="PATH",
+        help="Also write cProfile statistics to PATH (implies --profile)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help=(
+            "After each command, write Prometheus text metrics to PATH; counters "
+            "accumulate across runs via PATH.json"
+        ),
     )
 
     sub = parser.add_subparsers(dest="command", required=True)
@@ -55,9 +359,12 @@ def build_parser() -> argparse.ArgumentParser:
     add_course = sub.add_parser("add-course", help="Create a course")
     add_course.add_argument("name")
 
-    sub.add_parser("list-courses", help="List courses")
+    list_courses_parser = sub.add_parser("list-courses", help="List courses")
+    _add_format_argument(list_courses_parser)
 
-    delete_course_parser = sub.add_parser("delete-course", help="Delete a course")
+    delete_course_parser = sub.add_parser(
+        "delete-course", help="Delete a course with its topics and their sessions"
+    )
     delete_course_parser.add_argument("course_id")
 
     add_topic_parser = sub.add_parser("add-topic", help="Add a topic to a course")
@@ -66,106 +373,616 @@ def build_parser() -> argparse.ArgumentParser:
 
     list_topics_parser = sub.add_parser("list-topics", help="List topics for course")
     list_topics_parser.add_argument("course_id")
+    _add_format_argument(list_topics_parser)
 
-    remove_topic_parser = sub.add_parser("remove-topic", help="Remove a topic")
+    remove_topic_parser = sub.add_parser(
+        "remove-topic", help="Remove a topic and its sessions"
+    )
     remove_topic_parser.add_argument("topic_id")
 
     plan_session_parser = sub.add_parser("plan-session", help="Plan a study session")
     plan_session_parser.add_argument("topic_id")
-    plan_session_parser.add_argument("date")
+    plan_session_parser.add_argument("date", type=_date_argument)
     plan_session_parser.add_argument("duration_minutes", type=int)
 
     complete_session_parser = sub.add_parser(
         "complete-session", help="Mark session complete"
     )
     complete_session_parser.add_argument("session_id")
-    complete_session_parser.add_argument("--completed-at")
+    complete_session_parser.add_argument("--completed-at", type=_datetime_argument)
 
-    sub.add_parser("list-sessions", help="List sessions")
+    list_sessions_parser = sub.add_parser("list-sessions", help="List sessions")
+    list_sessions_parser.add_argument(
+        "--limit", type=int, help="Print at most this many sessions"
+    )
+    list_sessions_parser.add_argument(
+        "--after",
+        metavar="SESSION_ID",
+        help="Continue the listing after this session (the last id of a previous page)",
+    )
+    list_sessions_parser.add_argument("--course", help="Only sessions of this course's topics")
+    list_sessions_parser.add_argument("--topic", help="Only sessions of this topic")
+    list_sessions_parser.add_argument(
+        "--from", dest="start", type=_date_argument, help="First day, inclusive"
+    )
+    list_sessions_parser.add_argument(
+        "--to", dest="end", type=_date_argument, help="Last day, inclusive"
+    )
+    status = list_sessions_parser.add_mutually_exclusive_group()
+    status.add_argument(
+        "--completed",
+        dest="completed",
+        action="store_const",
+        const=True,
+        default=None,
+        help="Only completed sessions",
+    )
+    status.add_argument(
+        "--pending",
+        dest="completed",
+        action="store_const",
+        const=False,
+        help="Only sessions not yet completed",
+    )
+    _add_format_argument(list_sessions_parser)
 
     report_parser = sub.add_parser("weekly-report", help="Generate weekly report")
-    report_parser.add_argument("week_start")
+    report_parser.add_argument("week_start", type=_date_argument)
+    _add_format_argument(report_parser)
+
+    range_parser = sub.add_parser(
+        "report", help="Report minutes over a date range, month or year"
+    )
+    _add_period_arguments(range_parser)
+    range_parser.add_argument(
+        "--weekly",
+        action="store_true",
+        help="Emit one report per 7 days from the start instead of one total",
+    )
+    _add_format_argument(range_parser)
+
+    stats_parser = sub.add_parser(
+        "stats",
+        help="Planned versus completed sessions and minutes over a date range, month or year",
+    )
+    _add_period_arguments(stats_parser)
+    _add_format_argument(stats_parser)
+
+    import_parser = sub.add_parser(
+        "import", help="Bulk import topics or sessions from CSV or NDJSON"
+    )
+    import_parser.add_argument("kind", choices=("topics", "sessions"))
+    import_parser.add_argument("source", help="File to read, or - for stdin")
+    import_parser.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        help="Input format; inferred from the file extension when omitted",
+    )
+
+    batch_parser = sub.add_parser(
+        "batch", help="Run many commands, one per line, against one loaded store"
+    )
+    batch_parser.add_argument("source", help="Script file to read, or - for stdin")
+
+    serve_parser = sub.add_parser(
+        "serve", help="Keep the store loaded and serve commands over a Unix socket"
+    )
+    serve_parser.add_argument(
+        "--stop", action="store_true", help="Stop the daemon serving the store"
+    )
+
+    archive_parser = sub.add_parser(
+        "archive", help="Move completed sessions before a date to compressed storage"
+    )
+    archive_parser.add_argument(
+        "--before",
+        required=True,
+        type=_date_argument,
+        help="First day to keep in the store, YYYY-MM-DD",
+    )
+    archive_parser.add_argument(
+        "--codec",
+        choices=ARCHIVE_CODECS,
+        help="Compression for a new archive (default gzip); must match an existing one",
+    )
+
+    sub.add_parser(
+        "purge-orphans",
+        help="Remove topics of deleted courses and sessions of deleted topics",
+    )
+
+    sub.add_parser(
+        "compact", help="Fold the journal into the snapshot (JSON) or checkpoint (SQLite)"
+    )
+
+    metrics_parser = sub.add_parser(
+        "metrics", help="Print planner metrics in Prometheus text format"
+    )
+    metrics_parser.add_argument(
+        "--json", action="store_true", help="Print a JSON snapshot instead"
+    )
 
     return parser
 
 
-def run(args: list[str] | None = None) -> int:
-    parser = build_parser()
-    namespace = parser.parse_args(args=args)
+_USER_ERRORS = (ApplicationError, DomainValidationError)
+
+# Commands that cannot run as a line inside a batch script.
+_NON_BATCH_COMMANDS = frozenset({"batch", "serve"})
+
+# Commands a running daemon answers; import and batch read local files.
+_DAEMON_COMMANDS = frozenset(
+    {
+        "add-course",
+        "list-courses",
+        "delete-course",
+        "add-topic",
+        "list-topics",
+        "remove-topic",
+        "plan-session",
+        "complete-session",
+        "list-sessions",
+        "weekly-report",
+        "report",
+        "stats",
+        "archive",
+        "purge-orphans",
+        "compact",
+        "metrics",
+    }
+)
+_READ_ONLY_COMMANDS = frozenset(
+    {
+        "list-courses",
+        "list-topics",
+        "list-sessions",
+        "weekly-report",
+        "report",
+        "stats",
+        "metrics",
+    }
+)
+
 
-    store = JsonFileStore(namespace.store)
-    course_repo = JsonCourseRepository(store)
-    topic_repo = JsonTopicRepository(store)
-    session_repo = JsonSessionRepository(store)
+# Use case behind each command, as named in profiles.
+_USE_CASES = {
+    "add-course": "create_course",
+    "list-courses": "list_courses",
+    "delete-course": "delete_course",
+    "add-topic": "add_topic",
+    "list-topics": "list_topics",
+    "remove-topic": "remove_topic",
+    "plan-session": "plan_session",
+    "complete-session": "complete_session",
+    "list-sessions": "list_session_records",
+    "weekly-report": "generate_weekly_report",
+    "report": "generate_range_report",
+    "stats": "generate_completion_report",
+    "archive": "archive_sessions",
+    "purge-orphans": "purge_orphans",
+}
 
+
+def _execute(namespace: argparse.Namespace, backend: _Backend, out: TextIO) -> None:
+    if backend.profiler is None and backend.metrics is None:
+        _dispatch(namespace, backend, out)
+        return
+    use_case = _USE_CASES.get(namespace.command, namespace.command)
+    started = time.perf_counter()
     try:
-        if namespace.command == "add-course":
-            course = create_course(CreateCourseRequest(name=namespace.name), course_repo)
-            print(f"{course.course_id} {course.name}")
-        elif namespace.command == "list-courses":
-            for course in list_courses(course_repo):
-                print(f"{course.course_id} {course.name}")
-        elif namespace.command == "delete-course":
-            delete_course(CourseId(namespace.course_id), course_repo)
-            print("deleted")
-        elif namespace.command == "add-topic":
-            topic = add_topic(
-                AddTopicRequest(course_id=CourseId(namespace.course_id), name=namespace.name),
-                course_repo,
-                topic_repo,
+        _dispatch(namespace, backend, out)
+    finally:
+        seconds = time.perf_counter() - started
+        if backend.profiler is not None:
+            backend.profiler.record(f"use case {use_case}", seconds)
+        if backend.metrics is not None:
+            backend.metrics.observe_use_case(use_case, seconds)
+
+
+def _dispatch(namespace: argparse.Namespace, backend: _Backend, out: TextIO) -> None:
+    store = backend.store
+    course_repo = backend.course_repo
+    topic_repo = backend.topic_repo
+    session_repo = backend.session_repo
+
+    if namespace.command == "add-course":
+        course = create_course(CreateCourseRequest(name=namespace.name), course_repo)
+        print(f"{course.course_id} {course.name}", file=out)
+    elif namespace.command == "list-courses":
+        courses = list_courses(course_repo)
+        if namespace.format == "text":
+            for course in courses:
+                print(f"{course.course_id} {course.name}", file=out)
+        else:
+            write_records(out, map(course_record, courses), namespace.format, COURSE_FIELDS)
+    elif namespace.command == "delete-course":
+        delete_course(
+            CourseId(namespace.course_id), course_repo, topic_repo, session_repo, store
+        )
+        print("deleted", file=out)
+    elif namespace.command == "add-topic":
+        topic = add_topic(
+            AddTopicRequest(course_id=CourseId(namespace.course_id), name=namespace.name),
+            course_repo,
+            topic_repo,
+            store,
+        )
+        print(f"{topic.topic_id} {topic.name}", file=out)
+    elif namespace.command == "list-topics":
+        topics = list_topics(CourseId(namespace.course_id), topic_repo)
+        if namespace.format == "text":
+            for topic in topics:
+                print(f"{topic.topic_id} {topic.name}", file=out)
+        else:
+            write_records(out, map(topic_record, topics), namespace.format, TOPIC_FIELDS)
+    elif namespace.command == "remove-topic":
+        remove_topic(TopicId(namespace.topic_id), topic_repo, session_repo, store)
+        print("removed", file=out)
+    elif namespace.command == "plan-session":
+        session = plan_session(
+            PlanSessionRequest(
+                topic_id=TopicId(namespace.topic_id),
+                scheduled_date=namespace.date,
+                duration_minutes=namespace.duration_minutes,
+            ),
+            topic_repo,
+            session_repo,
+            store,
+        )
+        print(
+            f"{session.session_id} {session.scheduled_date} {session.duration.value}",
+            file=out,
+        )
+    elif namespace.command == "complete-session":
+        session = complete_session(
+            CompleteSessionRequest(
+                session_id=SessionId(namespace.session_id),
+                completed_at=namespace.completed_at,
+            ),
+            session_repo,
+            store,
+        )
+        print(f"{session.session_id} completed={session.completed}", file=out)
+    elif namespace.command == "list-sessions":
+        # Records go straight from the store to the writer, without sessions.
+        records = list_session_records(
+            session_repo,
+            ListSessionsRequest(
+                limit=namespace.limit,
+                after=SessionId(namespace.after) if namespace.after else None,
+                course_id=CourseId(namespace.course) if namespace.course else None,
+                topic_id=TopicId(namespace.topic) if namespace.topic else None,
+                start=namespace.start,
+                end=namespace.end,
+                completed=namespace.completed,
+            ),
+            topic_repo,
+        )
+        if namespace.format == "text":
+            write_lines(out, map(_session_line, records))
+        else:
+            write_records(out, records, namespace.format, SESSION_FIELDS)
+    elif namespace.command == "weekly-report":
+        report = generate_weekly_report(
+            WeeklyReportRequest(week_start=namespace.week_start),
+            course_repo,
+            topic_repo,
+            session_repo,
+            backend.report_cache,
+        )
+        if namespace.format != "text":
+            write_reports(
+                out, [weekly_report_record(report)], namespace.format, WEEKLY_REPORT_FIELDS
             )
-            print(f"{topic.topic_id} {topic.name}")
-        elif namespace.command == "list-topics":
-            for topic in list_topics(CourseId(namespace.course_id), topic_repo):
-                print(f"{topic.topic_id} {topic.name}")
-        elif namespace.command == "remove-topic":
-            remove_topic(TopicId(namespace.topic_id), topic_repo)
-            print("removed")
-        elif namespace.command == "plan-session":
-            session = plan_session(
-                PlanSessionRequest(
-                    topic_id=TopicId(namespace.topic_id),
-                    scheduled_date=_parse_date(namespace.date),
-                    duration_minutes=namespace.duration_minutes,
-                ),
-                topic_repo,
-                session_repo,
+            return
+        print(f"week_start={report.week_start}", file=out)
+        print(f"total_minutes={report.total_minutes}", file=out)
+        for course_id, minutes in report.minutes_by_course.items():
+            print(f"course {course_id} {minutes}", file=out)
+        for topic_id, minutes in report.minutes_by_topic.items():
+            print(f"topic {topic_id} {minutes}", file=out)
+    elif namespace.command == "report":
+        request = _range_request(namespace)
+        if namespace.weekly:
+            reports = generate_report_series(request, course_repo, topic_repo, session_repo)
+        else:
+            reports = [generate_range_report(request, course_repo, topic_repo, session_repo)]
+        if namespace.format != "text":
+            write_reports(
+                out,
+                [range_report_record(range_report) for range_report in reports],
+                namespace.format,
+                RANGE_REPORT_FIELDS,
+                series=namespace.weekly,
             )
-            print(f"{session.session_id} {session.scheduled_date} {session.duration.value}")
-        elif namespace.command == "complete-session":
-            session = complete_session(
-                CompleteSessionRequest(
-                    session_id=SessionId(namespace.session_id),
-                    completed_at=_parse_datetime(namespace.completed_at),
-                ),
-                session_repo,
+            return
+        for index, range_report in enumerate(reports):
+            if index:
+                print(file=out)
+            _print_range_report(range_report, out)
+    elif namespace.command == "stats":
+        # Completion state is not rolled up; it is summed over the live
+        # session columns plus the archived months the period overlaps.
+        completion = generate_completion_report(
+            _range_request(namespace),
+            course_repo,
+            topic_repo,
+            cast(SessionAnalytics, session_repo),
+        )
+        if namespace.format != "text":
+            write_completion_report(
+                out, completion_report_record(completion), namespace.format
             )
-            print(f"{session.session_id} completed={session.completed}")
-        elif namespace.command == "list-sessions":
-            for session in list_sessions(session_repo):
-                print(
-                    f"{session.session_id} {session.topic_id} "
-                    f"{session.scheduled_date} {session.duration.value} "
-                    f"completed={session.completed}"
-                )
-        elif namespace.command == "weekly-report":
-            report = generate_weekly_report(
-                WeeklyReportRequest(week_start=_parse_date(namespace.week_start)),
-                course_repo,
-                topic_repo,
-                session_repo,
+            return
+        _print_completion_report(completion, out)
+    elif namespace.command == "import":
+        records = read_records(namespace.source, namespace.format)
+        if namespace.kind == "topics":
+            topics = add_topics_bulk(
+                topic_requests(records), course_repo, topic_repo, store
             )
-            print(f"week_start={report.week_start}")
-            print(f"total_minutes={report.total_minutes}")
-            for course_id, minutes in report.minutes_by_course.items():
-                print(f"course {course_id} {minutes}")
-            for topic_id, minutes in report.minutes_by_topic.items():
-                print(f"topic {topic_id} {minutes}")
+            print(f"imported {len(topics)} topics", file=out)
         else:
-            parser.error("unknown command")
-    except ApplicationError as exc:
+            sessions = plan_sessions_bulk(
+                session_requests(records), topic_repo, session_repo, store
+            )
+            print(f"imported {len(sessions)} sessions", file=out)
+    elif namespace.command == "archive":
+        assert backend.archive_path is not None and backend.live_session_repo is not None
+        archive = CompressedArchive(backend.archive_path, stats=store.stats)
+        if namespace.codec is not None and namespace.codec != archive.codec:
+            if archive.count():
+                raise ApplicationValidationError(
+                    f"archive is compressed with {archive.codec}"
+                )
+            archive = CompressedArchive(backend.archive_path, namespace.codec, store.stats)
+        moved = archive_sessions(
+            ArchiveSessionsRequest(before=namespace.before),
+            backend.live_session_repo,
+            archive,
+            store,
+        )
+        print(f"archived {moved} sessions", file=out)
+    elif namespace.command == "purge-orphans":
+        purged = purge_orphans(course_repo, topic_repo, session_repo, store)
+        print(
+            f"purged {purged.topics_removed} topics, {purged.sessions_removed} sessions",
+            file=out,
+        )
+    elif namespace.command == "compact":
+        store.compact()
+        print("compacted", file=out)
+    elif namespace.command == "metrics":
+        registry = _collect_metrics(backend).registry
+        if namespace.json:
+            print(json.dumps(registry.snapshot(), indent=2), file=out)
+        else:
+            out.write(registry.render_prometheus())
+    else:
+        raise ApplicationError(f"unknown command: {namespace.command}")
+
+
+def _session_line(record: SessionRecord) -> str:
+    return (
+        f"{record['session_id']} {record['topic_id']} {record['scheduled_date']} "
+        f"{record['duration_minutes']} completed={record['completed']}"
+    )
+
+
+def _range_request(namespace: argparse.Namespace) -> RangeReportRequest:
+    if namespace.end is not None and namespace.start is None:
+        raise ApplicationValidationError("--to requires --from")
+    if namespace.month is not None:
+        try:
+            year, month = (int(part) for part in namespace.month.split("-"))
+            return RangeReportRequest.for_month(year, month)
+        except ValueError as exc:
+            raise ApplicationValidationError("--month must be YYYY-MM") from exc
+    if namespace.year is not None:
+        return RangeReportRequest.for_year(namespace.year)
+    if namespace.end is None:
+        raise ApplicationValidationError("--from requires --to")
+    return RangeReportRequest(start=namespace.start, end=namespace.end)
+
+
+def _print_range_report(report: RangeReport, out: TextIO) -> None:
+    print(f"start={report.start}", file=out)
+    print(f"end={report.end}", file=out)
+    print(f"total_minutes={report.total_minutes}", file=out)
+    for course_id, minutes in report.minutes_by_course.items():
+        print(f"course {course_id} {minutes}", file=out)
+    for topic_id, minutes in report.minutes_by_topic.items():
+        print(f"topic {topic_id} {minutes}", file=out)
+
+
+def _print_completion_report(report: CompletionReport, out: TextIO) -> None:
+    total = report.total
+    print(f"start={report.start}", file=out)
+    print(f"end={report.end}", file=out)
+    print(f"sessions={total.sessions} completed={total.completed_sessions}", file=out)
+    print(f"minutes={total.minutes} completed={total.completed_minutes}", file=out)
+    for scope, items in (("course", report.by_course), ("topic", report.by_topic)):
+        for item_id, totals in items.items():
+            print(
+                f"{scope} {item_id} {totals.completed_sessions}/{totals.sessions} sessions "
+                f"{totals.completed_minutes}/{totals.minutes} minutes",
+                file=out,
+            )
+
+
+def _run_batch(
+    parser: argparse.ArgumentParser, source: str, backend: _Backend, out: TextIO
+) -> int:
+    """Run one subcommand per line against the already opened backend.
+
+    Lines use the same grammar as the command line (without global options);
+    blank lines and ``#`` comments are skipped. A failing line, including one
+    that does not parse or fails with an unexpected error, is reported and the
+    batch carries on; the exit code is 1 if any line failed.
+    """
+    exit_code = 0
+    try:
+        handle = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    except OSError as exc:
+        raise ApplicationValidationError(f"cannot read {source}: {exc.strerror}") from exc
+    try:
+        for number, line in enumerate(handle, start=1):
+            try:
+                tokens = shlex.split(line, comments=True)
+                if not tokens:
+                    continue
+                namespace = parser.parse_args(tokens)
+            except (SystemExit, ValueError):
+                print(f"error: line {number}: invalid command", file=out)
+                exit_code = 1
+                continue
+            if namespace.command in _NON_BATCH_COMMANDS:
+                print(
+                    f"error: line {number}: {namespace.command} is not allowed in a batch",
+                    file=out,
+                )
+                exit_code = 1
+                continue
+            try:
+                _execute(namespace, backend, out)
+            except Exception as exc:
+                # Like the daemon: one line's failure never discards the others.
+                print(f"error: line {number}: {exc}", file=out)
+                exit_code = 1
+            out.flush()
+    except UnicodeDecodeError as exc:
+        raise ApplicationValidationError(f"cannot read {source}: not UTF-8 text") from exc
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    return exit_code
+
+
+def _prepare_daemon_command(
+    parser: argparse.ArgumentParser,
+    backend: _Backend,
+    args: list[str],
+    metrics_file: str | None = None,
+) -> DaemonCommand:
+    try:
+        namespace = parser.parse_args(args)
+    except SystemExit:
+        return DaemonCommand(read_only=True, run=_fail("invalid command"))
+    if namespace.command not in _DAEMON_COMMANDS:
+        return DaemonCommand(
+            read_only=True, run=_fail(f"{namespace.command} is not served by the daemon")
+        )
+
+    def run_command(out: TextIO) -> int:
+        try:
+            _execute(namespace, backend, out)
+        except _USER_ERRORS as exc:
+            print(f"error: {exc}", file=out)
+            return 1
+        finally:
+            if metrics_file is not None:
+                _collect_metrics(backend).write(Path(metrics_file))
+        return 0
+
+    return DaemonCommand(
+        read_only=namespace.command in _READ_ONLY_COMMANDS, run=run_command
+    )
+
+
+def _fail(message: str) -> Callable[[TextIO], int]:
+    def run_command(out: TextIO) -> int:
+        print(f"error: {message}", file=out)
+        return 1
+
+    return run_command
+
+
+def _serve(
+    parser: argparse.ArgumentParser, namespace: argparse.Namespace, backend: _Backend
+) -> int:
+    if not daemon_supported():
+        raise ApplicationError("serve requires Unix domain sockets")
+    socket_path = socket_path_for(_store_path(namespace.store))
+    if namespace.stop:
+        if not request_shutdown(socket_path):
+            raise ApplicationError("no daemon is running")
+        print("stopped")
+        return 0
+    # The daemon always keeps metrics; the metrics command reads them.
+    backend = _instrumented(backend, backend.profiler, backend.metrics or PlannerMetrics())
+    daemon = PlannerDaemon(
+        socket_path,
+        lambda args: _prepare_daemon_command(
+            parser, backend, args, namespace.metrics_file
+        ),
+        lambda: _transaction(backend),
+    )
+    print(f"serving on {socket_path}", flush=True)
+    asyncio.run(daemon.serve())
+    return 0
+
+
+@contextmanager
+def _profiling(namespace: argparse.Namespace, backend: _Backend) -> Iterator[None]:
+    if backend.profiler is None:
+        yield
+        return
+    profile = cProfile.Profile() if namespace.profile_output else None
+    if profile is not None:
+        profile.enable()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(namespace.profile_output)
+        report = backend.profiler.report(namespace.command, backend.store.stats)
+        print(report, file=sys.stderr)
+
+
+def run(args: list[str] | None = None) -> int:
+    parser = build_parser()
+    argv = list(sys.argv[1:] if args is None else args)
+    namespace = parser.parse_args(args=argv)
+    profiling = namespace.profile or namespace.profile_output is not None
+    metrics_file = None if namespace.command == "serve" else namespace.metrics_file
+
+    # Profiles and metrics files describe local execution, so they never go
+    # through the daemon.
+    local = namespace.no_daemon or profiling or metrics_file is not None
+    if namespace.command in _DAEMON_COMMANDS and not local:
+        socket_path = socket_path_for(_store_path(namespace.store))
+        exit_code = forward(socket_path, argv, sys.stdout)
+        if exit_code is not None:
+            return exit_code
+
+    metrics = None
+    if metrics_file is not None:
+        metrics = PlannerMetrics()
+        metrics.load(Path(metrics_file))
+    try:
+        backend = _instrumented(
+            _open_backend(namespace), Profiler() if profiling else None, metrics
+        )
+    except _USER_ERRORS as exc:
+        print(f"error: {exc}")
+        return 1
+    try:
+        if namespace.command == "serve":
+            return _serve(parser, namespace, backend)
+        with _profiling(namespace, backend), _transaction(backend):
+            if namespace.command == "batch":
+                return _run_batch(parser, namespace.source, backend, sys.stdout)
+            _execute(namespace, backend, sys.stdout)
+    except _USER_ERRORS as exc:
         print(f"error: {exc}")
         return 1
+    finally:
+        try:
+            if metrics_file is not None:
+                _collect_metrics(backend).write(Path(metrics_file))
+        finally:
+            backend.store.close()
 
     return 0
 
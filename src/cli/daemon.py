@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import signal
+import socket
+import threading
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ContextManager, TextIO
+
+from src.application import ApplicationError
+
+SOCKET_SUFFIX = ".sock"
+
+
+@dataclass(frozen=True)
+class DaemonCommand:
+    """A parsed request: whether it only reads, and how to run it."""
+
+    read_only: bool
+    run: Callable[[TextIO], int]
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path_for(store_path: Path) -> Path:
+    return store_path.with_name(store_path.name + SOCKET_SUFFIX)
+
+
+def _request(socket_path: Path, payload: dict) -> dict | None:
+    if not daemon_supported() or not socket_path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ApplicationError("daemon closed the connection without a response")
+    return json.loads(line)
+
+
+def forward(socket_path: Path, args: list[str], out: TextIO) -> int | None:
+    """Run ``args`` on the daemon serving ``socket_path``.
+
+    Returns the command's exit code, or ``None`` when no daemon is listening
+    so the caller can run the command locally.
+    """
+    response = _request(socket_path, {"args": args})
+    if response is None:
+        return None
+    out.write(response["output"])
+    return int(response["exit_code"])
+
+
+def request_shutdown(socket_path: Path) -> bool:
+    return _request(socket_path, {"shutdown": True}) is not None
+
+
+class PlannerDaemon:
+    """Serve CLI requests over a Unix socket from one loaded store.
+
+    Each request is one JSON line, ``{"args": [...]}``, answered with
+    ``{"exit_code": ..., "output": ...}``. Read-only commands run as soon as
+    they arrive. Mutating commands are queued to a single writer task, which
+    drains everything pending and runs it in one store transaction (group
+    commit) before answering any of them. A line that is not a valid request
+    is answered with an error and the connection stays open.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        prepare: Callable[[list[str]], DaemonCommand],
+        transaction: Callable[[], ContextManager[None]],
+    ) -> None:
+        self._socket_path = socket_path
+        self._prepare = prepare
+        self._transaction = transaction
+        self._queue: asyncio.Queue[tuple[DaemonCommand, asyncio.Future]] | None = None
+        self._stopped: asyncio.Event | None = None
+
+    async def serve(self) -> None:
+        self._queue = asyncio.Queue()
+        self._stopped = asyncio.Event()
+        self._claim_socket()
+        server = await asyncio.start_unix_server(self._handle, path=str(self._socket_path))
+        writer = asyncio.create_task(self._write_loop())
+        loop = asyncio.get_running_loop()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, self._stopped.set)
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            writer.cancel()
+            with suppress(asyncio.CancelledError):
+                await writer
+            self._socket_path.unlink(missing_ok=True)
+
+    def _claim_socket(self) -> None:
+        if not self._socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self._socket_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Left behind by a daemon that did not shut down cleanly.
+                self._socket_path.unlink(missing_ok=True)
+                return
+        raise ApplicationError(f"a daemon is already serving {self._socket_path}")
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        assert self._queue is not None and self._stopped is not None
+        try:
+            while line := await reader.readline():
+                request = _parse_request(line)
+                if request is None:
+                    response = {"exit_code": 1, "output": "error: malformed request\n"}
+                elif request.get("shutdown"):
+                    response = {"exit_code": 0, "output": ""}
+                    self._stopped.set()
+                else:
+                    command = self._prepare(list(request["args"]))
+                    if command.read_only:
+                        exit_code, output = _run(command)
+                    else:
+                        done = asyncio.get_running_loop().create_future()
+                        await self._queue.put((command, done))
+                        exit_code, output = await done
+                    response = {"exit_code": exit_code, "output": output}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def _write_loop(self) -> None:
+        assert self._queue is not None
+        while True:
+            group = [await self._queue.get()]
+            # Let concurrently arriving writes join this commit.
+            await asyncio.sleep(0)
+            while not self._queue.empty():
+                group.append(self._queue.get_nowait())
+            results = self._commit([command for command, _ in group])
+            for (_, done), result in zip(group, results):
+                if not done.done():
+                    done.set_result(result)
+
+    def _commit(self, commands: list[DaemonCommand]) -> list[tuple[int, str]]:
+        """Run ``commands`` in one transaction and return each one's result.
+
+        If the transaction fails it is rolled back, and with more than one
+        command each is retried in a transaction of its own, so only the one
+        that failed reports an error.
+        """
+        try:
+            results = []
+            with self._transaction():
+                for command in commands:
+                    out = io.StringIO()
+                    results.append((command.run(out), out.getvalue()))
+            return results
+        except Exception as exc:
+            if len(commands) == 1:
+                return [(1, f"error: {exc}\n")]
+        return [self._commit([command])[0] for command in commands]
+
+
+def _parse_request(line: bytes) -> dict | None:
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(request, dict):
+        return None
+    if request.get("shutdown"):
+        return request
+    args = request.get("args")
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        return None
+    return request
+
+
+def _run(command: DaemonCommand) -> tuple[int, str]:
+    out = io.StringIO()
+    try:
+        exit_code = command.run(out)
+    except Exception as exc:
+        return 1, f"error: {exc}\n"
+    return exit_code, out.getvalue()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from operator import itemgetter
+from typing import Iterable, Iterator, Mapping, TextIO, TypeVar
+
+from src.adapters.json_store import compact_json
+from src.application import CompletionReport, CompletionTotals, RangeReport, WeeklyReport
+from src.domain import Course, Topic
+
+T = TypeVar("T")
+
+OUTPUT_FORMATS = ("text", "json", "ndjson", "csv")
+
+COURSE_FIELDS = ("course_id", "name")
+TOPIC_FIELDS = ("topic_id", "course_id", "name")
+SESSION_FIELDS = (
+    "session_id",
+    "topic_id",
+    "scheduled_date",
+    "duration_minutes",
+    "completed",
+    "completed_at",
+)
+WEEKLY_REPORT_FIELDS = ("week_start",)
+RANGE_REPORT_FIELDS = ("start", "end")
+COMPLETION_FIELDS = ("sessions", "completed_sessions", "minutes", "completed_minutes")
+
+# Report totals flattened to one CSV row per course, topic and overall total.
+_REPORT_ROW_FIELDS = ("scope", "id", "minutes")
+
+# Records serialised per write when streaming a listing.
+WRITE_BATCH = 1024
+
+
+def _batches(items: Iterable[T], size: int = WRITE_BATCH) -> Iterator[list[T]]:
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_lines(out: TextIO, lines: Iterable[str]) -> None:
+    """Write lines in batches, so long listings stream without a call per line."""
+    for batch in _batches(lines):
+        out.write("\n".join(batch) + "\n")
+
+
+def write_records(
+    out: TextIO, records: Iterable[Mapping], fmt: str, fields: tuple[str, ...]
+) -> None:
+    """Stream records as one JSON array, NDJSON lines or CSV with a header row.
+
+    Records are consumed and written ``WRITE_BATCH`` at a time, so memory
+    stays flat however long the listing is.
+    """
+    if fmt == "json":
+        out.write("[")
+        separator = ""
+        for batch in _batches(records):
+            out.write(separator + ",\n".join(map(compact_json, batch)))
+            separator = ",\n"
+        out.write("]\n")
+    elif fmt == "ndjson":
+        for batch in _batches(records):
+            out.write("\n".join(map(compact_json, batch)) + "\n")
+    elif fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(fields)
+        row = itemgetter(*fields)
+        for batch in _batches(records):
+            writer.writerows(map(row, batch))
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        out.write(buffer.getvalue())
+    else:
+        raise ValueError(f"unknown output format: {fmt}")
+
+
+def write_reports(
+    out: TextIO,
+    reports: list[dict],
+    fmt: str,
+    period_fields: tuple[str, ...],
+    series: bool = False,
+) -> None:
+    """Write report records; JSON is one object, or an array for a ``series``.
+
+    CSV flattens each report to ``scope,id,minutes`` rows (scope ``total``,
+    ``course`` or ``topic``) prefixed by its period columns.
+    """
+    if fmt == "json":
+        out.write(json.dumps(reports if series else reports[0], indent=2) + "\n")
+    elif fmt == "csv":
+        write_records(
+            out, _report_rows(reports, period_fields), fmt, period_fields + _REPORT_ROW_FIELDS
+        )
+    else:
+        write_records(out, reports, fmt, ())
+
+
+def write_completion_report(out: TextIO, report: dict, fmt: str) -> None:
+    """Write a completion report; CSV has one ``scope,id`` row per total."""
+    if fmt == "json":
+        out.write(json.dumps(report, indent=2) + "\n")
+    elif fmt == "csv":
+        write_records(
+            out,
+            _completion_rows(report),
+            fmt,
+            RANGE_REPORT_FIELDS + ("scope", "id") + COMPLETION_FIELDS,
+        )
+    else:
+        write_records(out, [report], fmt, ())
+
+
+def _completion_rows(report: dict) -> Iterator[dict]:
+    period = {name: report[name] for name in RANGE_REPORT_FIELDS}
+    yield {**period, "scope": "total", "id": "", **report["total"]}
+    for scope, key in (("course", "by_course"), ("topic", "by_topic")):
+        for item_id, totals in report[key].items():
+            yield {**period, "scope": scope, "id": item_id, **totals}
+
+
+def _report_rows(reports: list[dict], period_fields: tuple[str, ...]) -> Iterator[dict]:
+    for report in reports:
+        period = {name: report[name] for name in period_fields}
+        yield {**period, "scope": "total", "id": "", "minutes": report["total_minutes"]}
+        for scope, key in (("course", "minutes_by_course"), ("topic", "minutes_by_topic")):
+            for item_id, minutes in report[key].items():
+                yield {**period, "scope": scope, "id": item_id, "minutes": minutes}
+
+
+def course_record(course: Course) -> dict:
+    return {"course_id": course.course_id, "name": course.name}
+
+
+def topic_record(topic: Topic) -> dict:
+    return {"topic_id": topic.topic_id, "course_id": topic.course_id, "name": topic.name}
+
+
+def weekly_report_record(report: WeeklyReport) -> dict:
+    return {
+        "week_start": report.week_start.isoformat(),
+        "total_minutes": report.total_minutes,
+        "minutes_by_course": report.minutes_by_course,
+        "minutes_by_topic": report.minutes_by_topic,
+    }
+
+
+def range_report_record(report: RangeReport) -> dict:
+    return {
+        "start": report.start.isoformat(),
+        "end": report.end.isoformat(),
+        "total_minutes": report.total_minutes,
+        "minutes_by_course": report.minutes_by_course,
+        "minutes_by_topic": report.minutes_by_topic,
+    }
+
+
+def _totals_record(totals: CompletionTotals) -> dict:
+    return {
+        "sessions": totals.sessions,
+        "completed_sessions": totals.completed_sessions,
+        "minutes": totals.minutes,
+        "completed_minutes": totals.completed_minutes,
+    }
+
+
+def completion_report_record(report: CompletionReport) -> dict:
+    return {
+        "start": report.start.isoformat(),
+        "end": report.end.isoformat(),
+        "total": _totals_record(report.total),
+        "by_course": {
+            course_id: _totals_record(totals) for course_id, totals in report.by_course.items()
+        },
+        "by_topic": {
+            topic_id: _totals_record(totals) for topic_id, totals in report.by_topic.items()
+        },
+    }
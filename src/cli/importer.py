@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+from src.application import AddTopicRequest, ApplicationValidationError, PlanSessionRequest
+from src.domain import CourseId, TopicId
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+_FORMAT_BY_SUFFIX = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def _detect_format(source: str, fmt: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    if source == "-":
+        return "ndjson"
+    detected = _FORMAT_BY_SUFFIX.get(Path(source).suffix.lower())
+    if detected is None:
+        raise ApplicationValidationError(
+            f"cannot infer import format from {source!r}; pass --format"
+        )
+    return detected
+
+
+def read_records(source: str, fmt: str | None = None) -> list[dict]:
+    """Read import rows from a CSV/NDJSON file, or stdin when ``source`` is ``-``."""
+    fmt = _detect_format(source, fmt)
+    if source == "-":
+        text = sys.stdin.read()
+    else:
+        try:
+            text = Path(source).read_text(encoding="utf-8")
+        except OSError as exc:
+            raise ApplicationValidationError(f"cannot read {source}: {exc.strerror}") from exc
+        except UnicodeDecodeError as exc:
+            raise ApplicationValidationError(f"cannot read {source}: not UTF-8 text") from exc
+    if fmt == "csv":
+        return list(csv.DictReader(io.StringIO(text)))
+    records = []
+    for row, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ApplicationValidationError(f"row {row}: invalid JSON") from exc
+        if not isinstance(record, dict):
+            raise ApplicationValidationError(f"row {row}: expected a JSON object")
+        records.append(record)
+    return records
+
+
+def _field(record: dict, row: int, name: str) -> str:
+    value = record.get(name)
+    if value is None or value == "":
+        raise ApplicationValidationError(f"row {row}: missing {name}")
+    return str(value)
+
+
+def topic_requests(records: list[dict]) -> list[AddTopicRequest]:
+    return [
+        AddTopicRequest(
+            course_id=CourseId(_field(record, row, "course_id")),
+            name=_field(record, row, "name"),
+        )
+        for row, record in enumerate(records, start=1)
+    ]
+
+
+def session_requests(records: list[dict]) -> list[PlanSessionRequest]:
+    requests = []
+    for row, record in enumerate(records, start=1):
+        try:
+            scheduled_date = date.fromisoformat(_field(record, row, "date"))
+            duration_minutes = int(_field(record, row, "duration_minutes"))
+        except ValueError as exc:
+            raise ApplicationValidationError(f"row {row}: {exc}") from exc
+        requests.append(
+            PlanSessionRequest(
+                topic_id=TopicId(_field(record, row, "topic_id")),
+                scheduled_date=scheduled_date,
+                duration_minutes=duration_minutes,
+            )
+        )
+    return requests
@@ -7,7 +7,10 @@ from .errors import DomainValidationError
 from .value_objects import CourseId, DurationMinutes, SessionId, TopicId
 
 
-@dataclass(frozen=True)
+_set = object.__setattr__
+
+
+@dataclass(frozen=True, slots=True)
 class Course:
     course_id: CourseId
     name: str
@@ -16,8 +19,16 @@ class Course:
         if not self.name.strip():
             raise DomainValidationError("course name cannot be empty")
 
+    @classmethod
+    def hydrate(cls, course_id: CourseId, name: str) -> Course:
+        """Trusted constructor for persisted data; skips validation."""
+        course = object.__new__(cls)
+        _set(course, "course_id", course_id)
+        _set(course, "name", name)
+        return course
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Topic:
     topic_id: TopicId
     course_id: CourseId
@@ -27,8 +38,17 @@ class Topic:
         if not self.name.strip():
             raise DomainValidationError("topic name cannot be empty")
 
+    @classmethod
+    def hydrate(cls, topic_id: TopicId, course_id: CourseId, name: str) -> Topic:
+        """Trusted constructor for persisted data; skips validation."""
+        topic = object.__new__(cls)
+        _set(topic, "topic_id", topic_id)
+        _set(topic, "course_id", course_id)
+        _set(topic, "name", name)
+        return topic
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StudySession:
     session_id: SessionId
     topic_id: TopicId
@@ -43,6 +63,26 @@ class StudySession:
         if not self.completed and self.completed_at is not None:
             raise DomainValidationError("completed_at requires completed=True")
 
+    @classmethod
+    def hydrate(
+        cls,
+        session_id: SessionId,
+        topic_id: TopicId,
+        scheduled_date: date,
+        duration: DurationMinutes,
+        completed: bool,
+        completed_at: datetime | None,
+    ) -> StudySession:
+        """Trusted constructor for persisted data; skips validation."""
+        session = object.__new__(cls)
+        _set(session, "session_id", session_id)
+        _set(session, "topic_id", topic_id)
+        _set(session, "scheduled_date", scheduled_date)
+        _set(session, "duration", duration)
+        _set(session, "completed", completed)
+        _set(session, "completed_at", completed_at)
+        return session
+
     def complete(self, completed_at: datetime | None = None) -> "StudySession":
         if completed_at is None:
             completed_at = datetime.utcnow()
@@ -23,7 +23,13 @@ def new_session_id() -> SessionId:
     return SessionId(str(uuid4()))
 
 
-@dataclass(frozen=True)
+# Durations are immutable and drawn from a handful of values, so hydrated
+# sessions share one instance per value (up to a day's worth of minutes).
+_MAX_SHARED_DURATION = 24 * 60
+_SHARED_DURATIONS: dict[int, DurationMinutes] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class DurationMinutes:
     value: int
 
@@ -31,3 +37,14 @@ class DurationMinutes:
         if self.value <= 0:
             raise DomainValidationError("duration must be positive minutes")
 
+    @classmethod
+    def hydrate(cls, value: int) -> DurationMinutes:
+        """Trusted constructor for persisted, already validated values."""
+        duration = _SHARED_DURATIONS.get(value)
+        if duration is None:
+            duration = object.__new__(cls)
+            object.__setattr__(duration, "value", value)
+            if 0 < value <= _MAX_SHARED_DURATION:
+                _SHARED_DURATIONS[value] = duration
+        return duration
+
@@ -4,6 +4,8 @@ import json
 from datetime import date, timedelta
 from pathlib import Path
 
+import pytest
+
 from src.cli.app import run
 
 
@@ -74,3 +76,295 @@ def test_cli_flow(tmp_path: Path) -> None:
 
     exit_code = run(["--store", str(store), "delete-course", "missing"])
     assert exit_code == 1
+
+
+def test_range_report_commands(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-10", "15"]) == 0
+    capsys.readouterr()
+
+    assert run(["--store", str(store), "report", "--month", "2026-02"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("start=2026-02-01\nend=2026-02-28\ntotal_minutes=60\n")
+    assert f"course {course_id} 60" in out
+
+    assert run(
+        ["--store", str(store), "report", "--from", "2026-02-02", "--to", "2026-02-15", "--weekly"]
+    ) == 0
+    blocks = capsys.readouterr().out.split("\n\n")
+    assert [block.splitlines()[2] for block in blocks] == ["total_minutes=45", "total_minutes=15"]
+
+    assert run(["--store", str(store), "report", "--from", "2026-02-02"]) == 1
+    assert "--from requires --to" in capsys.readouterr().out
+
+    for command in ("report", "stats"):
+        for period in (
+            ["--from", "2026-02-30", "--to", "2026-03-01"],
+            ["--from", "2026-02-01", "--to", "soon"],
+        ):
+            with pytest.raises(SystemExit) as exit_info:
+                run(["--store", str(store), command, *period])
+            assert exit_info.value.code == 2
+            assert "invalid date" in capsys.readouterr().err
+        for year in ("0", "10000", "soon"):
+            with pytest.raises(SystemExit) as exit_info:
+                run(["--store", str(store), command, "--year", year])
+            assert exit_info.value.code == 2
+            assert "invalid year" in capsys.readouterr().err
+        last_days = ["--from", "9999-12-01", "--to", "9999-12-31"]
+        assert run(["--store", str(store), command, *last_days]) == 1
+        assert "must be before 9999-12-31" in capsys.readouterr().out
+        assert run(["--store", str(store), command, "--month", "9999-12"]) == 1
+        assert "must be before 9999-12-31" in capsys.readouterr().out
+
+    assert run(
+        ["--store", str(store), "list-sessions", "--from", "2026-02-01", "--to", "9999-12-31"]
+    ) == 1
+    assert "end must be before 9999-12-31" in capsys.readouterr().out
+    assert run(["--store", str(store), "weekly-report", "9999-12-27"]) == 1
+    assert "week must end before 9999-12-31" in capsys.readouterr().out
+
+
+def test_weekly_report_cache_is_invalidated_by_writes(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+
+    assert run(["--store", str(store), "weekly-report", "2026-02-02"]) == 0
+    assert "total_minutes=0" in capsys.readouterr().out
+    assert (tmp_path / "store.json.reports.json").exists()
+
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+    assert run(["--store", str(store), "weekly-report", "2026-02-02"]) == 0
+    assert "total_minutes=45" in capsys.readouterr().out
+
+
+def test_list_sessions_pages_with_a_cursor(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    for day in range(1, 6):
+        assert run(["--store", str(store), "plan-session", topic_id, f"2026-02-0{day}", "30"]) == 0
+    capsys.readouterr()
+
+    assert run(["--store", str(store), "list-sessions"]) == 0
+    every_line = capsys.readouterr().out.splitlines()
+    assert len(every_line) == 5
+
+    assert run(["--store", str(store), "list-sessions", "--limit", "2"]) == 0
+    first_page = capsys.readouterr().out.splitlines()
+    cursor = first_page[-1].split()[0]
+    assert run(["--store", str(store), "list-sessions", "--after", cursor]) == 0
+    assert first_page + capsys.readouterr().out.splitlines() == every_line
+
+    assert run(["--store", str(store), "list-sessions", "--after", "missing"]) == 1
+    assert "session not found" in capsys.readouterr().out
+    assert run(["--store", str(store), "list-sessions", "--limit", "0"]) == 1
+
+
+def test_listing_and_report_output_formats(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-10", "15"]) == 0
+    capsys.readouterr()
+
+    assert run(["--store", str(store), "list-sessions", "--format", "ndjson"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["duration_minutes"] for record in records] == [45, 15]
+    assert records[0]["completed_at"] is None
+
+    assert run(["--store", str(store), "list-sessions", "--format", "json", "--limit", "1"]) == 0
+    assert json.loads(capsys.readouterr().out) == records[:1]
+
+    assert run(["--store", str(store), "list-sessions", "--format", "csv"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "session_id,topic_id,scheduled_date,duration_minutes,completed,completed_at"
+    assert len(lines) == 3
+
+    assert run(["--store", str(store), "list-courses", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == [{"course_id": course_id, "name": "Algorithms"}]
+
+    assert run(["--store", str(store), "list-topics", course_id, "--format", "csv"]) == 0
+    assert capsys.readouterr().out.splitlines()[1] == f"{topic_id},{course_id},Graphs"
+
+    assert run(["--store", str(store), "weekly-report", "2026-02-02", "--format", "json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["total_minutes"] == 45
+    assert report["minutes_by_topic"] == {topic_id: 45}
+
+    assert run(
+        [
+            "--store",
+            str(store),
+            "report",
+            "--from",
+            "2026-02-02",
+            "--to",
+            "2026-02-15",
+            "--weekly",
+            "--format",
+            "ndjson",
+        ]
+    ) == 0
+    series = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(item["start"], item["total_minutes"]) for item in series] == [
+        ("2026-02-02", 45),
+        ("2026-02-09", 15),
+    ]
+
+
+def test_list_sessions_filters(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.db"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    for day in ("2026-02-02", "2026-02-04", "2026-02-12"):
+        assert run(["--store", str(store), "plan-session", topic_id, day, "30"]) == 0
+    session_id = capsys.readouterr().out.splitlines()[1].split()[0]
+    assert run(["--store", str(store), "complete-session", session_id]) == 0
+    capsys.readouterr()
+
+    week = ["--from", "2026-02-02", "--to", "2026-02-08"]
+    assert run(["--store", str(store), "list-sessions", "--pending", *week]) == 0
+    assert [line.split()[2] for line in capsys.readouterr().out.splitlines()] == ["2026-02-02"]
+
+    assert run(["--store", str(store), "list-sessions", "--course", course_id, "--completed"]) == 0
+    assert [line.split()[0] for line in capsys.readouterr().out.splitlines()] == [session_id]
+
+    assert run(["--store", str(store), "list-sessions", "--topic", "missing"]) == 0
+    assert capsys.readouterr().out == ""
+
+    with pytest.raises(SystemExit) as exit_info:
+        run(["--store", str(store), "list-sessions", "--from", "2026-02-31"])
+    assert exit_info.value.code == 2
+    assert "invalid date '2026-02-31'" in capsys.readouterr().err
+
+
+def test_delete_course_cascades_and_purge_orphans(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+
+    # An orphaned session, as left behind by earlier versions.
+    data = json.loads(store.read_text(encoding="utf-8"))
+    orphan = dict(data["sessions"][0], session_id="orphan", topic_id="gone")
+    data["sessions"].append(orphan)
+    data.pop("rollups")
+    store.write_text(json.dumps(data), encoding="utf-8")
+
+    assert run(["--store", str(store), "delete-course", course_id]) == 0
+    data = json.loads(store.read_text(encoding="utf-8"))
+    assert data["topics"] == []
+    assert [session["session_id"] for session in data["sessions"]] == ["orphan"]
+
+    capsys.readouterr()
+    assert run(["--store", str(store), "purge-orphans"]) == 0
+    assert capsys.readouterr().out == "purged 0 topics, 1 sessions\n"
+    data = json.loads(store.read_text(encoding="utf-8"))
+    assert data["sessions"] == [] and data["rollups"] == {}
+
+
+def test_archive_keeps_sessions_listable_and_reports_unchanged(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    session_ids = []
+    for day in ("2026-01-05", "2026-02-03", "2026-03-02"):
+        assert run(["--store", str(store), "plan-session", topic_id, day, "45"]) == 0
+        session_ids.append(capsys.readouterr().out.split()[0])
+        assert run(["--store", str(store), "complete-session", session_ids[-1]]) == 0
+        capsys.readouterr()
+    assert run(["--store", str(store), "report", "--year", "2026"]) == 0
+    report = capsys.readouterr().out
+    assert run(["--store", str(store), "weekly-report", "2026-02-02"]) == 0
+    weekly = capsys.readouterr().out
+
+    assert run(["--store", str(store), "archive", "--before", "2026-03-01"]) == 0
+    assert capsys.readouterr().out == "archived 2 sessions\n"
+
+    data = json.loads(store.read_text(encoding="utf-8"))
+    assert [session["scheduled_date"] for session in data["sessions"]] == ["2026-03-02"]
+    assert sorted(path.name for path in (tmp_path / "store.json.archive").iterdir()) == [
+        "2026-01.ndjson.gz",
+        "2026-02.ndjson.gz",
+        "archive.json",
+        "sessions.index",
+    ]
+    assert run(["--store", str(store), "report", "--year", "2026"]) == 0
+    assert capsys.readouterr().out == report
+    assert run(["--store", str(store), "list-sessions", "--from", "2026-02-01"]) == 0
+    listed = capsys.readouterr().out.splitlines()
+    assert [line.split()[2] for line in listed] == ["2026-02-03", "2026-03-02"]
+    assert run(["--store", str(store), "archive", "--before", "2026-03-01", "--codec", "lzma"]) == 1
+    assert capsys.readouterr().out == "error: archive is compressed with gzip\n"
+    with pytest.raises(SystemExit) as exit_info:
+        run(["--store", str(store), "archive", "--before", "junk"])
+    assert exit_info.value.code == 2
+    assert "invalid date 'junk'" in capsys.readouterr().err
+
+    # Archived sessions are read-only; completing one again must not revive it.
+    assert run(["--store", str(store), "complete-session", session_ids[1]]) == 1
+    assert capsys.readouterr().out == "error: session not found\n"
+    assert run(["--store", str(store), "weekly-report", "2026-02-02"]) == 0
+    assert capsys.readouterr().out == weekly
+    assert run(["--store", str(store), "list-sessions"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 3
+
+
+def test_stats_reports_planned_and_completed_work(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+    session_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-10", "30"]) == 0
+    assert run(["--store", str(store), "complete-session", session_id]) == 0
+    capsys.readouterr()
+
+    assert run(["--store", str(store), "stats", "--month", "2026-02"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "start=2026-02-01",
+        "end=2026-02-28",
+        "sessions=2 completed=1",
+        "minutes=75 completed=45",
+        f"course {course_id} 1/2 sessions 45/75 minutes",
+        f"topic {topic_id} 1/2 sessions 45/75 minutes",
+    ]
+
+    assert run(["--store", str(store), "stats", "--year", "2026", "--format", "csv"]) == 0
+    rows = capsys.readouterr().out.splitlines()
+    assert rows[0] == "start,end,scope,id,sessions,completed_sessions,minutes,completed_minutes"
+    assert rows[1] == "2026-01-01,2026-12-31,total,,2,1,75,45"
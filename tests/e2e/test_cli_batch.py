@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from src.adapters import JsonSessionRepository
+from src.cli.app import run
+
+
+def test_batch_runs_lines_against_one_store(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = json.loads(store.read_text(encoding="utf-8"))["courses"][0]["course_id"]
+    capsys.readouterr()
+
+    script = tmp_path / "script.txt"
+    script.write_text(
+        "\n".join(
+            [
+                "# set up topics",
+                f'add-topic {course_id} "Dynamic Programming"',
+                f"add-topic {course_id} Graphs",
+                "",
+                "list-courses",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    assert run(["--store", str(store), "batch", str(script)]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].endswith(" Dynamic Programming")
+    assert lines[2] == f"{course_id} Algorithms"
+    names = [item["name"] for item in json.loads(store.read_text(encoding="utf-8"))["topics"]]
+    assert names == ["Dynamic Programming", "Graphs"]
+
+
+def test_batch_reports_failures_and_keeps_going(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO("delete-course missing\nnot-a-command\nbatch -\nadd-course Physics\n"),
+    )
+
+    assert run(["--store", str(store), "batch", "-"]) == 1
+
+    out = capsys.readouterr().out
+    assert "error: line 1: course not found" in out
+    assert "error: line 2: invalid command" in out
+    assert "error: line 3: batch is not allowed in a batch" in out
+    assert len(json.loads(store.read_text(encoding="utf-8"))["courses"]) == 1
+
+
+def test_plan_session_with_invalid_duration_reports_error(tmp_path: Path) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = json.loads(store.read_text(encoding="utf-8"))["courses"][0]["course_id"]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = json.loads(store.read_text(encoding="utf-8"))["topics"][0]["topic_id"]
+
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-02", "0"]) == 1
+
+
+def test_batch_line_with_a_bad_date_does_not_discard_the_others(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO(
+            "add-course Physics\n"
+            "plan-session some-topic 2026-13-01 30\n"
+            "weekly-report 2026-02-30\n"
+            "add-course Chemistry\n"
+        ),
+    )
+
+    assert run(["--store", str(store), "batch", "-"]) == 1
+
+    out = capsys.readouterr().out
+    assert "error: line 2: invalid command" in out
+    assert "error: line 3: invalid command" in out
+    names = [item["name"] for item in json.loads(store.read_text(encoding="utf-8"))["courses"]]
+    assert names == ["Physics", "Chemistry"]
+
+
+def test_batch_line_failing_unexpectedly_is_reported_and_the_rest_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+
+    def broken(*args: object) -> None:
+        raise OSError("disk unavailable")
+
+    monkeypatch.setattr("src.cli.app.list_courses", broken)
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO(
+            "add-course Physics\n"
+            "list-courses\n"
+            "add-topic 'unclosed\n"
+            f"import topics {tmp_path / 'missing.csv'}\n"
+            "add-course Chemistry\n"
+        ),
+    )
+
+    assert run(["--store", str(store), "batch", "-"]) == 1
+
+    out = capsys.readouterr().out
+    assert "error: line 2: disk unavailable" in out
+    assert "error: line 3: invalid command" in out
+    assert "error: line 4: cannot read" in out
+    names = [item["name"] for item in json.loads(store.read_text(encoding="utf-8"))["courses"]]
+    assert names == ["Physics", "Chemistry"]
+
+
+def test_missing_batch_file_is_an_error(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    script = tmp_path / "missing.txt"
+    assert run(["--store", str(tmp_path / "store.json"), "batch", str(script)]) == 1
+    assert capsys.readouterr().out == f"error: cannot read {script}: No such file or directory\n"
+
+
+def test_compact_in_a_sqlite_batch_runs_after_the_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = f"sqlite:{tmp_path / 'store.db'}"
+    monkeypatch.setattr("sys.stdin", io.StringIO("add-course Physics\ncompact\n"))
+
+    assert run(["--store", store, "batch", "-"]) == 0
+    assert capsys.readouterr().out.splitlines()[1] == "compacted"
+
+    assert run(["--store", store, "list-courses"]) == 0
+    assert capsys.readouterr().out.split()[1:] == ["Physics"]
+
+
+def test_stats_in_a_batch_reuses_the_session_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    scans = []
+    list_records = JsonSessionRepository.list_records
+
+    def counting(self: JsonSessionRepository, after: str | None = None):
+        scans.append(after)
+        return list_records(self, after)
+
+    monkeypatch.setattr(JsonSessionRepository, "list_records", counting)
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO(
+            "stats --month 2026-02\n"
+            f"plan-session {topic_id} 2026-02-03 45\n"
+            "stats --month 2026-02\n"
+        ),
+    )
+
+    assert run(["--store", str(store), "batch", "-"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[3] == "minutes=0 completed=0"
+    assert lines[8] == "minutes=45 completed=0"
+    assert len(scans) == 1
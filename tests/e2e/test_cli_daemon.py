@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.cli.app import run
+from src.cli.daemon import daemon_supported, socket_path_for
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs Unix domain sockets")
+
+
+def _start_daemon(store: Path) -> threading.Thread:
+    thread = threading.Thread(target=run, args=(["--store", str(store), "serve"],), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not socket_path_for(store).exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    return thread
+
+
+def test_commands_are_forwarded_to_daemon(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    thread = _start_daemon(store)
+    try:
+        capsys.readouterr()
+        assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+        course_line = capsys.readouterr().out
+        course_id = course_line.split()[0]
+
+        # Group commit has finished before the client got its answer.
+        data = json.loads(store.read_text(encoding="utf-8"))
+        assert data["courses"][0]["course_id"] == course_id
+
+        assert run(["--store", str(store), "list-courses"]) == 0
+        assert capsys.readouterr().out == course_line
+
+        assert run(["--store", str(store), "delete-course", "missing"]) == 1
+        assert capsys.readouterr().out == "error: course not found\n"
+
+        assert run(["--store", str(store), "--no-daemon", "list-courses"]) == 0
+        assert capsys.readouterr().out == course_line
+
+        assert run(["--store", str(store), "serve"]) == 1
+        assert "already serving" in capsys.readouterr().out
+
+        assert run(["--store", str(store), "metrics"]) == 0
+        metrics = capsys.readouterr().out
+        assert 'planner_use_case_duration_seconds_count{use_case="create_course"} 1' in metrics
+        assert 'planner_use_case_duration_seconds_count{use_case="list_courses"} 1' in metrics
+    finally:
+        assert run(["--store", str(store), "serve", "--stop"]) == 0
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not socket_path_for(store).exists()
+
+
+def test_stop_without_daemon_fails(tmp_path: Path) -> None:
+    assert run(["--store", str(tmp_path / "store.json"), "serve", "--stop"]) == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.cli.app import run
+
+
+def _load(store: Path) -> dict:
+    return json.loads(store.read_text(encoding="utf-8"))
+
+
+def test_import_topics_and_sessions(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = _load(store)["courses"][0]["course_id"]
+
+    topics_csv = tmp_path / "topics.csv"
+    topics_csv.write_text(f"course_id,name\n{course_id},Graphs\n{course_id},Heaps\n", encoding="utf-8")
+    assert run(["--store", str(store), "import", "topics", str(topics_csv)]) == 0
+    topic_ids = [item["topic_id"] for item in _load(store)["topics"]]
+    assert len(topic_ids) == 2
+
+    sessions_file = tmp_path / "plan.ndjson"
+    sessions_file.write_text(
+        "\n".join(
+            json.dumps({"topic_id": topic_id, "date": "2026-02-02", "duration_minutes": 30})
+            for topic_id in topic_ids
+        ),
+        encoding="utf-8",
+    )
+    assert run(["--store", str(store), "import", "sessions", str(sessions_file)]) == 0
+    assert len(_load(store)["sessions"]) == 2
+    assert "imported 2 sessions" in capsys.readouterr().out
+
+
+def test_import_rejects_bad_rows_without_writing(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    bad = tmp_path / "plan.csv"
+    bad.write_text("topic_id,date,duration_minutes\nmissing,2026-02-30,30\n", encoding="utf-8")
+
+    assert run(["--store", str(store), "import", "sessions", str(bad)]) == 1
+    assert "row 1" in capsys.readouterr().out
+    assert _load(store)["sessions"] == []
+
+    unknown = tmp_path / "plan.txt"
+    unknown.write_text("", encoding="utf-8")
+    assert run(["--store", str(store), "import", "sessions", str(unknown)]) == 1
+
+    broken = tmp_path / "plan.jsonl"
+    broken.write_text("[1, 2]\n", encoding="utf-8")
+    assert run(["--store", str(store), "import", "topics", str(broken)]) == 1
+    assert "expected a JSON object" in capsys.readouterr().out
+
+
+def test_import_reports_unreadable_files(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    missing = tmp_path / "missing.csv"
+    assert run(["--store", str(store), "import", "sessions", str(missing)]) == 1
+    assert capsys.readouterr().out == f"error: cannot read {missing}: No such file or directory\n"
+
+    folder = tmp_path / "folder.csv"
+    folder.mkdir()
+    assert run(["--store", str(store), "import", "topics", str(folder)]) == 1
+    assert capsys.readouterr().out.startswith(f"error: cannot read {folder}: ")
+
+    latin = tmp_path / "topics.csv"
+    latin.write_bytes("course_id,name\nc1,Th\xe9orie\n".encode("latin-1"))
+    assert run(["--store", str(store), "import", "topics", str(latin)]) == 1
+    assert capsys.readouterr().out == f"error: cannot read {latin}: not UTF-8 text\n"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.cli.app import run
+
+
+def test_metrics_file_is_written_and_accumulates(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    metrics = tmp_path / "metrics" / "planner.prom"
+    base = ["--store", str(store), "--metrics-file", str(metrics)]
+
+    assert run([*base, "add-course", "Algorithms"]) == 0
+    assert run([*base, "list-courses"]) == 0
+    assert run([*base, "list-courses"]) == 0
+
+    text = metrics.read_text(encoding="utf-8")
+    assert 'planner_use_case_duration_seconds_count{use_case="create_course"} 1' in text
+    assert 'planner_use_case_duration_seconds_count{use_case="list_courses"} 2' in text
+    assert 'planner_repository_calls_total{method="CourseRepository.list_all"} 2' in text
+    assert f"planner_store_file_bytes {store.stat().st_size}" in text
+    assert "planner_sessions 0" in text
+    assert "planner_store_cache_hit_ratio" in text
+    snapshot = json.loads((tmp_path / "metrics" / "planner.prom.json").read_text())
+    # Creating the empty store, then adding the course.
+    assert snapshot["planner_store_writes_total"]["samples"][0]["value"] == 2
+
+    capsys.readouterr()
+    assert run([*base, "metrics"]) == 0
+    assert 'use_case="list_courses"' in capsys.readouterr().out
+
+
+def test_metrics_command_reports_store_gauges(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    capsys.readouterr()
+
+    assert run(["--store", str(store), "metrics", "--json"]) == 0
+
+    snapshot = json.loads(capsys.readouterr().out)
+    assert snapshot["planner_sessions"]["samples"][0]["value"] == 0
+    assert snapshot["planner_store_file_bytes"]["samples"][0]["value"] > 0
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+import pytest
+
+from src.cli.app import run
+
+
+def test_profile_prints_breakdown(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "store.json"
+    assert run(["--store", str(store), "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+
+    assert run(["--store", str(store), "--profile", "add-topic", course_id, "Graphs"]) == 0
+
+    err = capsys.readouterr().err
+    assert "profile: add-topic" in err
+    assert "use case add_topic" in err
+    assert "CourseRepository.get" in err
+    assert "TopicRepository.add" in err
+    assert "store reads" in err
+
+
+def test_profile_output_writes_cprofile_stats(tmp_path: Path) -> None:
+    store = tmp_path / "store.json"
+    output = tmp_path / "profile.out"
+
+    assert run(["--store", str(store), "--profile-output", str(output), "list-courses"]) == 0
+
+    assert pstats.Stats(str(output)).total_calls > 0
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.cli.app import run
+
+
+def test_sharded_store_round_trip(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    store = tmp_path / "planner"
+    assert run(["--store", str(store), "--shard-by", "month", "add-course", "Algorithms"]) == 0
+    course_id = capsys.readouterr().out.split()[0]
+
+    # Later commands detect the sharded layout without the flag.
+    assert run(["--store", str(store), "add-topic", course_id, "Graphs"]) == 0
+    topic_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "plan-session", topic_id, "2026-02-03", "45"]) == 0
+    session_id = capsys.readouterr().out.split()[0]
+    assert run(["--store", str(store), "complete-session", session_id]) == 0
+    capsys.readouterr()
+
+    assert (store / "sessions" / "2026-02.json").exists()
+    assert run(["--store", str(store), "weekly-report", "2026-02-02"]) == 0
+    out = capsys.readouterr().out
+    assert "total_minutes=45" in out
+    assert f"course {course_id} 45" in out
+
+    assert run(["--store", str(store), "--shard-by", "week", "list-courses"]) == 1
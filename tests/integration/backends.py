@@ -0,0 +1,65 @@
+"""Repositories over every storage adapter, for tests that run against each."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+    JsonCourseRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    JsonTopicRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteCourseRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+    SqliteTopicRepository,
+)
+from src.application import CourseRepository, SessionRepository, TopicRepository, UnitOfWork
+
+ADAPTERS = ("memory", "json", "json-sharded", "sqlite")
+
+Backend = tuple[CourseRepository, TopicRepository, SessionRepository, UnitOfWork | None]
+
+
+def open_backend(adapter: str, path: Path) -> Backend:
+    if adapter == "memory":
+        return (
+            InMemoryCourseRepository(),
+            InMemoryTopicRepository(),
+            InMemorySessionRepository(),
+            None,
+        )
+    if adapter == "json":
+        json_store = JsonFileStore(path / "store.json")
+        return (
+            JsonCourseRepository(json_store),
+            JsonTopicRepository(json_store),
+            JsonSessionRepository(json_store),
+            json_store,
+        )
+    if adapter == "json-sharded":
+        sharded = ShardedJsonStore(path / "planner", shard_by="month")
+        return (
+            JsonCourseRepository(sharded.catalog),
+            JsonTopicRepository(sharded.catalog),
+            ShardedSessionRepository(sharded),
+            sharded,
+        )
+    sqlite_store = SqliteStore(path / "store.db")
+    return (
+        SqliteCourseRepository(sqlite_store),
+        SqliteTopicRepository(sqlite_store),
+        SqliteSessionRepository(sqlite_store),
+        sqlite_store,
+    )
+
+
+def transaction(unit_of_work: UnitOfWork | None) -> ContextManager[None]:
+    return nullcontext() if unit_of_work is None else unit_of_work.transaction()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from benchmarks import (
+    ADAPTERS,
+    OPERATIONS,
+    generate_dataset,
+    run_benchmarks,
+    run_hydration_benchmarks,
+)
+from benchmarks.__main__ import main
+
+
+def test_generate_dataset_shape() -> None:
+    dataset = generate_dataset(200, seed=1)
+    assert len(dataset.sessions) == 200
+    assert len(dataset.topics) == 8 * len(dataset.courses)
+    assert all(dataset.first_day <= s.scheduled_date <= dataset.last_day for s in dataset.sessions)
+    assert any(session.completed for session in dataset.sessions)
+    assert dataset.mondays[0].weekday() == 0
+
+
+def test_run_benchmarks_covers_every_adapter_and_operation() -> None:
+    results = run_benchmarks(sizes=(50,), iterations=2)
+
+    assert [run["adapter"] for run in results["runs"]] == list(ADAPTERS)
+    for run in results["runs"]:
+        assert set(run["operations"]) == set(OPERATIONS)
+        metrics = run["operations"]["plan_session"]
+        assert metrics["p50_ms"] <= metrics["p99_ms"]
+        assert metrics["peak_memory_bytes"] > 0
+    json_run = next(run for run in results["runs"] if run["adapter"] == "json")
+    assert json_run["operations"]["plan_session"]["writes_per_op"] == 1
+    assert json_run["operations"]["list_sessions"]["writes_per_op"] == 0
+
+
+def test_benchmark_cli_writes_results(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    code = main(
+        [
+            "--sizes",
+            "20",
+            "--adapters",
+            "memory,sqlite",
+            "--operations",
+            "generate_weekly_report",
+            "--iterations",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+    assert code == 0
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert {run["adapter"] for run in results["runs"]} == {"memory", "sqlite"}
+
+
+def test_hydration_benchmark_compares_strategies() -> None:
+    (run,) = run_hydration_benchmarks((100,))
+    assert run["sessions"] == 100
+    assert set(run["strategies"]) == {"dict_dataclass", "slots_validated", "slots_hydrated"}
+    for metrics in run["strategies"].values():
+        assert metrics["seconds"] > 0
+        assert metrics["retained_bytes"] > 0
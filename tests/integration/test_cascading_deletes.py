@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.adapters import JsonFileStore
+from src.application import (
+    AddTopicRequest,
+    CreateCourseRequest,
+    PlanSessionRequest,
+    add_topic,
+    create_course,
+    delete_course,
+    plan_session,
+    purge_orphans,
+)
+from tests.integration.backends import ADAPTERS, Backend, open_backend, transaction
+
+
+def _populate(backend: Backend, name: str) -> None:
+    courses, topics, sessions, unit_of_work = backend
+    with transaction(unit_of_work):
+        course = create_course(CreateCourseRequest(name=name), courses)
+        for topic_name in ("A", "B"):
+            topic = add_topic(AddTopicRequest(course.course_id, topic_name), courses, topics)
+            for offset in (3, 20, 40):
+                scheduled = date(2026, 1, 1) + timedelta(days=offset)
+                plan_session(PlanSessionRequest(topic.topic_id, scheduled, 30), topics, sessions)
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS)
+def test_delete_course_cascades_to_topics_sessions_and_rollups(
+    tmp_path: Path, adapter: str
+) -> None:
+    backend = open_backend(adapter, tmp_path)
+    courses, topics, sessions, unit_of_work = backend
+    _populate(backend, "Doomed")
+    _populate(backend, "Kept")
+    doomed, kept = list(courses.list_all())
+    writes = unit_of_work.stats.writes if isinstance(unit_of_work, JsonFileStore) else 0
+
+    delete_course(doomed.course_id, courses, topics, sessions, unit_of_work)
+
+    if isinstance(unit_of_work, JsonFileStore):
+        # Course, topics and sessions leave the store in one write.
+        assert unit_of_work.stats.writes == writes + 1
+    assert [course.course_id for course in courses.list_all()] == [kept.course_id]
+    kept_topics = {topic.topic_id for topic in topics.list_all()}
+    assert kept_topics == {topic.topic_id for topic in topics.list_by_course(kept.course_id)}
+    assert sessions.count() == 6
+    assert sessions.topic_ids() == kept_topics
+    rows = list(sessions.daily_minutes(date(2026, 1, 1), date(2026, 3, 1)))
+    assert sum(minutes for _, _, minutes in rows) == 6 * 30
+    assert {topic_id for _, topic_id, _ in rows} == kept_topics
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS)
+def test_purge_orphans_reclaims_what_plain_deletes_left(tmp_path: Path, adapter: str) -> None:
+    backend = open_backend(adapter, tmp_path)
+    courses, topics, sessions, unit_of_work = backend
+    _populate(backend, "Old")
+    _populate(backend, "Current")
+    old, current = list(courses.list_all())
+    # Deletes used to stop at the course or topic record.
+    stray = next(iter(topics.list_by_course(current.course_id)))
+    with transaction(unit_of_work):
+        courses.remove(old.course_id)
+        topics.remove(stray.topic_id)
+
+    result = purge_orphans(courses, topics, sessions, unit_of_work)
+
+    assert (result.topics_removed, result.sessions_removed) == (2, 9)
+    assert sessions.count() == 3
+    assert purge_orphans(courses, topics, sessions, unit_of_work).sessions_removed == 0
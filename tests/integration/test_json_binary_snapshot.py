@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.adapters import JsonCourseRepository, JsonFileStore, JsonSessionRepository, JsonTopicRepository
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course, Topic
+
+
+def _populate(store: JsonFileStore) -> StudySession:
+    course = Course(course_id=new_course_id(), name="Geometry")
+    topic = Topic(topic_id=new_topic_id(), course_id=course.course_id, name="Circles")
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=topic.topic_id,
+        scheduled_date=date(2026, 2, 2),
+        duration=DurationMinutes(40),
+        completed=True,
+        completed_at=datetime(2026, 2, 2, 18, 30),
+    )
+    with store.transaction():
+        JsonCourseRepository(store).add(course)
+        JsonTopicRepository(store).add(topic)
+        JsonSessionRepository(store).add(session)
+    return session
+
+
+def _forbid_json_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("store.json was parsed")
+
+    monkeypatch.setattr("src.adapters.json_store.json.loads", fail)
+
+
+def test_fresh_snapshot_is_loaded_instead_of_the_json(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "store.json"
+    session = _populate(JsonFileStore(path, binary_snapshot=True))
+    assert (tmp_path / "store.json.bin").exists()
+
+    _forbid_json_parse(monkeypatch)
+    # The snapshot's presence enables it; the flag is only needed to create it.
+    reopened = JsonFileStore(path)
+    sessions = JsonSessionRepository(reopened)
+
+    assert sessions.get(session.session_id) == session
+    assert [course.name for course in JsonCourseRepository(reopened).list_all()] == ["Geometry"]
+    assert list(sessions.daily_minutes(date(2026, 2, 1), date(2026, 2, 3))) == [
+        (date(2026, 2, 2), session.topic_id, 40)
+    ]
+    assert reopened.stats.bytes_read == reopened.snapshot_path.stat().st_size
+
+
+def test_journal_is_replayed_over_the_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True, binary_snapshot=True)
+    session = _populate(store)
+    JsonCourseRepository(store).add(Course(course_id=new_course_id(), name="Algebra"))
+
+    reopened = JsonFileStore(path, journal=True)
+    courses = JsonCourseRepository(reopened)
+    assert sorted(course.name for course in courses.list_all()) == ["Algebra", "Geometry"]
+    assert JsonSessionRepository(reopened).get(session.session_id) == session
+
+
+def test_stale_snapshot_is_ignored_and_rebuilt(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    _populate(JsonFileStore(path, binary_snapshot=True))
+    # Edited by something that does not know about the snapshot.
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["courses"][0]["name"] = "Trigonometry"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stale = (tmp_path / "store.json.bin").read_bytes()
+
+    store = JsonFileStore(path)
+    assert [course.name for course in JsonCourseRepository(store).list_all()] == ["Trigonometry"]
+    assert (tmp_path / "store.json.bin").read_bytes() != stale
+
+    reloaded = JsonFileStore(path)
+    assert [course.name for course in JsonCourseRepository(reloaded).list_all()] == ["Trigonometry"]
+    assert reloaded.stats.writes == 0
+
+
+@pytest.mark.parametrize("damage", ["flip", "truncate"])
+def test_damaged_snapshot_falls_back_to_the_json(tmp_path: Path, damage: str) -> None:
+    path = tmp_path / "store.json"
+    session = _populate(JsonFileStore(path, binary_snapshot=True))
+    snapshot = tmp_path / "store.json.bin"
+    payload = bytearray(snapshot.read_bytes())
+    if damage == "flip":
+        payload[-10] ^= 0xFF
+    else:
+        del payload[len(payload) // 2 :]
+    snapshot.write_bytes(bytes(payload))
+
+    store = JsonFileStore(path)
+    assert JsonSessionRepository(store).get(session.session_id) == session
+    assert store.stats.bytes_read == path.stat().st_size
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+from src.adapters import (
+    JsonCourseRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    JsonTopicRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+)
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course, Topic
+
+
+def _populate(store: JsonFileStore) -> tuple[Topic, list[StudySession]]:
+    course = Course(course_id=new_course_id(), name="Geometry")
+    topic = Topic(topic_id=new_topic_id(), course_id=course.course_id, name="Circles")
+    sessions = [
+        StudySession(
+            session_id=new_session_id(),
+            topic_id=topic.topic_id,
+            scheduled_date=date(2026, 2, day),
+            duration=DurationMinutes(40),
+            completed=day == 2,
+            completed_at=datetime(2026, 2, 2, 18, 30) if day == 2 else None,
+        )
+        for day in (2, 3)
+    ]
+    with store.transaction():
+        JsonCourseRepository(store).add(course)
+        JsonTopicRepository(store).add(topic)
+        for session in sessions:
+            JsonSessionRepository(store).add(session)
+    return topic, sessions
+
+
+def test_ids_are_stored_as_keys_into_an_id_table(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    topic, sessions = _populate(JsonFileStore(path, compact_ids=True))
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert path.read_text(encoding="utf-8").startswith('{"ids":')
+    assert len(data["ids"]) == 4
+    assert {item["topic_id"] for item in data["sessions"]} == {data["topics"][0]["topic_id"]}
+    assert all(isinstance(item["session_id"], int) for item in data["sessions"])
+    assert data["rollups"] == {
+        "2026-02-02": {str(data["topics"][0]["topic_id"]): 40},
+        "2026-02-03": {str(data["topics"][0]["topic_id"]): 40},
+    }
+
+    reopened = JsonFileStore(path)
+    repository = JsonSessionRepository(reopened)
+    assert [repository.get(session.session_id) for session in sessions] == sessions
+    assert list(repository.daily_minutes(date(2026, 2, 2), date(2026, 2, 3))) == [
+        (date(2026, 2, 2), topic.topic_id, 40)
+    ]
+    first, second = reopened._records("sessions").values()
+    # One interned string per id, shared by every record that refers to it.
+    assert first["topic_id"] is second["topic_id"]
+
+    # The format is kept without the flag.
+    JsonCourseRepository(reopened).add(Course(course_id=new_course_id(), name="Algebra"))
+    assert len(json.loads(path.read_text(encoding="utf-8"))["ids"]) == 5
+
+
+def test_compact_converts_a_plain_store(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    topic, sessions = _populate(JsonFileStore(path, journal=True))
+    plain_size = path.stat().st_size + (tmp_path / "store.json.log").stat().st_size
+
+    store = JsonFileStore(path, journal=True, compact_ids=True)
+    # Journaled changes keep plain ids until they are compacted.
+    JsonTopicRepository(store).add(Topic(new_topic_id(), topic.course_id, "Squares"))
+    assert "ids" not in json.loads(path.read_text(encoding="utf-8"))
+    store.compact()
+
+    assert path.stat().st_size < plain_size
+    reopened = JsonFileStore(path, binary_snapshot=True)
+    assert len(list(JsonTopicRepository(reopened).list_by_course(topic.course_id))) == 2
+    assert JsonSessionRepository(reopened).get(sessions[1].session_id) == sessions[1]
+
+    # Loaded from the binary snapshot, writes still use the id table.
+    again = JsonFileStore(path)
+    JsonCourseRepository(again).add(Course(course_id=new_course_id(), name="Algebra"))
+    assert "ids" in json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_sharded_stores_keep_the_catalog_format_for_new_shards(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month", compact_ids=True)
+    topic = Topic(topic_id=new_topic_id(), course_id=new_course_id(), name="Circles")
+    JsonTopicRepository(store.catalog).add(topic)
+
+    reopened = ShardedJsonStore(tmp_path / "planner")
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=topic.topic_id,
+        scheduled_date=date(2026, 3, 2),
+        duration=DurationMinutes(25),
+    )
+    ShardedSessionRepository(reopened).add(session)
+
+    shard = tmp_path / "planner" / "sessions" / "2026-03.json"
+    assert shard.read_text(encoding="utf-8").startswith('{"ids":')
+    assert ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner")).get(
+        session.session_id
+    ) == session
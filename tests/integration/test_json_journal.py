@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.adapters import JsonCourseRepository, JsonFileStore, JsonSessionRepository, JsonTopicRepository
+from src.cli.app import run
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course, Topic
+
+
+def test_journal_appends_without_rewriting_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    snapshot = path.read_text(encoding="utf-8")
+    courses = JsonCourseRepository(store)
+    topics = JsonTopicRepository(store)
+    sessions = JsonSessionRepository(store)
+
+    course = Course(course_id=new_course_id(), name="Chemistry")
+    courses.add(course)
+    topic = Topic(topic_id=new_topic_id(), course_id=course.course_id, name="Bonds")
+    topics.add(topic)
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=topic.topic_id,
+        scheduled_date=date(2026, 2, 2),
+        duration=DurationMinutes(20),
+    )
+    sessions.add(session)
+    sessions.update(session.complete(completed_at=datetime(2026, 2, 2, 9, 0, 0)))
+
+    assert path.read_text(encoding="utf-8") == snapshot
+    assert len(store.log_path.read_text(encoding="utf-8").splitlines()) == 4
+
+    reopened = JsonSessionRepository(JsonFileStore(path, journal=True))
+    reloaded = reopened.get(session.session_id)
+    assert reloaded is not None
+    assert reloaded.completed is True
+    assert len(list(reopened.list_all())) == 1
+
+    courses.remove(course.course_id)
+    assert courses.get(course.course_id) is None
+
+
+def test_compact_folds_journal_into_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    courses = JsonCourseRepository(store)
+    course = Course(course_id=new_course_id(), name="History")
+    courses.add(course)
+
+    store.compact()
+
+    assert not store.log_path.exists()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["courses"] == [{"course_id": course.course_id, "name": "History"}]
+
+
+def test_journal_compacts_past_threshold(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True, compact_threshold=1)
+    JsonCourseRepository(store).add(Course(course_id=new_course_id(), name="Art"))
+
+    assert not store.log_path.exists()
+    assert len(json.loads(path.read_text(encoding="utf-8"))["courses"]) == 1
+
+
+def test_torn_final_journal_line_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    courses = JsonCourseRepository(store)
+    courses.add(Course(course_id=new_course_id(), name="Music"))
+    with store.log_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "put", "coll')
+
+    assert len(list(courses.list_all())) == 1
+
+
+def test_append_after_a_torn_journal_line_drops_the_fragment(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    courses = JsonCourseRepository(store)
+    courses.add(Course(course_id=new_course_id(), name="Music"))
+    with store.log_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "put", "coll')
+
+    courses.add(Course(course_id=new_course_id(), name="Art"))
+    courses.add(Course(course_id=new_course_id(), name="Drama"))
+
+    reopened = JsonCourseRepository(JsonFileStore(path, journal=True))
+    assert sorted(course.name for course in reopened.list_all()) == ["Art", "Drama", "Music"]
+    assert store.log_path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_corrupt_journal_line_raises(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    store.log_path.write_text('garbage\n{"op": "delete", "collection": "courses", "id": "x"}\n')
+
+    with pytest.raises(ValueError):
+        store._read()
+
+
+def test_unknown_journal_op_raises(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    store.log_path.write_text('{"op": "merge", "collection": "courses"}\n')
+
+    with pytest.raises(ValueError):
+        store._read()
+
+
+def test_cli_journal_and_compact(tmp_path: Path) -> None:
+    store = tmp_path / "store.json"
+
+    assert run(["--store", str(store), "--journal", "add-course", "Biology"]) == 0
+    assert json.loads(store.read_text(encoding="utf-8"))["courses"] == []
+
+    assert run(["--store", str(store), "compact"]) == 0
+    assert len(json.loads(store.read_text(encoding="utf-8"))["courses"]) == 1
@@ -30,3 +30,16 @@ def test_json_repositories_round_trip(tmp_path: Path) -> None:
     )
     sessions.add(session)
     assert sessions.get(session.session_id) is not None
+
+
+def test_json_topic_get_many(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "store.json")
+    topics = JsonTopicRepository(store)
+    course_id = new_course_id()
+    first = Topic(topic_id=new_topic_id(), course_id=course_id, name="Sets")
+    second = Topic(topic_id=new_topic_id(), course_id=course_id, name="Logic")
+    topics.add(first)
+    topics.add(second)
+
+    found = topics.get_many([first.topic_id, new_topic_id()])
+    assert found == {first.topic_id: first}
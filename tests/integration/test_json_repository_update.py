@@ -48,3 +48,22 @@ def test_json_update_and_list(tmp_path: Path) -> None:
 
     all_sessions = list(sessions.list_all())
     assert len(all_sessions) == 2
+
+
+def test_json_list_between(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "store.json")
+    sessions = JsonSessionRepository(store)
+    topic_id = new_topic_id()
+    days = [date(2026, 2, 9), date(2026, 2, 2), date(2026, 1, 30), date(2026, 2, 8)]
+    for day in days:
+        sessions.add(
+            StudySession(
+                session_id=new_session_id(),
+                topic_id=topic_id,
+                scheduled_date=day,
+                duration=DurationMinutes(10),
+            )
+        )
+
+    found = list(sessions.list_between(date(2026, 2, 2), date(2026, 2, 9)))
+    assert [session.scheduled_date for session in found] == [date(2026, 2, 2), date(2026, 2, 8)]
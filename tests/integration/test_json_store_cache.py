@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.adapters import JsonCourseRepository, JsonFileStore, JsonSessionRepository, JsonTopicRepository
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course, Topic
+
+
+def test_document_is_reused_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path)
+    courses = JsonCourseRepository(store)
+    courses.add(Course(course_id=new_course_id(), name="Geometry"))
+
+    document = store._document()
+    assert store._document() is document
+
+    other = JsonCourseRepository(JsonFileStore(path))
+    other.add(Course(course_id=new_course_id(), name="Calculus"))
+
+    assert store._document() is not document
+    assert len(list(courses.list_all())) == 2
+
+
+def test_journal_appends_from_other_store_invalidate_cache(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=True)
+    courses = JsonCourseRepository(store)
+    assert list(courses.list_all()) == []
+
+    JsonCourseRepository(JsonFileStore(path, journal=True)).add(
+        Course(course_id=new_course_id(), name="Statistics")
+    )
+
+    assert len(list(courses.list_all())) == 1
+
+
+def test_indexes_follow_mutations(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "store.json")
+    topics = JsonTopicRepository(store)
+    sessions = JsonSessionRepository(store)
+    course_id = new_course_id()
+    first = Topic(topic_id=new_topic_id(), course_id=course_id, name="Limits")
+    second = Topic(topic_id=new_topic_id(), course_id=course_id, name="Series")
+    topics.add(first)
+    topics.add(second)
+    monday = date(2026, 2, 2)
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=first.topic_id,
+        scheduled_date=monday,
+        duration=DurationMinutes(25),
+    )
+    sessions.add(session)
+
+    # Build the lazy indexes, then mutate through them.
+    assert len(list(topics.list_by_course(course_id))) == 2
+    assert list(sessions.list_by_topic(first.topic_id)) == [session]
+    assert list(sessions.list_between(monday, monday + timedelta(days=7))) == [session]
+
+    moved = StudySession(
+        session_id=session.session_id,
+        topic_id=second.topic_id,
+        scheduled_date=monday + timedelta(days=7),
+        duration=session.duration,
+    )
+    sessions.update(moved)
+    topics.remove(first.topic_id)
+
+    assert list(topics.list_by_course(course_id)) == [second]
+    assert list(sessions.list_by_topic(first.topic_id)) == []
+    assert list(sessions.list_by_topic(second.topic_id)) == [moved]
+    assert list(sessions.list_between(monday, monday + timedelta(days=7))) == []
+    assert list(sessions.list_between(monday, monday + timedelta(days=8))) == [moved]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.adapters import (
+    InMemorySessionRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+)
+from src.application import SessionRepository
+from src.domain import DurationMinutes, StudySession, TopicId, new_session_id
+
+_REPOSITORIES: dict[str, Callable[[Path], SessionRepository]] = {
+    "memory": lambda path: InMemorySessionRepository(),
+    "json": lambda path: JsonSessionRepository(JsonFileStore(path / "store.json")),
+    "json-journal": lambda path: JsonSessionRepository(
+        JsonFileStore(path / "store.json", journal=True)
+    ),
+    "json-sharded": lambda path: ShardedSessionRepository(
+        ShardedJsonStore(path / "planner", shard_by="week")
+    ),
+    "sqlite": lambda path: SqliteSessionRepository(SqliteStore(path / "store.db")),
+}
+
+
+def _session(topic_id: str, day: date, minutes: int) -> StudySession:
+    return StudySession(
+        session_id=new_session_id(),
+        topic_id=TopicId(topic_id),
+        scheduled_date=day,
+        duration=DurationMinutes(minutes),
+    )
+
+
+@pytest.mark.parametrize("adapter", sorted(_REPOSITORIES))
+def test_rollups_follow_adds_and_updates(adapter: str, tmp_path: Path) -> None:
+    sessions = _REPOSITORIES[adapter](tmp_path)
+    monday, tuesday = date(2026, 2, 2), date(2026, 2, 3)
+    first = _session("topic-a", monday, 30)
+    second = _session("topic-a", monday, 15)
+    third = _session("topic-b", tuesday, 45)
+    for session in (first, second, third):
+        sessions.add(session)
+
+    assert list(sessions.daily_minutes(monday, date(2026, 2, 9))) == [
+        (monday, "topic-a", 45),
+        (tuesday, "topic-b", 45),
+    ]
+
+    # Completing keeps the totals; rescheduling moves minutes between days.
+    sessions.update(first.complete())
+    moved = StudySession(
+        session_id=second.session_id,
+        topic_id=TopicId("topic-b"),
+        scheduled_date=date(2026, 2, 10),
+        duration=DurationMinutes(20),
+    )
+    sessions.update(moved)
+
+    assert list(sessions.daily_minutes(monday, date(2026, 2, 9))) == [
+        (monday, "topic-a", 30),
+        (tuesday, "topic-b", 45),
+    ]
+    assert list(sessions.daily_minutes(tuesday, date(2026, 2, 11))) == [
+        (tuesday, "topic-b", 45),
+        (date(2026, 2, 10), "topic-b", 20),
+    ]
+
+
+def test_json_rollups_are_persisted_and_rebuilt(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    day = date(2026, 3, 2)
+    JsonSessionRepository(JsonFileStore(path)).add(_session("topic-a", day, 25))
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["rollups"] == {"2026-03-02": {"topic-a": 25}}
+
+    del data["rollups"]
+    path.write_text(json.dumps(data), encoding="utf-8")
+    sessions = JsonSessionRepository(JsonFileStore(path))
+    assert list(sessions.daily_minutes(day, date(2026, 3, 3))) == [(day, "topic-a", 25)]
+
+
+def test_sqlite_rollups_are_backfilled_for_existing_databases(tmp_path: Path) -> None:
+    path = tmp_path / "store.db"
+    day = date(2026, 3, 2)
+    store = SqliteStore(path)
+    SqliteSessionRepository(store).add(_session("topic-a", day, 25))
+    store.close()
+    with sqlite3.connect(path) as connection:
+        connection.execute("DROP TABLE daily_minutes")
+
+    sessions = SqliteSessionRepository(SqliteStore(path))
+    assert list(sessions.daily_minutes(day, date(2026, 3, 3))) == [(day, "topic-a", 25)]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.adapters import ArchivedSessionRepository, ColumnarSessionRepository, CompressedArchive
+from src.application import (
+    AddTopicRequest,
+    ArchiveSessionsRequest,
+    CompleteSessionRequest,
+    CreateCourseRequest,
+    NotFoundError,
+    PlanSessionRequest,
+    SessionQuery,
+    add_topic,
+    archive_sessions,
+    complete_session,
+    create_course,
+    plan_session,
+    session_record,
+)
+from tests.integration.backends import ADAPTERS, Backend, open_backend, transaction
+
+
+def _populate(backend: Backend) -> None:
+    """Sessions every fifth day of 2026 Q1; all but the last two are completed."""
+    courses, topics, sessions, unit_of_work = backend
+    with transaction(unit_of_work):
+        course = create_course(CreateCourseRequest(name="History"), courses)
+        topic = add_topic(AddTopicRequest(course.course_id, "Rome"), courses, topics)
+        planned = [
+            plan_session(
+                PlanSessionRequest(topic.topic_id, date(2026, 1, 1) + timedelta(days=day), 30),
+                topics,
+                sessions,
+            )
+            for day in range(0, 90, 5)
+        ]
+        for session in planned[:-2]:
+            complete_session(
+                CompleteSessionRequest(session.session_id, datetime(2026, 4, 1, 9)),
+                sessions,
+            )
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS)
+def test_archive_moves_completed_history_and_keeps_it_readable(
+    tmp_path: Path, adapter: str
+) -> None:
+    backend = open_backend(adapter, tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    everything = list(hot.list_records())
+    quarter = (date(2026, 1, 1), date(2026, 4, 1))
+    minutes = sorted(hot.daily_minutes(*quarter))
+    archive = CompressedArchive(tmp_path / "cold")
+
+    moved = archive_sessions(
+        ArchiveSessionsRequest(before=date(2026, 3, 1)), hot, archive, unit_of_work
+    )
+
+    # Jan 1 .. Feb 25: twelve sessions, all completed.
+    assert moved == 12
+    assert archive.partitions() == ["2026-01", "2026-02"]
+    assert (archive.count(), hot.count()) == (12, 6)
+    assert sorted(hot.daily_minutes(*quarter)) == minutes
+    assert archive_sessions(
+        ArchiveSessionsRequest(before=date(2026, 3, 1)), hot, archive, unit_of_work
+    ) == 0
+
+    sessions = ArchivedSessionRepository(hot, archive)
+    assert sessions.count() == 18
+    assert sorted(sessions.list_records(), key=lambda record: record["session_id"]) == sorted(
+        everything, key=lambda record: record["session_id"]
+    )
+    february = SessionQuery(start=date(2026, 2, 1), end=date(2026, 3, 11))
+    expected = [
+        record
+        for record in everything
+        if "2026-02-01" <= record["scheduled_date"] < "2026-03-11"
+    ]
+    assert list(sessions.query_records(february)) == expected
+    first, second, *rest = expected
+    assert list(sessions.query_records(february, after=second["session_id"])) == rest
+    assert sessions.get(first["session_id"]) is None
+    archived = sessions.get_archived(first["session_id"])
+    assert archived is not None and archived.completed
+
+
+def test_archive_reads_only_partitions_in_range(tmp_path: Path) -> None:
+    backend = open_backend("json", tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    archive = CompressedArchive(tmp_path / "cold", codec="lzma")
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 3, 1)), hot, archive, unit_of_work)
+    sessions = ArchivedSessionRepository(hot, archive)
+
+    reads = archive.stats.reads
+    pending = list(sessions.query(SessionQuery(completed=False)))
+    march = list(sessions.query(SessionQuery(start=date(2026, 3, 1))))
+
+    assert len(pending) == 2 and len(march) == 6
+    assert archive.stats.reads == reads
+    assert len(list(sessions.query(SessionQuery(start=date(2026, 2, 10))))) == 10
+    assert archive.stats.reads == reads + 1
+    assert sorted(path.name for path in (tmp_path / "cold").iterdir()) == [
+        "2026-01.ndjson.xz",
+        "2026-02.ndjson.xz",
+        "archive.json",
+        "sessions.index",
+    ]
+
+
+def test_interrupted_archive_run_never_duplicates_sessions(tmp_path: Path) -> None:
+    backend = open_backend("json", tmp_path)
+    _, _, hot, _ = backend
+    _populate(backend)
+    archive = CompressedArchive(tmp_path / "cold")
+    january = list(hot.query_records(SessionQuery(end=date(2026, 2, 1), completed=True)))
+    # The records reached the archive but the run stopped before evicting them.
+    archive.append(january)
+
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 2, 1)), hot, archive)
+
+    sessions = ArchivedSessionRepository(hot, archive)
+    listed = [record["session_id"] for record in sessions.list_records()]
+    assert len(listed) == len(set(listed)) == 18
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS)
+def test_archived_sessions_cannot_be_completed_again(tmp_path: Path, adapter: str) -> None:
+    backend = open_backend(adapter, tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    archive = CompressedArchive(tmp_path / "cold")
+    january = list(hot.query(SessionQuery(end=date(2026, 2, 1))))
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 2, 1)), hot, archive, unit_of_work)
+    sessions = ArchivedSessionRepository(hot, archive)
+    quarter = (date(2026, 1, 1), date(2026, 4, 1))
+    minutes = sorted(sessions.daily_minutes(*quarter))
+
+    with pytest.raises(NotFoundError):
+        complete_session(
+            CompleteSessionRequest(january[0].session_id, datetime(2026, 4, 2, 9)),
+            sessions,
+            unit_of_work,
+        )
+    with pytest.raises(ValueError, match="is archived"):
+        sessions.update(january[0])
+
+    assert sorted(sessions.daily_minutes(*quarter)) == minutes
+    assert (hot.count(), sessions.count()) == (11, 18)
+    listed = [record["session_id"] for record in sessions.list_records()]
+    assert len(listed) == len(set(listed)) == 18
+
+
+def test_archived_lookup_by_id_reads_one_partition(tmp_path: Path) -> None:
+    backend = open_backend("json", tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    february = list(hot.query(SessionQuery(start=date(2026, 2, 1), end=date(2026, 3, 1))))
+    archive = CompressedArchive(tmp_path / "cold")
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 3, 1)), hot, archive, unit_of_work)
+
+    # A fresh instance, as in another process, reads the index from disk.
+    sessions = ArchivedSessionRepository(hot, CompressedArchive(tmp_path / "cold"))
+    assert sessions.get_archived(february[0].session_id) == february[0]
+    reads = archive.stats.reads
+    sessions = ArchivedSessionRepository(hot, archive)
+    assert sessions.get_archived(february[1].session_id) == february[1]
+    assert archive.stats.reads == reads + 1
+    assert sessions.get_archived("missing") is None
+    assert sessions.get("missing") is None
+    assert archive.stats.reads == reads + 1
+
+    # Archives written before the index had one are indexed on first lookup.
+    (tmp_path / "cold" / "sessions.index").unlink()
+    rebuilt = CompressedArchive(tmp_path / "cold")
+    assert rebuilt.find(february[2].session_id) == session_record(february[2])
+    assert (tmp_path / "cold" / "sessions.index").exists()
+
+
+def test_archiving_after_a_torn_index_line_drops_the_fragment(tmp_path: Path) -> None:
+    backend = open_backend("json", tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    january = list(hot.query(SessionQuery(end=date(2026, 2, 1))))
+    february = list(hot.query(SessionQuery(start=date(2026, 2, 1), end=date(2026, 3, 1))))
+    archive = CompressedArchive(tmp_path / "cold")
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 2, 1)), hot, archive, unit_of_work)
+    with (tmp_path / "cold" / "sessions.index").open("a", encoding="utf-8") as handle:
+        handle.write("torn-id 2026-")
+
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 3, 1)), hot, archive, unit_of_work)
+
+    fresh = CompressedArchive(tmp_path / "cold")
+    assert fresh.find(january[0].session_id) == session_record(january[0])
+    assert fresh.find(february[0].session_id) == session_record(february[0])
+    assert (tmp_path / "cold" / "sessions.index").read_text(encoding="utf-8").endswith("\n")
+
+
+def test_completion_totals_read_live_columns_and_archived_months_in_range(
+    tmp_path: Path,
+) -> None:
+    backend = open_backend("json", tmp_path)
+    _, _, hot, unit_of_work = backend
+    _populate(backend)
+    live = ColumnarSessionRepository(hot)
+    archive = CompressedArchive(tmp_path / "cold")
+    archive_sessions(ArchiveSessionsRequest(before=date(2026, 2, 1)), live, archive, unit_of_work)
+    sessions = ArchivedSessionRepository(live, archive)
+
+    reads = archive.stats.reads
+    march = sessions.completion_by_topic(date(2026, 3, 1), date(2026, 4, 1))
+    assert archive.stats.reads == reads
+    assert [totals.sessions for totals in march.values()] == [6]
+
+    quarter = sessions.completion_by_topic(date(2026, 1, 1), date(2026, 4, 1))
+    assert archive.stats.reads == reads + 1
+    [totals] = quarter.values()
+    assert (totals.sessions, totals.completed_sessions) == (18, 16)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.adapters import (
+    InMemorySessionRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+)
+from src.application import (
+    ApplicationValidationError,
+    ListSessionsRequest,
+    NotFoundError,
+    SessionRepository,
+    list_sessions,
+    session_record,
+)
+from src.domain import DurationMinutes, SessionId, StudySession, new_session_id, new_topic_id
+
+_REPOSITORIES: dict[str, Callable[[Path], SessionRepository]] = {
+    "memory": lambda path: InMemorySessionRepository(),
+    "json": lambda path: JsonSessionRepository(JsonFileStore(path / "store.json")),
+    "json-sharded": lambda path: ShardedSessionRepository(
+        ShardedJsonStore(path / "planner", shard_by="month")
+    ),
+    "sqlite": lambda path: SqliteSessionRepository(SqliteStore(path / "store.db")),
+}
+
+
+def _sessions(count: int) -> list[StudySession]:
+    topic_id = new_topic_id()
+    return [
+        StudySession(
+            session_id=new_session_id(),
+            topic_id=topic_id,
+            scheduled_date=date(2026, 1 + index % 3, 1 + index),
+            duration=DurationMinutes(30),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("adapter", sorted(_REPOSITORIES))
+def test_cursor_pages_cover_every_session_once(tmp_path: Path, adapter: str) -> None:
+    repo = _REPOSITORIES[adapter](tmp_path)
+    for session in _sessions(7):
+        repo.add(session)
+    listing = repo.list_all()
+    assert iter(listing) is listing
+    expected = list(listing)
+
+    pages = []
+    after: SessionId | None = None
+    while True:
+        page = list(list_sessions(repo, ListSessionsRequest(limit=3, after=after)))
+        if not page:
+            break
+        pages.append(page)
+        after = page[-1].session_id
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [session for page in pages for session in page] == expected
+    assert list(repo.list_all(SessionId("missing"))) == []
+    assert list(repo.list_records()) == [session_record(session) for session in expected]
+    assert list(repo.list_records(pages[0][-1].session_id)) == [
+        session_record(session) for session in expected[3:]
+    ]
+
+
+def test_list_sessions_rejects_bad_pages() -> None:
+    repo = InMemorySessionRepository()
+    with pytest.raises(ApplicationValidationError):
+        list_sessions(repo, ListSessionsRequest(limit=0))
+    with pytest.raises(NotFoundError):
+        list_sessions(repo, ListSessionsRequest(after=SessionId("missing")))
+
+
+def test_sharded_listing_opens_shards_as_it_reaches_them(tmp_path: Path) -> None:
+    repo = ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner", shard_by="month"))
+    for session in _sessions(6):
+        repo.add(session)
+
+    reopened = ShardedJsonStore(tmp_path / "planner")
+    listing = ShardedSessionRepository(reopened).list_all()
+    first = next(listing)
+
+    assert first.scheduled_date.month == 1
+    assert set(reopened._shards) == {"2026-01"}
+
+
+def test_sqlite_listing_streams_rows(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    repo = SqliteSessionRepository(store)
+    for session in _sessions(5):
+        repo.add(session)
+
+    reads = store.stats.reads
+    assert len(list(islice(repo.list_all(), 2))) == 2
+    # The read is counted once the cursor is closed, consumed or not.
+    assert store.stats.reads == reads + 1
+    store.close()
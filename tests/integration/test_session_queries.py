@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.adapters import (
+    InMemorySessionRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+)
+from src.application import SessionQuery, SessionRepository, session_record
+from src.domain import DurationMinutes, SessionId, StudySession, new_session_id, new_topic_id
+
+_REPOSITORIES: dict[str, Callable[[Path], SessionRepository]] = {
+    "memory": lambda path: InMemorySessionRepository(),
+    "json": lambda path: JsonSessionRepository(JsonFileStore(path / "store.json")),
+    "json-sharded": lambda path: ShardedSessionRepository(
+        ShardedJsonStore(path / "planner", shard_by="week")
+    ),
+    "sqlite": lambda path: SqliteSessionRepository(SqliteStore(path / "store.db")),
+}
+
+_TOPICS = (new_topic_id(), new_topic_id(), new_topic_id())
+
+
+def _history() -> list[StudySession]:
+    sessions = []
+    for index in range(60):
+        session = StudySession(
+            session_id=new_session_id(),
+            topic_id=_TOPICS[index % 3],
+            scheduled_date=date(2026, 1, 1 + index % 31),
+            duration=DurationMinutes(15 + index),
+        )
+        if index % 4 == 0:
+            session = session.complete(datetime(2026, 2, 1, 9, 0))
+        sessions.append(session)
+    return sessions
+
+
+def _expected(sessions: list[StudySession], query: SessionQuery) -> list[StudySession]:
+    matching = [
+        session
+        for session in sessions
+        if (query.topic_ids is None or session.topic_id in query.topic_ids)
+        and (query.start is None or session.scheduled_date >= query.start)
+        and (query.end is None or session.scheduled_date < query.end)
+        and (query.completed is None or session.completed == query.completed)
+    ]
+    return sorted(matching, key=lambda session: (session.scheduled_date, session.session_id))
+
+
+_QUERIES = [
+    SessionQuery(),
+    SessionQuery(completed=False),
+    SessionQuery(completed=True),
+    SessionQuery(start=date(2026, 1, 5), end=date(2026, 1, 12)),
+    SessionQuery(start=date(2026, 1, 5), end=date(2026, 1, 12), completed=False),
+    SessionQuery(end=date(2026, 1, 3)),
+    SessionQuery(start=date(2026, 1, 29)),
+    SessionQuery(topic_ids=frozenset({_TOPICS[0]})),
+    SessionQuery(topic_ids=frozenset(_TOPICS[1:]), start=date(2026, 1, 10), completed=True),
+    SessionQuery(topic_ids=frozenset()),
+]
+
+
+@pytest.mark.parametrize("adapter", sorted(_REPOSITORIES))
+def test_queries_match_a_filtered_scan(tmp_path: Path, adapter: str) -> None:
+    repo = _REPOSITORIES[adapter](tmp_path)
+    sessions = _history()
+    for session in sessions:
+        repo.add(session)
+    # Completing moves a session between the status indexes.
+    sessions[1] = sessions[1].complete(datetime(2026, 2, 2, 9, 0))
+    repo.update(sessions[1])
+
+    for query in _QUERIES:
+        expected = _expected(sessions, query)
+        assert list(repo.query(query)) == expected, query
+        assert list(repo.query_records(query)) == [session_record(s) for s in expected]
+        if len(expected) > 2:
+            cursor = expected[1].session_id
+            assert list(repo.query(query, cursor)) == expected[2:], query
+    assert list(repo.query(SessionQuery(), SessionId("missing"))) == []
+
+
+def test_sharded_query_only_opens_shards_in_range(tmp_path: Path) -> None:
+    repo = ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner", shard_by="week"))
+    for session in _history():
+        repo.add(session)
+
+    reopened = ShardedJsonStore(tmp_path / "planner")
+    query = SessionQuery(start=date(2026, 1, 12), end=date(2026, 1, 19), completed=False)
+    found = list(ShardedSessionRepository(reopened).query(query))
+
+    assert found and all(not session.completed for session in found)
+    assert set(reopened._shards) == {"2026-W03"}
+
+
+def test_sqlite_status_queries_use_the_status_index(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    plan = store._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT session_id FROM sessions "
+        "WHERE completed = 0 AND scheduled_date >= '2026-01-05' "
+        "AND scheduled_date < '2026-01-12'"
+    ).fetchall()
+    assert "sessions_completed_date" in " ".join(str(row[-1]) for row in plan)
+    store.close()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.adapters import (
+    JsonCourseRepository,
+    JsonTopicRepository,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+)
+from src.application import WeeklyReportRequest, generate_weekly_report
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course, Topic
+
+
+def _session(topic_id: str, day: date, minutes: int = 30) -> StudySession:
+    return StudySession(
+        session_id=new_session_id(),
+        topic_id=topic_id,
+        scheduled_date=day,
+        duration=DurationMinutes(minutes),
+    )
+
+
+def test_sessions_are_split_into_monthly_shards(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    sessions = ShardedSessionRepository(store)
+    topic_id = new_topic_id()
+    january = _session(topic_id, date(2026, 1, 30))
+    february = _session(topic_id, date(2026, 2, 2))
+    with store.transaction():
+        sessions.add(january)
+        sessions.add(february)
+
+    shard_dir = tmp_path / "planner" / "sessions"
+    assert sorted(path.name for path in shard_dir.glob("*.json")) == [
+        "2026-01.json",
+        "2026-02.json",
+    ]
+    assert sessions.count() == 2
+    assert list(sessions.list_all()) == [january, february]
+    assert list(sessions.list_by_topic(topic_id)) == [january, february]
+
+    # A fresh process only opens the shards a query needs.
+    reopened = ShardedJsonStore(tmp_path / "planner")
+    assert reopened.shard_by == "month"
+    repo = ShardedSessionRepository(reopened)
+    assert list(repo.list_between(date(2026, 2, 1), date(2026, 2, 8))) == [february]
+    assert set(reopened._shards) == {"2026-02"}
+
+    completed = february.complete(datetime(2026, 2, 2, 9, 0))
+    repo.update(completed)
+    assert repo.get(february.session_id) == completed
+    assert set(reopened._shards) == {"2026-02"}
+
+
+def test_weekly_shards_follow_iso_weeks_and_moves(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="week")
+    sessions = ShardedSessionRepository(store)
+    session = _session(new_topic_id(), date(2025, 12, 29))
+    sessions.add(session)
+    assert (tmp_path / "planner" / "sessions" / "2026-W01.json").exists()
+
+    moved = StudySession(
+        session_id=session.session_id,
+        topic_id=session.topic_id,
+        scheduled_date=date(2026, 1, 12),
+        duration=session.duration,
+    )
+    sessions.update(moved)
+
+    fresh = ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner"))
+    assert fresh.get(session.session_id) == moved
+    assert list(fresh.list_between(date(2025, 12, 29), date(2026, 1, 5))) == []
+    assert fresh.count() == 1
+
+
+def test_transaction_rolls_back_every_shard(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    sessions = ShardedSessionRepository(store)
+    courses = JsonCourseRepository(store.catalog)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            courses.add(Course(course_id=new_course_id(), name="Algebra"))
+            sessions.add(_session(new_topic_id(), date(2026, 3, 2)))
+            sessions.add(_session(new_topic_id(), date(2026, 4, 6)))
+            raise RuntimeError("boom")
+
+    fresh = ShardedJsonStore(tmp_path / "planner")
+    assert list(JsonCourseRepository(fresh.catalog).list_all()) == []
+    assert ShardedSessionRepository(fresh).count() == 0
+    assert list(ShardedSessionRepository(fresh).list_all()) == []
+
+
+def test_index_is_rebuilt_from_shards(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    session = _session(new_topic_id(), date(2026, 5, 4))
+    ShardedSessionRepository(store).add(session)
+    (tmp_path / "planner" / "sessions.index").unlink()
+
+    fresh = ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner"))
+    assert fresh.get(session.session_id) == session
+
+
+def test_append_after_a_torn_index_line_drops_the_fragment(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    sessions = ShardedSessionRepository(store)
+    first = _session(new_topic_id(), date(2026, 5, 4))
+    sessions.add(first)
+    with (tmp_path / "planner" / "sessions.index").open("a", encoding="utf-8") as handle:
+        handle.write("torn-id 2026-")
+
+    second = _session(new_topic_id(), date(2026, 6, 1))
+    ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner")).add(second)
+
+    fresh = ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner"))
+    assert fresh.get(first.session_id) == first
+    assert fresh.get(second.session_id) == second
+    assert fresh.count() == 2
+
+
+def test_adding_a_session_does_not_read_the_index(tmp_path: Path) -> None:
+    ShardedSessionRepository(ShardedJsonStore(tmp_path / "planner", shard_by="month")).add(
+        _session(new_topic_id(), date(2026, 5, 4))
+    )
+    store = ShardedJsonStore(tmp_path / "planner")
+    sessions = ShardedSessionRepository(store)
+    with store.transaction():
+        added = _session(new_topic_id(), date(2026, 5, 11))
+        sessions.add(added)
+        assert store._index is None
+        # A lookup inside the transaction still sees the pending entry.
+        assert sessions.get(added.session_id) == added
+
+    assert sessions.count() == 2
+
+
+def test_weekly_report_over_sharded_store(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    courses = JsonCourseRepository(store.catalog)
+    topics = JsonTopicRepository(store.catalog)
+    sessions = ShardedSessionRepository(store)
+    course = Course(course_id=new_course_id(), name="Physics")
+    topic = Topic(topic_id=new_topic_id(), course_id=course.course_id, name="Optics")
+    courses.add(course)
+    topics.add(topic)
+    # The week of 2026-03-30 spans the March and April shards.
+    sessions.add(_session(topic.topic_id, date(2026, 3, 31), 20))
+    sessions.add(_session(topic.topic_id, date(2026, 4, 2), 40))
+    sessions.add(_session(topic.topic_id, date(2026, 4, 6), 60))
+
+    report = generate_weekly_report(
+        WeeklyReportRequest(week_start=date(2026, 3, 30)), courses, topics, sessions
+    )
+
+    assert report.total_minutes == 60
+    assert report.minutes_by_course == {course.course_id: 60}
+
+
+def test_shard_scheme_mismatch_is_rejected(tmp_path: Path) -> None:
+    ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    with pytest.raises(ValueError):
+        ShardedJsonStore(tmp_path / "planner", shard_by="week")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+from src.adapters import (
+    SqliteCourseRepository,
+    SqliteSessionRepository,
+    SqliteStore,
+    SqliteTopicRepository,
+    is_sqlite_spec,
+)
+from src.cli.app import run
+from src.domain import (
+    CourseId,
+    DurationMinutes,
+    SessionId,
+    StudySession,
+    TopicId,
+    new_course_id,
+    new_session_id,
+    new_topic_id,
+)
+from src.domain.models import Course, Topic
+
+
+def test_sqlite_repositories_round_trip(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    courses = SqliteCourseRepository(store)
+    topics = SqliteTopicRepository(store)
+    sessions = SqliteSessionRepository(store)
+
+    course = Course(course_id=new_course_id(), name="Physics")
+    courses.add(course)
+    topic = Topic(topic_id=new_topic_id(), course_id=course.course_id, name="Optics")
+    topics.add(topic)
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=topic.topic_id,
+        scheduled_date=date(2026, 2, 5),
+        duration=DurationMinutes(30),
+    )
+    sessions.add(session)
+    sessions.update(session.complete(completed_at=datetime(2026, 2, 5, 8, 30, 0)))
+
+    assert courses.get(course.course_id) == course
+    assert list(courses.list_all()) == [course]
+    assert topics.get(topic.topic_id) == topic
+    assert list(topics.list_by_course(course.course_id)) == [topic]
+    reloaded = sessions.get(session.session_id)
+    assert reloaded is not None
+    assert reloaded.completed_at == datetime(2026, 2, 5, 8, 30, 0)
+    assert len(list(sessions.list_by_topic(topic.topic_id))) == 1
+    assert len(list(sessions.list_all())) == 1
+
+    topics.remove(topic.topic_id)
+    courses.remove(course.course_id)
+    assert topics.get(topic.topic_id) is None
+    assert courses.get(course.course_id) is None
+    store.close()
+
+
+def test_sqlite_get_returns_none_when_missing(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    assert SqliteCourseRepository(store).get(CourseId("missing")) is None
+    assert SqliteSessionRepository(store).get(SessionId("missing")) is None
+    assert list(SqliteSessionRepository(store).list_by_topic(TopicId("missing"))) == []
+    store.close()
+
+
+def test_sqlite_uses_wal_and_indexes(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    assert store._fetchone("PRAGMA journal_mode")[0] == "wal"
+    indexes = {row["name"] for row in store._fetchall("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"topics_course_id", "sessions_topic_id", "sessions_scheduled_date"} <= indexes
+    store.compact()
+    store.close()
+
+
+def test_is_sqlite_spec() -> None:
+    assert is_sqlite_spec("sqlite:data/planner")
+    assert is_sqlite_spec("data/planner.sqlite3")
+    assert not is_sqlite_spec("data/store.json")
+
+
+def test_cli_selects_sqlite_backend(tmp_path: Path) -> None:
+    store = f"sqlite:{tmp_path / 'planner'}"
+
+    assert run(["--store", store, "add-course", "Algorithms"]) == 0
+    assert run(["--store", store, "list-courses"]) == 0
+    assert run(["--store", store, "compact"]) == 0
+    assert (tmp_path / "planner").exists()
+    assert not (tmp_path / "store.json").exists()
+
+
+def test_sqlite_list_between(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    sessions = SqliteSessionRepository(store)
+    topic_id = new_topic_id()
+    for day in (date(2026, 2, 9), date(2026, 2, 3), date(2026, 2, 2), date(2026, 2, 1)):
+        sessions.add(
+            StudySession(
+                session_id=new_session_id(),
+                topic_id=topic_id,
+                scheduled_date=day,
+                duration=DurationMinutes(10),
+            )
+        )
+
+    found = list(sessions.list_between(date(2026, 2, 2), date(2026, 2, 9)))
+    assert [session.scheduled_date for session in found] == [date(2026, 2, 2), date(2026, 2, 3)]
+    store.close()
+
+
+def test_sqlite_topic_get_many(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    topics = SqliteTopicRepository(store)
+    course_id = new_course_id()
+    created = [Topic(topic_id=new_topic_id(), course_id=course_id, name=f"T{n}") for n in range(3)]
+    for topic in created:
+        topics.add(topic)
+
+    found = topics.get_many([created[0].topic_id, created[2].topic_id, TopicId("missing")])
+    assert found == {created[0].topic_id: created[0], created[2].topic_id: created[2]}
+    store.close()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from src.adapters import (
+    JsonCourseRepository,
+    JsonFileStore,
+    ShardedJsonStore,
+    ShardedSessionRepository,
+    SqliteCourseRepository,
+    SqliteStore,
+)
+from src.domain import DurationMinutes, StudySession, new_course_id, new_session_id, new_topic_id
+from src.domain.models import Course
+
+
+def test_json_version_changes_with_each_commit(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "store.json", journal=True)
+    courses = JsonCourseRepository(store)
+    before = store.version()
+
+    with store.transaction():
+        courses.add(Course(course_id=new_course_id(), name="Logic"))
+        assert store.version() is None
+
+    after = store.version()
+    assert after not in (None, before)
+    assert JsonFileStore(tmp_path / "store.json").version() == after
+
+
+def test_json_transaction_without_access_does_not_parse(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    JsonFileStore(path)
+    store = JsonFileStore(path)
+
+    with store.transaction():
+        store.version()
+
+    assert store.stats.reads == 0
+
+
+def test_sqlite_generation_moves_on_commit_only(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    courses = SqliteCourseRepository(store)
+    before = store.version()
+    courses.list_all()
+    assert store.version() == before
+
+    with store.transaction():
+        courses.add(Course(course_id=new_course_id(), name="Logic"))
+        assert store.version() is None
+
+    assert int(store.version() or 0) == int(before or 0) + 1
+
+
+def test_sharded_version_follows_shard_writes(tmp_path: Path) -> None:
+    store = ShardedJsonStore(tmp_path / "planner", shard_by="month")
+    before = store.version()
+    ShardedSessionRepository(store).add(
+        StudySession(
+            session_id=new_session_id(),
+            topic_id=new_topic_id(),
+            scheduled_date=date(2026, 2, 2),
+            duration=DurationMinutes(30),
+        )
+    )
+    assert store.version() not in (None, before)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.adapters import (
+    JsonCourseRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    JsonTopicRepository,
+    SqliteCourseRepository,
+    SqliteStore,
+)
+from src.application import CreateCourseRequest, NotFoundError, create_course, delete_course
+from src.domain import CourseId, new_course_id
+from src.domain.models import Course
+
+
+def _course_names(path: Path) -> list[str]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [item["name"] for item in data["courses"]]
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_json_transaction_defers_write_until_commit(tmp_path: Path, journal: bool) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path, journal=journal)
+    courses = JsonCourseRepository(store)
+
+    with store.transaction():
+        create_course(CreateCourseRequest(name="Algebra"), courses)
+        with store.transaction():
+            create_course(CreateCourseRequest(name="Topology"), courses)
+        assert _course_names(path) == []
+        assert not store.log_path.exists()
+        assert len(list(courses.list_all())) == 2
+
+    assert len(list(JsonCourseRepository(JsonFileStore(path)).list_all())) == 2
+    assert not path.with_name("store.json.tmp").exists()
+    if journal:
+        assert len(store.log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_json_transaction_rolls_back_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path)
+    courses = JsonCourseRepository(store)
+    topics = JsonTopicRepository(store)
+    sessions = JsonSessionRepository(store)
+    courses.add(Course(course_id=new_course_id(), name="Kept"))
+
+    with pytest.raises(NotFoundError):
+        with store.transaction():
+            courses.add(Course(course_id=new_course_id(), name="Discarded"))
+            delete_course(CourseId("missing"), courses, topics, sessions, store)
+
+    assert [course.name for course in courses.list_all()] == ["Kept"]
+    assert _course_names(path) == ["Kept"]
+
+
+def test_sqlite_transaction_commits_once_and_rolls_back(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "store.db")
+    courses = SqliteCourseRepository(store)
+
+    with store.transaction():
+        courses.add(Course(course_id=new_course_id(), name="Kept"))
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            courses.add(Course(course_id=new_course_id(), name="Discarded"))
+            raise RuntimeError("boom")
+
+    assert [course.name for course in courses.list_all()] == ["Kept"]
+    store.close()
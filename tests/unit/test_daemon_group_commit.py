@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+import pytest
+
+from src.cli.daemon import DaemonCommand, PlannerDaemon, daemon_supported
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs Unix domain sockets")
+
+
+def test_concurrent_writes_share_one_commit(tmp_path: Path) -> None:
+    commits: list[list[str]] = []
+    pending: list[str] = []
+
+    @contextmanager
+    def transaction() -> Iterator[None]:
+        yield
+        commits.append(list(pending))
+        pending.clear()
+
+    def prepare(args: list[str]) -> DaemonCommand:
+        def run_command(out: TextIO) -> int:
+            pending.append(args[0])
+            out.write(f"ok {args[0]}\n")
+            return 0
+
+        return DaemonCommand(read_only=args[0] == "read", run=run_command)
+
+    socket_path = tmp_path / "store.json.sock"
+    daemon = PlannerDaemon(socket_path, prepare, transaction)
+
+    async def call(payload: dict) -> dict:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.write(json.dumps(payload).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        return response
+
+    async def scenario() -> list[dict]:
+        server = asyncio.create_task(daemon.serve())
+        while not socket_path.exists():
+            await asyncio.sleep(0.001)
+        responses = await asyncio.gather(*(call({"args": [f"w{n}"]}) for n in range(20)))
+        responses.append(await call({"args": ["read"]}))
+        await call({"shutdown": True})
+        await server
+        return responses
+
+    responses = asyncio.run(scenario())
+
+    assert [r["output"] for r in responses[:20]] == [f"ok w{n}\n" for n in range(20)]
+    assert responses[20]["output"] == "ok read\n"
+    written = [name for commit in commits for name in commit]
+    assert sorted(written) == sorted(f"w{n}" for n in range(20))
+    assert len(commits) < 20
+
+
+def test_a_failing_write_does_not_fail_the_rest_of_its_group(tmp_path: Path) -> None:
+    committed: list[str] = []
+    pending: list[str] = []
+
+    @contextmanager
+    def transaction() -> Iterator[None]:
+        try:
+            yield
+        except BaseException:
+            pending.clear()
+            raise
+        committed.extend(pending)
+        pending.clear()
+
+    def prepare(args: list[str]) -> DaemonCommand:
+        def run_command(out: TextIO) -> int:
+            pending.append(args[0])
+            if args[0] == "bad":
+                raise ValueError("bad input")
+            out.write(f"ok {args[0]}\n")
+            return 0
+
+        return DaemonCommand(read_only=False, run=run_command)
+
+    socket_path = tmp_path / "store.json.sock"
+    daemon = PlannerDaemon(socket_path, prepare, transaction)
+
+    async def call(
+        writer: asyncio.StreamWriter, reader: asyncio.StreamReader, line: bytes
+    ) -> dict:
+        writer.write(line)
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def request(payload: dict) -> dict:
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        response = await call(writer, reader, json.dumps(payload).encode() + b"\n")
+        writer.close()
+        await writer.wait_closed()
+        return response
+
+    async def scenario() -> tuple[list[dict], list[dict]]:
+        server = asyncio.create_task(daemon.serve())
+        while not socket_path.exists():
+            await asyncio.sleep(0.001)
+        names = ["w0", "bad", "w1", "w2"]
+        responses = await asyncio.gather(*(request({"args": [name]}) for name in names))
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        same_connection = [
+            await call(writer, reader, line)
+            for line in (b"{not json\n", b'{"args": [1]}\n', b'{"args": ["w3"]}\n')
+        ]
+        writer.close()
+        await writer.wait_closed()
+        await request({"shutdown": True})
+        await server
+        return responses, same_connection
+
+    responses, same_connection = asyncio.run(scenario())
+
+    assert [r["output"] for r in responses] == [
+        "ok w0\n",
+        "error: bad input\n",
+        "ok w1\n",
+        "ok w2\n",
+    ]
+    assert [r["exit_code"] for r in responses] == [0, 1, 0, 0]
+    assert sorted(committed) == ["w0", "w1", "w2", "w3"]
+    assert [r["output"] for r in same_connection] == [
+        "error: malformed request\n",
+        "error: malformed request\n",
+        "ok w3\n",
+    ]
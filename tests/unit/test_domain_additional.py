@@ -4,7 +4,15 @@ from datetime import date, datetime
 
 import pytest
 
-from src.domain import DurationMinutes, StudySession, new_session_id, new_topic_id
+from src.domain import (
+    Course,
+    DurationMinutes,
+    StudySession,
+    Topic,
+    new_course_id,
+    new_session_id,
+    new_topic_id,
+)
 from src.domain.errors import DomainValidationError
 
 
@@ -30,3 +38,27 @@ def test_completed_at_requires_completed_flag() -> None:
             completed=False,
             completed_at=datetime(2026, 2, 1, 10, 0, 0),
         )
+
+
+def test_hydrate_builds_equal_slotted_objects_without_validation() -> None:
+    session = StudySession(
+        session_id=new_session_id(),
+        topic_id=new_topic_id(),
+        scheduled_date=date(2026, 2, 2),
+        duration=DurationMinutes(30),
+    )
+    hydrated = StudySession.hydrate(
+        session.session_id,
+        session.topic_id,
+        session.scheduled_date,
+        DurationMinutes.hydrate(30),
+        False,
+        None,
+    )
+
+    assert hydrated == session
+    assert not hasattr(hydrated, "__dict__")
+    assert DurationMinutes.hydrate(30) is DurationMinutes.hydrate(30)
+    # Trusted data is taken as is; validation only guards new objects.
+    assert Course.hydrate(new_course_id(), " ").name == " "
+    assert Topic.hydrate(new_topic_id(), new_course_id(), "Sets").name == "Sets"
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from src.adapters import InMemorySessionRepository
+from src.domain import DurationMinutes, StudySession, new_session_id, new_topic_id
+
+
+def _session(day: date) -> StudySession:
+    return StudySession(
+        session_id=new_session_id(),
+        topic_id=new_topic_id(),
+        scheduled_date=day,
+        duration=DurationMinutes(30),
+    )
+
+
+def test_list_between_is_half_open_and_date_ordered() -> None:
+    sessions = InMemorySessionRepository()
+    monday = date(2026, 2, 2)
+    later = _session(monday + timedelta(days=3))
+    first = _session(monday)
+    outside = _session(monday + timedelta(days=7))
+    for session in (later, first, outside):
+        sessions.add(session)
+
+    found = list(sessions.list_between(monday, monday + timedelta(days=7)))
+    assert found == [first, later]
+
+
+def test_list_between_follows_rescheduled_sessions() -> None:
+    sessions = InMemorySessionRepository()
+    monday = date(2026, 2, 2)
+    session = _session(monday)
+    sessions.add(session)
+
+    moved = StudySession(
+        session_id=session.session_id,
+        topic_id=session.topic_id,
+        scheduled_date=monday + timedelta(days=14),
+        duration=session.duration,
+    )
+    sessions.update(moved)
+
+    assert list(sessions.list_between(monday, monday + timedelta(days=7))) == []
+    assert list(sessions.list_between(monday, monday + timedelta(days=15))) == [moved]
+    assert list(sessions.list_by_topic(session.topic_id)) == [moved]
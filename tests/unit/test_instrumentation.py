@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import date
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    Profiler,
+    StoreStats,
+    instrument,
+)
+from src.domain import (
+    CourseId,
+    DurationMinutes,
+    StudySession,
+    new_course_id,
+    new_session_id,
+    new_topic_id,
+)
+from src.domain.models import Course
+
+
+def test_instrument_counts_and_times_calls() -> None:
+    profiler = Profiler()
+    courses = instrument(InMemoryCourseRepository(), "CourseRepository", profiler)
+
+    courses.add(Course(course_id=new_course_id(), name="Logic"))
+    assert courses.get(CourseId("missing")) is None
+    assert courses.get(CourseId("missing")) is None
+
+    assert profiler.calls["CourseRepository.add"].calls == 1
+    assert profiler.calls["CourseRepository.get"].calls == 2
+    assert profiler.calls["CourseRepository.get"].seconds >= 0
+
+
+def test_profiler_report_includes_store_io() -> None:
+    profiler = Profiler()
+    with profiler.timed("use case list_courses"):
+        pass
+    stats = StoreStats()
+    stats.record_read(0.002, 512)
+
+    report = profiler.report("list-courses", stats)
+
+    assert report.splitlines()[0] == "profile: list-courses"
+    assert "use case list_courses" in report
+    assert "512 bytes" in report
+
+
+def test_instrument_times_lazy_results_as_they_are_consumed() -> None:
+    profiler = Profiler()
+    sessions = InMemorySessionRepository()
+    sessions.add(
+        StudySession(
+            session_id=new_session_id(),
+            topic_id=new_topic_id(),
+            scheduled_date=date(2026, 2, 3),
+            duration=DurationMinutes(30),
+        )
+    )
+    proxy = instrument(sessions, "SessionRepository", profiler)
+
+    listing = proxy.list_all()
+    assert "SessionRepository.list_all" not in profiler.calls
+    assert len(list(listing)) == 1
+    assert profiler.calls["SessionRepository.list_all"].calls == 1
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from src.adapters import MetricsRegistry, PlannerMetrics, StoreStats
+
+
+def test_prometheus_text_renders_counters_gauges_and_histograms() -> None:
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.")
+    size = registry.gauge("size_bytes", "Size.")
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    calls.inc(method="Repo.get")
+    calls.inc(2, method="Repo.get")
+    size.set(512)
+    latency.observe(0.1, use_case="report")
+    latency.observe(3.0, use_case="report")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE calls_total counter" in text
+    assert 'calls_total{method="Repo.get"} 3' in text
+    assert "size_bytes 512" in text
+    assert 'latency_seconds_bucket{use_case="report",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{use_case="report",le="1"} 1' in text
+    assert 'latency_seconds_bucket{use_case="report",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{use_case="report"} 2' in text
+    assert 'latency_seconds_sum{use_case="report"} 3.1' in text
+
+
+def test_merge_accumulates_counters_and_keeps_latest_gauges() -> None:
+    first = PlannerMetrics()
+    first.observe_use_case("complete_session", 0.002)
+    first.record("SessionRepository.get", 0.001)
+    first.collect_store(StoreStats(reads=1, cache_hits=3), file_bytes=100, sessions=5)
+
+    second = PlannerMetrics()
+    second.registry.merge(first.registry.snapshot())
+    second.observe_use_case("complete_session", 0.004)
+    second.collect_store(StoreStats(reads=1, cache_hits=1), file_bytes=200, sessions=6)
+
+    assert second.use_case_seconds.snapshot()[0]["buckets"][1] == 1
+    assert sum(second.use_case_seconds.snapshot()[0]["buckets"]) == 2
+    assert second.repository_calls.values == {(("method", "SessionRepository.get"),): 1}
+    assert second.store_reads.values[()] == 2
+    assert second.cache_hit_ratio.values[()] == 4 / 6
+    assert second.store_file_bytes.values[()] == 200
+    assert second.sessions.values[()] == 6
+
+
+def test_collect_store_only_counts_new_io() -> None:
+    metrics = PlannerMetrics()
+    stats = StoreStats()
+    stats.record_write(0.01, 64)
+    metrics.collect_store(stats, file_bytes=64, sessions=0)
+    stats.record_write(0.01, 32)
+    metrics.collect_store(stats, file_bytes=96, sessions=1)
+
+    assert metrics.store_writes.values[()] == 2
+    assert metrics.store_written_bytes.values[()] == 96
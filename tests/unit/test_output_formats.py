@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+from src.cli.formats import WRITE_BATCH, write_lines, write_records, write_reports
+
+_FIELDS = ("id", "name", "done")
+
+
+def _records(count: int) -> list[dict]:
+    return [{"id": str(index), "name": f"n,{index}", "done": index % 2 == 0} for index in range(count)]
+
+
+def _write(fmt: str, records: list[dict]) -> str:
+    out = io.StringIO()
+    write_records(out, iter(records), fmt, _FIELDS)
+    return out.getvalue()
+
+
+def test_json_and_ndjson_round_trip_across_batches() -> None:
+    records = _records(WRITE_BATCH * 2 + 5)
+
+    assert json.loads(_write("json", records)) == records
+    lines = _write("ndjson", records).splitlines()
+    assert [json.loads(line) for line in lines] == records
+
+
+def test_csv_has_a_header_and_quotes_values() -> None:
+    records = _records(WRITE_BATCH + 1)
+
+    rows = list(csv.DictReader(io.StringIO(_write("csv", records))))
+
+    assert len(rows) == len(records)
+    assert rows[3] == {"id": "3", "name": "n,3", "done": "False"}
+
+
+def test_empty_listings_are_still_valid_documents() -> None:
+    assert json.loads(_write("json", [])) == []
+    assert _write("ndjson", []) == ""
+    assert _write("csv", []) == "id,name,done\n"
+
+
+def test_write_lines_joins_batches() -> None:
+    out = io.StringIO()
+    write_lines(out, (str(index) for index in range(WRITE_BATCH + 2)))
+    assert out.getvalue().splitlines() == [str(index) for index in range(WRITE_BATCH + 2)]
+
+
+def test_csv_reports_flatten_totals_per_scope() -> None:
+    report = {
+        "week_start": "2026-02-02",
+        "total_minutes": 45,
+        "minutes_by_course": {"c1": 45},
+        "minutes_by_topic": {"t1": 30, "t2": 15},
+    }
+    out = io.StringIO()
+    write_reports(out, [report], "csv", ("week_start",))
+
+    assert out.getvalue().splitlines() == [
+        "week_start,scope,id,minutes",
+        "2026-02-02,total,,45",
+        "2026-02-02,course,c1,45",
+        "2026-02-02,topic,t1,30",
+        "2026-02-02,topic,t2,15",
+    ]
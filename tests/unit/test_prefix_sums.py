@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import date
+
+from src.application.prefix_sums import DailyPrefixSums
+
+
+def test_range_totals_are_answered_from_prefix_sums() -> None:
+    rows = [
+        (date(2026, 2, 1), "a", 10),
+        (date(2026, 2, 3), "b", 20),
+        (date(2026, 2, 3), "a", 5),
+        (date(2026, 2, 9), "a", 100),  # outside the span
+    ]
+    sums = DailyPrefixSums.build(date(2026, 2, 1), date(2026, 2, 8), rows)
+
+    assert list(sums.keys()) == ["a", "b"]
+    assert sums.total("a", date(2026, 2, 1), date(2026, 2, 8)) == 15
+    assert sums.total("a", date(2026, 2, 2), date(2026, 2, 3)) == 0
+    assert sums.total("missing", date(2026, 2, 1), date(2026, 2, 8)) == 0
+    assert sums.totals(date(2026, 2, 3), date(2026, 2, 4)) == {"a": 5, "b": 20}
+    assert sums.totals(date(2026, 2, 2), date(2026, 2, 3)) == {}
+    # Ranges beyond the span are clipped to it.
+    assert sums.totals(date(2026, 1, 1), date(2026, 3, 1)) == {"a": 15, "b": 20}
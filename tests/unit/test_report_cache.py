@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+    ReportCache,
+)
+from src.application import (
+    AddTopicRequest,
+    CreateCourseRequest,
+    PlanSessionRequest,
+    WeeklyReport,
+    WeeklyReportRequest,
+    add_topic,
+    create_course,
+    generate_weekly_report,
+    plan_session,
+)
+
+MONDAY = date(2026, 2, 2)
+
+
+def test_weekly_report_is_served_from_cache_until_version_changes() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
+    course = create_course(CreateCourseRequest(name="Art"), courses)
+    topic = add_topic(AddTopicRequest(course_id=course.course_id, name="Color"), courses, topics)
+    version = ["1"]
+    cache = ReportCache(lambda: version[0])
+
+    def report() -> WeeklyReport:
+        return generate_weekly_report(
+            WeeklyReportRequest(week_start=MONDAY), courses, topics, sessions, cache
+        )
+
+    first = report()
+    assert report() is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    plan_session(
+        PlanSessionRequest(topic_id=topic.topic_id, scheduled_date=MONDAY, duration_minutes=30),
+        topics,
+        sessions,
+    )
+    version[0] = "2"
+    assert report().total_minutes == 30
+
+
+def test_unversioned_state_is_never_cached() -> None:
+    cache = ReportCache(lambda: None)
+    repos = (InMemoryCourseRepository(), InMemoryTopicRepository(), InMemorySessionRepository())
+
+    generate_weekly_report(WeeklyReportRequest(week_start=MONDAY), *repos, cache)
+    generate_weekly_report(WeeklyReportRequest(week_start=MONDAY), *repos, cache)
+
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cache_is_bounded_and_shared_through_file(tmp_path: Path) -> None:
+    path = tmp_path / "reports.json"
+    cache = ReportCache(lambda: "v", path, capacity=2)
+    for week in (date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 19)):
+        cache.put(WeeklyReport(week, 10, {}, {}), "v")
+
+    other = ReportCache(lambda: "v", path, capacity=2)
+    assert other.get(date(2026, 1, 5), "v") is None
+    assert other.get(date(2026, 1, 19), "v") == WeeklyReport(date(2026, 1, 19), 10, {}, {})
+    assert other.get(date(2026, 1, 19), "w") is None
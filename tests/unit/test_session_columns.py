@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.adapters import (
+    ColumnarSessionRepository,
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+    JsonCourseRepository,
+    JsonFileStore,
+    JsonSessionRepository,
+    JsonTopicRepository,
+    SessionColumns,
+)
+from src.application import (
+    AddTopicRequest,
+    ApplicationValidationError,
+    CompleteSessionRequest,
+    CompletionTotals,
+    CreateCourseRequest,
+    PlanSessionRequest,
+    RangeReportRequest,
+    add_topic,
+    complete_session,
+    create_course,
+    delete_course,
+    generate_completion_report,
+    plan_session,
+)
+
+_FEBRUARY = (date(2026, 2, 1), date(2026, 3, 1))
+
+
+@pytest.fixture(params=["python", "numpy"])
+def summing(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("src.adapters.columnar._np", None)
+    return request.param
+
+
+@pytest.fixture
+def planner():
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = ColumnarSessionRepository(InMemorySessionRepository())
+    course = create_course(CreateCourseRequest(name="Chemistry"), courses)
+    bonds = add_topic(AddTopicRequest(course.course_id, "Bonds"), courses, topics)
+    acids = add_topic(AddTopicRequest(course.course_id, "Acids"), courses, topics)
+    planned = [
+        plan_session(PlanSessionRequest(topic.topic_id, day, minutes), topics, sessions)
+        for topic, day, minutes in (
+            (bonds, date(2026, 1, 31), 10),
+            (bonds, date(2026, 2, 2), 20),
+            (acids, date(2026, 2, 28), 30),
+            (acids, date(2026, 3, 1), 40),
+        )
+    ]
+    complete_session(CompleteSessionRequest(planned[1].session_id, datetime(2026, 2, 2)), sessions)
+    return courses, topics, sessions, course, bonds, acids, planned
+
+
+def test_columns_sum_completion_per_topic(planner, summing: str) -> None:
+    _, _, sessions, _, bonds, acids, _ = planner
+
+    assert sessions.completion_by_topic(*_FEBRUARY) == {
+        bonds.topic_id: CompletionTotals(1, 1, 20, 20),
+        acids.topic_id: CompletionTotals(1, 0, 30, 0),
+    }
+    assert sessions.completion_by_topic(date(2027, 1, 1), date(2027, 2, 1)) == {}
+
+
+def test_columns_follow_writes_once_built(planner, summing: str) -> None:
+    courses, topics, sessions, course, bonds, acids, planned = planner
+    columns = sessions.columns()
+    assert len(columns) == 4
+
+    complete_session(CompleteSessionRequest(planned[2].session_id, datetime(2026, 3, 1)), sessions)
+    plan_session(PlanSessionRequest(bonds.topic_id, date(2026, 2, 10), 15), topics, sessions)
+    assert sessions.columns() is columns
+    rebuilt = SessionColumns.from_records(sessions.list_records())
+    assert sessions.completion_by_topic(*_FEBRUARY) == rebuilt.completion_by_topic(*_FEBRUARY)
+    assert sessions.completion_by_topic(*_FEBRUARY)[acids.topic_id] == CompletionTotals(
+        1, 1, 30, 30
+    )
+
+    delete_course(course.course_id, courses, topics, sessions)
+    assert len(columns) == 0
+    assert sessions.completion_by_topic(*_FEBRUARY) == {}
+
+
+def test_removing_a_row_moves_the_last_one_into_its_slot(summing: str) -> None:
+    columns = SessionColumns.from_records(
+        {
+            "session_id": f"s{index}",
+            "topic_id": "t",
+            "scheduled_date": "2026-02-02",
+            "duration_minutes": index + 1,
+            "completed": index % 2 == 0,
+            "completed_at": None,
+        }
+        for index in range(4)
+    )
+
+    columns.remove(["s1", "missing"])
+    columns.remove(["s3"])
+
+    assert list(columns.minutes) == [1, 3]
+    assert columns.completion_by_topic(*_FEBRUARY) == {"t": CompletionTotals(2, 2, 4, 4)}
+
+
+def test_completion_report_rolls_topics_up_to_courses(planner, summing: str) -> None:
+    courses, topics, sessions, course, bonds, acids, _ = planner
+
+    report = generate_completion_report(
+        RangeReportRequest(start=date(2026, 1, 1), end=date(2026, 2, 28)),
+        courses,
+        topics,
+        sessions,
+    )
+
+    assert report.total == CompletionTotals(3, 1, 60, 20)
+    assert report.by_course == {course.course_id: CompletionTotals(3, 1, 60, 20)}
+    assert report.by_topic[bonds.topic_id] == CompletionTotals(2, 1, 30, 20)
+    with pytest.raises(ApplicationValidationError):
+        generate_completion_report(
+            RangeReportRequest(start=date(2026, 2, 2), end=date(2026, 2, 1)),
+            courses,
+            topics,
+            sessions,
+        )
+
+
+def test_columns_are_rebuilt_only_when_the_store_changed_behind_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path)
+    courses, topics = JsonCourseRepository(store), JsonTopicRepository(store)
+    inner = JsonSessionRepository(store)
+    scans = []
+    list_records = inner.list_records
+    monkeypatch.setattr(
+        inner, "list_records", lambda after=None: scans.append(after) or list_records(after)
+    )
+    sessions = ColumnarSessionRepository(inner, store.version)
+    course = create_course(CreateCourseRequest(name="Chemistry"), courses)
+    topic = add_topic(AddTopicRequest(course.course_id, "Bonds"), courses, topics, store)
+
+    def plan(repository, minutes: int) -> None:
+        plan_session(
+            PlanSessionRequest(topic.topic_id, date(2026, 2, 2), minutes),
+            topics,
+            repository,
+            store,
+        )
+
+    def minutes() -> int:
+        return sessions.completion_by_topic(*_FEBRUARY)[topic.topic_id].minutes
+
+    plan(sessions, 10)
+    assert (minutes(), len(scans)) == (10, 1)
+
+    # Committed writes through the wrapper are applied without a rescan.
+    plan(sessions, 20)
+    assert (minutes(), len(scans)) == (30, 1)
+
+    # A write that bypassed the wrapper changes the version: rebuild.
+    other = JsonFileStore(path)
+    plan_session(
+        PlanSessionRequest(topic.topic_id, date(2026, 2, 3), 40),
+        JsonTopicRepository(other),
+        JsonSessionRepository(other),
+    )
+    assert (minutes(), len(scans)) == (70, 2)
+
+    # A rolled back write leaves the version as it was: rebuild.
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            plan(sessions, 50)
+            raise RuntimeError
+    assert (minutes(), len(scans)) == (70, 3)
+
+    sessions.discard()
+    assert (minutes(), len(scans)) == (70, 4)
@@ -27,18 +27,19 @@ from src.application import (
 def test_delete_course_and_remove_topic() -> None:
     courses = InMemoryCourseRepository()
     topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
 
     course = create_course(CreateCourseRequest(name="Databases"), courses)
     topic = add_topic(AddTopicRequest(course_id=course.course_id, name="Indexes"), courses, topics)
 
-    remove_topic(topic.topic_id, topics)
+    remove_topic(topic.topic_id, topics, sessions)
     assert list(topics.list_by_course(course.course_id)) == []
 
-    delete_course(course.course_id, courses)
+    delete_course(course.course_id, courses, topics, sessions)
     assert list(courses.list_all()) == []
 
     with pytest.raises(NotFoundError):
-        delete_course(course.course_id, courses)
+        delete_course(course.course_id, courses, topics, sessions)
 
 
 def test_weekly_report_totals() -> None:
@@ -83,3 +84,36 @@ def test_weekly_report_totals() -> None:
     assert report.total_minutes == 75
     assert report.minutes_by_course[course.course_id] == 75
     assert report.minutes_by_topic[topic.topic_id] == 75
+
+
+def test_weekly_report_rolls_up_only_live_courses() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
+
+    kept = create_course(CreateCourseRequest(name="Kept"), courses)
+    dropped = create_course(CreateCourseRequest(name="Dropped"), courses)
+    kept_topic = add_topic(AddTopicRequest(course_id=kept.course_id, name="A"), courses, topics)
+    dropped_topic = add_topic(AddTopicRequest(course_id=dropped.course_id, name="B"), courses, topics)
+    idle = create_course(CreateCourseRequest(name="Idle"), courses)
+    add_topic(AddTopicRequest(course_id=idle.course_id, name="C"), courses, topics)
+
+    monday = date(2026, 2, 2)
+    for topic_id, minutes in ((kept_topic.topic_id, 20), (dropped_topic.topic_id, 40)):
+        plan_session(
+            PlanSessionRequest(topic_id=topic_id, scheduled_date=monday, duration_minutes=minutes),
+            topics,
+            sessions,
+        )
+    # A course deleted before deletes cascaded left its topic and sessions behind.
+    courses.remove(dropped.course_id)
+
+    report = generate_weekly_report(
+        WeeklyReportRequest(week_start=monday),
+        courses,
+        topics,
+        sessions,
+    )
+    assert report.total_minutes == 60
+    assert report.minutes_by_course == {kept.course_id: 20}
+    assert report.minutes_by_topic == {kept_topic.topic_id: 20, dropped_topic.topic_id: 40}
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+)
+from src.application import (
+    AddTopicRequest,
+    ApplicationValidationError,
+    CreateCourseRequest,
+    NotFoundError,
+    PlanSessionRequest,
+    add_topics_bulk,
+    create_course,
+    plan_sessions_bulk,
+)
+from src.domain import CourseId, TopicId
+
+
+def test_add_topics_bulk_adds_all_topics() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    course = create_course(CreateCourseRequest(name="Math"), courses)
+
+    added = add_topics_bulk(
+        [AddTopicRequest(course_id=course.course_id, name=name) for name in ("A", " B ")],
+        courses,
+        topics,
+    )
+
+    assert [topic.name for topic in added] == ["A", "B"]
+    assert len(list(topics.list_by_course(course.course_id))) == 2
+
+
+def test_add_topics_bulk_rejects_whole_batch() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    course = create_course(CreateCourseRequest(name="Math"), courses)
+
+    with pytest.raises(NotFoundError, match="row 2"):
+        add_topics_bulk(
+            [
+                AddTopicRequest(course_id=course.course_id, name="A"),
+                AddTopicRequest(course_id=CourseId("missing"), name="B"),
+            ],
+            courses,
+            topics,
+        )
+    with pytest.raises(ApplicationValidationError, match="row 1"):
+        add_topics_bulk([AddTopicRequest(course_id=course.course_id, name=" ")], courses, topics)
+    assert list(topics.list_by_course(course.course_id)) == []
+
+
+def test_plan_sessions_bulk_validates_before_adding() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
+    course = create_course(CreateCourseRequest(name="CS"), courses)
+    [topic] = add_topics_bulk([AddTopicRequest(course_id=course.course_id, name="Graphs")], courses, topics)
+    day = date(2026, 2, 3)
+
+    planned = plan_sessions_bulk(
+        [PlanSessionRequest(topic_id=topic.topic_id, scheduled_date=day, duration_minutes=m) for m in (30, 45)],
+        topics,
+        sessions,
+    )
+    assert len(planned) == 2
+
+    with pytest.raises(NotFoundError, match="row 2"):
+        plan_sessions_bulk(
+            [
+                PlanSessionRequest(topic_id=topic.topic_id, scheduled_date=day, duration_minutes=30),
+                PlanSessionRequest(topic_id=TopicId("missing"), scheduled_date=day, duration_minutes=30),
+            ],
+            topics,
+            sessions,
+        )
+    with pytest.raises(ApplicationValidationError, match="row 1"):
+        plan_sessions_bulk(
+            [PlanSessionRequest(topic_id=topic.topic_id, scheduled_date=day, duration_minutes=0)],
+            topics,
+            sessions,
+        )
+    assert len(list(sessions.list_all())) == 2
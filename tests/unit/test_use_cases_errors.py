@@ -64,7 +64,7 @@ def test_plan_session_requires_existing_topic() -> None:
 def test_remove_topic_not_found() -> None:
     topics = InMemoryTopicRepository()
     with pytest.raises(NotFoundError):
-        remove_topic(TopicId("missing"), topics)
+        remove_topic(TopicId("missing"), topics, InMemorySessionRepository())
 
 
 def test_complete_session_not_found() -> None:
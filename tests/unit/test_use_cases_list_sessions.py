@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+)
+from src.application import (
+    AddTopicRequest,
+    ApplicationValidationError,
+    CompleteSessionRequest,
+    CreateCourseRequest,
+    ListSessionsRequest,
+    PlanSessionRequest,
+    add_topic,
+    complete_session,
+    create_course,
+    list_sessions,
+    plan_session,
+)
+
+
+def test_filters_by_course_topic_dates_and_status() -> None:
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
+    math = create_course(CreateCourseRequest(name="Math"), courses)
+    physics = create_course(CreateCourseRequest(name="Physics"), courses)
+    algebra = add_topic(AddTopicRequest(course_id=math.course_id, name="Algebra"), courses, topics)
+    optics = add_topic(AddTopicRequest(course_id=physics.course_id, name="Optics"), courses, topics)
+    planned = {}
+    for topic in (algebra, optics):
+        for day in (2, 4, 9):
+            planned[(topic.name, day)] = plan_session(
+                PlanSessionRequest(topic.topic_id, date(2026, 2, day), 30), topics, sessions
+            )
+    complete_session(
+        CompleteSessionRequest(
+            planned[("Algebra", 4)].session_id, completed_at=datetime(2026, 2, 4, 9, 0)
+        ),
+        sessions,
+    )
+
+    def listed(**filters: object) -> list[tuple[str, int]]:
+        request = ListSessionsRequest(**filters)  # type: ignore[arg-type]
+        return [
+            (topics.get(session.topic_id).name, session.scheduled_date.day)  # type: ignore[union-attr]
+            for session in list_sessions(sessions, request, topics)
+        ]
+
+    assert listed(course_id=math.course_id) == [("Algebra", 2), ("Algebra", 4), ("Algebra", 9)]
+    assert listed(course_id=math.course_id, completed=False) == [("Algebra", 2), ("Algebra", 9)]
+    assert listed(start=date(2026, 2, 4), end=date(2026, 2, 8), completed=False) == [
+        ("Optics", 4)
+    ]
+    assert listed(course_id=physics.course_id, topic_id=algebra.topic_id) == []
+    assert listed(topic_id=optics.topic_id, limit=2) == [("Optics", 2), ("Optics", 4)]
+
+
+def test_rejects_inverted_date_ranges() -> None:
+    with pytest.raises(ApplicationValidationError):
+        list_sessions(
+            InMemorySessionRepository(),
+            ListSessionsRequest(start=date(2026, 2, 9), end=date(2026, 2, 2)),
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from src.adapters import (
+    InMemoryCourseRepository,
+    InMemorySessionRepository,
+    InMemoryTopicRepository,
+)
+from src.application import (
+    AddTopicRequest,
+    ApplicationValidationError,
+    CreateCourseRequest,
+    PlanSessionRequest,
+    RangeReportRequest,
+    add_topic,
+    create_course,
+    generate_range_report,
+    generate_report_series,
+    plan_session,
+)
+
+
+@pytest.fixture
+def planner():
+    courses = InMemoryCourseRepository()
+    topics = InMemoryTopicRepository()
+    sessions = InMemorySessionRepository()
+    course = create_course(CreateCourseRequest(name="Chemistry"), courses)
+    topic = add_topic(AddTopicRequest(course_id=course.course_id, name="Bonds"), courses, topics)
+    for day, minutes in ((date(2026, 1, 31), 10), (date(2026, 2, 2), 20), (date(2026, 2, 28), 30)):
+        plan_session(
+            PlanSessionRequest(topic_id=topic.topic_id, scheduled_date=day, duration_minutes=minutes),
+            topics,
+            sessions,
+        )
+    return courses, topics, sessions, course, topic
+
+
+def test_range_report_covers_inclusive_range(planner) -> None:
+    courses, topics, sessions, course, topic = planner
+
+    report = generate_range_report(
+        RangeReportRequest(start=date(2026, 2, 2), end=date(2026, 2, 28)), courses, topics, sessions
+    )
+
+    assert report.total_minutes == 50
+    assert report.minutes_by_course == {course.course_id: 50}
+    assert report.minutes_by_topic == {topic.topic_id: 50}
+
+
+def test_month_and_year_requests(planner) -> None:
+    courses, topics, sessions, _, _ = planner
+
+    assert RangeReportRequest.for_month(2026, 12) == RangeReportRequest(
+        start=date(2026, 12, 1), end=date(2026, 12, 31)
+    )
+    february = generate_range_report(RangeReportRequest.for_month(2026, 2), courses, topics, sessions)
+    year = generate_range_report(RangeReportRequest.for_year(2026), courses, topics, sessions)
+
+    assert february.total_minutes == 50
+    assert year.total_minutes == 60
+
+
+def test_weekly_series_splits_range(planner) -> None:
+    courses, topics, sessions, _, _ = planner
+
+    series = generate_report_series(
+        RangeReportRequest(start=date(2026, 1, 26), end=date(2026, 2, 10)), courses, topics, sessions
+    )
+
+    assert [(report.start, report.end) for report in series] == [
+        (date(2026, 1, 26), date(2026, 2, 1)),
+        (date(2026, 2, 2), date(2026, 2, 8)),
+        (date(2026, 2, 9), date(2026, 2, 10)),
+    ]
+    assert [report.total_minutes for report in series] == [10, 20, 0]
+    assert series[2].minutes_by_course == {}
+
+
+def test_range_report_rejects_reversed_range(planner) -> None:
+    courses, topics, sessions, _, _ = planner
+    with pytest.raises(ApplicationValidationError):
+        generate_range_report(
+            RangeReportRequest(start=date(2026, 2, 2), end=date(2026, 2, 1)), courses, topics, sessions
+        )
+
+
+def test_range_report_rejects_the_last_representable_day(planner) -> None:
+    courses, topics, sessions, _, _ = planner
+    assert RangeReportRequest.for_month(9999, 12).end == date.max
+    with pytest.raises(ApplicationValidationError):
+        generate_range_report(RangeReportRequest.for_year(9999), courses, topics, sessions)
+    with pytest.raises(ApplicationValidationError):
+        generate_report_series(RangeReportRequest.for_month(9999, 12), courses, topics, sessions)